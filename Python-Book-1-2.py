@@ -5,48 +5,593 @@ Chapter 2: Simple Calculator with Enhanced GUI
 This production-quality application features:
   • A modern GUI for basic arithmetic operations.
   • A class-based design with robust error handling.
+  • An Expression operation that evaluates formulas such as 3*(x+2)/y, with
+    x and y taken from the two number fields. Parsed formulas are cached.
+  • Long jobs run in a worker process with a progress bar and a Cancel
+    button, so the window stays responsive:
+      - Precision (digits) switches the four operations and expressions to
+        decimal arithmetic at that many significant digits.
+      - Batch CSV… evaluates a file of num1,operator,num2 rows and writes
+        the results next to it.
   • A dynamically adjusted interface that fits the content.
   • A fixed, high-resolution application icon using 'id01t.jpg'.
-      - The icon is loaded via Pillow (PIL) and applied with iconphoto.
+      - Pillow (PIL) scales the JPEG once into the standard icon sizes and
+        stores them as PNGs in 'id01t.iconcache' next to the script.
+      - Later launches load only the sizes the window shows at the screen's
+        DPI, with Tk alone, so Pillow is only imported when the JPEG changes.
+  • A history panel beside the calculator with every result, time-stamped:
+      - Only the visible rows are drawn, so scrolling is equally smooth
+        with ten entries or a million.
+      - Entries are packed into a compact ring buffer; with --history-spill
+        the oldest ones move to a plain text log instead of being dropped
+        and can still be scrolled to and searched.
+      - Typing in its search box jumps to the newest match; Enter moves to
+        the next older one.
   • Clickable links to https://id01t.ca and the GitHub repository.
 
 Ensure that 'id01t.jpg' is in the same folder as this script.
+
+Usage:
+  python Python-Book-1-2.py            Start the calculator.
+  python Python-Book-1-2.py --timing   Also print a window startup timing report.
+  python Python-Book-1-2.py --latency-check
+                                       Run a heavy high-precision job and check
+                                       that the event loop keeps a 16 ms frame
+                                       budget (exit status 1 if it does not).
+  python Python-Book-1-2.py --history-spill history.log
+                                       Keep history that no longer fits in
+                                       memory in history.log.
   
 Official iD01t Academy example.
 """
 
+import time
+
+_STARTED = time.perf_counter()
+
+import base64
+import os
+import struct
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import webbrowser
 import sys
+from array import array
+from collections import OrderedDict, deque
+
+from academy.calculator import batch_job, compile_expression, high_precision_job, run_job
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_SOURCE = os.path.join(SCRIPT_DIR, "id01t.jpg")
+ICON_CACHE = os.path.join(SCRIPT_DIR, "id01t.iconcache")
+# Title bar, taskbar/alt-tab and large desktop sizes, largest first as iconphoto prefers.
+ICON_SIZES = (64, 48, 32, 16)
+# Icon edge lengths a window shows at 96 DPI: title bar, then taskbar/alt-tab.
+WINDOW_ICON_SIZES = (16, 32)
+
+
+def window_icon_sizes(pixels_per_inch: float) -> tuple[int, ...]:
+    """
+    Picks the cached icon sizes closest to what the window shows at this DPI, largest first.
+    """
+    scale = pixels_per_inch / 96
+    chosen = {min(ICON_SIZES, key=lambda size: abs(size - base * scale)) for base in WINDOW_ICON_SIZES}
+    return tuple(sorted(chosen, reverse=True))
+
+
+class StartupTimer:
+    """
+    Records named checkpoints from process start to the first drawn window.
+    """
+
+    def __init__(self, started: float = _STARTED) -> None:
+        self.started = started
+        self.marks: list[tuple[str, float]] = [("imports", time.perf_counter())]
+
+    def mark(self, label: str) -> None:
+        """
+        Records that the phase called label has just finished.
+        """
+        self.marks.append((label, time.perf_counter()))
+
+    def report(self) -> str:
+        """
+        Formats each phase's duration and the running total in milliseconds.
+        """
+        lines = ["Window startup timing:"]
+        previous = self.started
+        for label, stamp in self.marks:
+            lines.append(f"  {label:<14} {(stamp - previous) * 1000:8.1f} ms"
+                         f"   (total {(stamp - self.started) * 1000:8.1f} ms)")
+            previous = stamp
+        return "\n".join(lines)
+
+
+class IconCache:
+    """
+    Pre-scaled PNG copies of the application icon, kept in one small file.
+
+    File layout (little-endian):
+      header  8s magic, Q source mtime (ns), Q source size, H image count
+      table   H size, I offset, I length   (one entry per image)
+      data    the PNG images back to back
+
+    The cache is rebuilt when the source JPEG's mtime or size changes. Only
+    the rebuild needs Pillow; reading uses the table to fetch just the sizes
+    that were asked for.
+    """
+
+    MAGIC = b"ID01TIC1"
+    HEADER = struct.Struct("<8sQQH")
+    ENTRY = struct.Struct("<HII")
+
+    def __init__(self, source: str = ICON_SOURCE, path: str = ICON_CACHE,
+                 sizes: tuple[int, ...] = ICON_SIZES) -> None:
+        self.source = source
+        self.path = path
+        self.sizes = sizes
+        self.rebuilt = False
+
+    def load(self, sizes: tuple[int, ...] | None = None) -> dict[int, bytes]:
+        """
+        Returns PNG data for the requested sizes, rebuilding the cache if stale.
+
+        Args:
+            sizes (tuple[int, ...] | None): Icon sizes to load; defaults to all cached sizes.
+
+        Returns:
+            dict[int, bytes]: PNG bytes keyed by edge length in pixels.
+
+        Raises:
+            OSError: If the source image is missing.
+            ImportError: If the cache must be rebuilt and Pillow is not installed.
+        """
+        wanted = self.sizes if sizes is None else sizes
+        stat = os.stat(self.source)
+        images = self._read(stat, wanted)
+        if images is None:
+            images = self._build()
+            self._write(stat, images)
+            self.rebuilt = True
+            images = {size: images[size] for size in wanted if size in images}
+        return images
+
+    def _read(self, stat: os.stat_result, wanted: tuple[int, ...]) -> dict[int, bytes] | None:
+        """
+        Reads the wanted sizes from the cache file, or returns None if it is missing or stale.
+        """
+        try:
+            with open(self.path, "rb") as handle:
+                header = handle.read(self.HEADER.size)
+                if len(header) != self.HEADER.size:
+                    return None
+                magic, mtime_ns, source_size, count = self.HEADER.unpack(header)
+                if magic != self.MAGIC or mtime_ns != stat.st_mtime_ns or source_size != stat.st_size:
+                    return None
+                table = handle.read(self.ENTRY.size * count)
+                entries = {size: (offset, length) for size, offset, length in self.ENTRY.iter_unpack(table)}
+                if any(size not in entries for size in wanted):
+                    return None
+                images = {}
+                for size in wanted:
+                    offset, length = entries[size]
+                    handle.seek(offset)
+                    images[size] = handle.read(length)
+                    if len(images[size]) != length:
+                        return None
+                return images
+        except (OSError, struct.error):
+            return None
+
+    def _build(self) -> dict[int, bytes]:
+        """
+        Decodes the source JPEG once at reduced scale and encodes every size as PNG.
+        """
+        import io
+        from PIL import Image
+
+        with Image.open(self.source) as image:
+            # For JPEGs, draft() picks a DCT scale (1/2, 1/4, 1/8) that still
+            # covers the largest icon, so the full-resolution image is never decoded.
+            largest = max(self.sizes)
+            image.draft("RGB", (largest, largest))
+            image = image.convert("RGBA")
+            image.thumbnail((largest, largest), Image.LANCZOS)
+            images = {}
+            for size in self.sizes:
+                scaled = image.copy()
+                scaled.thumbnail((size, size), Image.LANCZOS)
+                buffer = io.BytesIO()
+                scaled.save(buffer, format="PNG", optimize=True)
+                images[size] = buffer.getvalue()
+        return images
+
+    def _write(self, stat: os.stat_result, images: dict[int, bytes]) -> None:
+        """
+        Atomically replaces the cache file. A read-only install simply skips caching.
+        """
+        offset = self.HEADER.size + self.ENTRY.size * len(images)
+        table = []
+        for size, data in images.items():
+            table.append(self.ENTRY.pack(size, offset, len(data)))
+            offset += len(data)
+        payload = b"".join([self.HEADER.pack(self.MAGIC, stat.st_mtime_ns, stat.st_size, len(images)),
+                            *table, *images.values()])
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+class BackgroundJob:
+    """
+    Runs one calculator job in a worker process and hands its messages to
+    the Tk thread.
+
+    The Tk thread never blocks on the worker: poll() is rescheduled with
+    after() every POLL_MS milliseconds, drains whatever progress, result or
+    error messages have arrived, and calls the matching callback. cancel()
+    asks the job to stop and terminates the worker if it has not stopped
+    within CANCEL_GRACE_MS (e.g. while inside one long decimal operation).
+    """
+
+    POLL_MS = 15
+    CANCEL_GRACE_MS = 300
+
+    def __init__(self, master: tk.Misc, job, args: tuple, on_progress, on_done, on_error) -> None:
+        """
+        Args:
+            master (tk.Misc): Widget whose after() schedules the polling.
+            job: Function importable by module name (see academy.calculator),
+                called as job(*args, report, cancelled).
+            args (tuple): Picklable job arguments.
+            on_progress: Called with (done, total); total is 0 while unknown.
+            on_done: Called with the job's result, or with None if it was cancelled.
+            on_error: Called with an error message.
+        """
+        import multiprocessing
+        self.master = master
+        self.on_progress, self.on_done, self.on_error = on_progress, on_done, on_error
+        self._messages = multiprocessing.Queue()
+        self._cancel = multiprocessing.Event()
+        self._process = multiprocessing.Process(target=run_job, args=(job, args, self._messages, self._cancel),
+                                                daemon=True)
+        self.finished = False
+
+    def start(self) -> None:
+        self._process.start()
+        self.master.after(self.POLL_MS, self.poll)
+
+    def poll(self) -> None:
+        import queue
+        while not self.finished:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == "progress":
+                self.on_progress(message[1], message[2])
+            else:
+                self._finish()
+                if kind == "error":
+                    self.on_error(message[1])
+                else:
+                    self.on_done(message[1])
+        if self.finished:
+            return
+        if not self._process.is_alive() and self._messages.empty():
+            self._finish()
+            if self._cancel.is_set():
+                self.on_done(None)
+            else:
+                self.on_error(f"The worker stopped unexpectedly (exit code {self._process.exitcode}).")
+            return
+        self.master.after(self.POLL_MS, self.poll)
+
+    def cancel(self) -> None:
+        """Asks the job to stop; terminates the worker if it does not within the grace period."""
+        self._cancel.set()
+        self.master.after(self.CANCEL_GRACE_MS, self.terminate)
+
+    def terminate(self) -> None:
+        """Stops the worker at once."""
+        if self._process.is_alive():
+            self._process.terminate()
+
+    def _finish(self) -> None:
+        self.finished = True
+        self._process.join(timeout=0)
+
+
+class CalculationHistory:
+    """
+    Append-only calculation history with random access by position.
+
+    Entries are packed CHUNK at a time: a full chunk becomes one UTF-8 blob
+    of newline-separated entries plus an ``array('I')`` of start offsets, so
+    an entry costs its text plus 4 bytes instead of a Python string object.
+    The chunks form a ring of `capacity` entries. When it is full the oldest
+    chunk is appended to the spill file (a plain text log, one calculation
+    per line) and stays readable from there, or is dropped when there is
+    no spill file. Chunks read back from disk are kept in a small cache.
+
+    find() case-folds a whole chunk at a time (``str.casefold``, the same
+    folding it applies to unpacked entries) and searches it with one
+    ``str.rfind``, so searching hundreds of thousands of entries takes
+    milliseconds.
+    """
+
+    CHUNK = 4096
+    CACHED_SPILL_CHUNKS = 4
+
+    def __init__(self, capacity: int = 262_144, spill_path: str | None = None) -> None:
+        """
+        Args:
+            capacity (int): Entries kept in memory (rounded up to whole chunks).
+            spill_path (str | None): Text file that receives entries pushed out
+                of memory; new entries are appended after any existing content.
+        """
+        self._max_chunks = max(1, -(-capacity // self.CHUNK))
+        self._chunks: deque[tuple[bytes, array]] = deque()
+        self._current: list[str] = []
+        self._dropped = 0
+        self._spill = open(spill_path, "a+b") if spill_path else None
+        self._spill_offsets = array("Q", [self._spill.seek(0, os.SEEK_END)] if self._spill else [])
+        self._spill_cache: OrderedDict[int, tuple[bytes, array]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return (max(len(self._spill_offsets) - 1, 0) + len(self._chunks)) * self.CHUNK + len(self._current)
+
+    @property
+    def dropped(self) -> int:
+        """Number of old entries discarded because there is no spill file."""
+        return self._dropped * self.CHUNK
+
+    def append(self, text: str) -> None:
+        """Adds an entry (newlines are replaced by spaces)."""
+        self._current.append(text.replace("\n", " "))
+        if len(self._current) == self.CHUNK:
+            self._chunks.append(self._pack(self._current))
+            self._current = []
+            if len(self._chunks) > self._max_chunks:
+                self._evict()
+
+    def _pack(self, entries: list[str]) -> tuple[bytes, array]:
+        parts = [entry.encode() for entry in entries]
+        offsets = array("I", [0])
+        position = 0
+        for part in parts:
+            position += len(part) + 1
+            offsets.append(position)
+        return b"\n".join(parts) + b"\n", offsets
+
+    def _evict(self) -> None:
+        blob, _ = self._chunks.popleft()
+        if self._spill is None:
+            self._dropped += 1
+            return
+        self._spill.seek(0, os.SEEK_END)
+        self._spill.write(blob)
+        self._spill.flush()
+        self._spill_offsets.append(self._spill_offsets[-1] + len(blob))
+
+    def _chunk(self, number: int) -> tuple[bytes, array]:
+        """Returns packed chunk `number`, counting from the oldest one still readable."""
+        spilled = max(len(self._spill_offsets) - 1, 0)
+        if number >= spilled:
+            return self._chunks[number - spilled]
+        cached = self._spill_cache.get(number)
+        if cached is None:
+            self._spill.seek(self._spill_offsets[number])
+            blob = self._spill.read(self._spill_offsets[number + 1] - self._spill_offsets[number])
+            offsets = array("I", [0])
+            position = blob.find(b"\n")
+            while position >= 0:
+                offsets.append(position + 1)
+                position = blob.find(b"\n", position + 1)
+            cached = self._spill_cache[number] = (blob, offsets)
+            if len(self._spill_cache) > self.CACHED_SPILL_CHUNKS:
+                self._spill_cache.popitem(last=False)
+        else:
+            self._spill_cache.move_to_end(number)
+        return cached
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        number, row = divmod(index, self.CHUNK)
+        packed = len(self) - len(self._current)
+        if index >= packed:
+            return self._current[index - packed]
+        blob, offsets = self._chunk(number)
+        return blob[offsets[row]:offsets[row + 1] - 1].decode()
+
+    def find(self, query: str, start: int | None = None) -> int | None:
+        """
+        Finds the newest entry at or before `start` containing `query`.
+
+        Args:
+            query (str): Text to look for, ignoring case.
+            start (int | None): Position to search back from (default: newest).
+
+        Returns:
+            int | None: The position of the match, or None.
+        """
+        if not query:
+            return None
+        start = len(self) - 1 if start is None else min(start, len(self) - 1)
+        needle = query.replace("\n", " ").casefold()
+        packed = len(self) - len(self._current)
+        for index in range(start, packed - 1, -1):
+            if needle in self._current[index - packed].casefold():
+                return index
+        number, row = divmod(min(start, packed - 1), self.CHUNK)
+        while number >= 0 and start >= 0:
+            blob, offsets = self._chunk(number)
+            # Folding can change lengths ("ß" becomes "ss"), so the match is
+            # located by counting the entry separators before it.
+            text = blob[:offsets[row + 1] - 1].decode().casefold()
+            position = text.rfind(needle)
+            if position >= 0:
+                return number * self.CHUNK + text.count("\n", 0, position)
+            number, row = number - 1, self.CHUNK - 1
+        return None
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+
+
+class HistoryPanel(ttk.Frame):
+    """
+    Scrollable, searchable view of a CalculationHistory.
+
+    The canvas holds one text item per visible row and nothing else; scrolling
+    only changes which entries those items show, so drawing costs the same
+    for ten entries or a million. The view follows new entries while it is
+    scrolled to the bottom. Typing in the search box jumps to the newest
+    matching entry; Enter moves to the next older match.
+    """
+
+    ROW_HEIGHT = 18
+    FONT = ("Courier", 10)
+
+    def __init__(self, master: tk.Misc, history: CalculationHistory, rows: int = 14, width: int = 340) -> None:
+        super().__init__(master)
+        self.history = history
+        self.top = 0
+        self.match: int | None = None
+        self._items: list[int] = []
+        ttk.Label(self, text="History", font=("Helvetica", 12, "bold")).grid(row=0, column=0, sticky="W")
+        self.search_var = tk.StringVar()
+        search = ttk.Entry(self, textvariable=self.search_var, width=24)
+        search.grid(row=0, column=0, columnspan=2, sticky="E")
+        search.bind("<Return>", lambda event: self.search(older=True))
+        self.search_var.trace_add("write", lambda *args: self.search())
+        self.canvas = tk.Canvas(self, width=width, height=rows * self.ROW_HEIGHT, background="white",
+                                highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky="NSEW", pady=(5, 0))
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=1, column=1, sticky="NS", pady=(5, 0))
+        self.status = ttk.Label(self, text="0 calculations")
+        self.status.grid(row=2, column=0, columnspan=2, sticky="W")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+        self._highlight = self.canvas.create_rectangle(0, 0, 0, 0, fill="#fff2a8", outline="")
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self._wheel)
+
+    @property
+    def visible_rows(self) -> int:
+        return max(1, self.canvas.winfo_height() // self.ROW_HEIGHT)
+
+    def add(self, text: str) -> None:
+        """Appends an entry, keeping the newest one in view if the view was at the bottom."""
+        following = self.top + self.visible_rows >= len(self.history)
+        self.history.append(text)
+        if following:
+            self.top = max(0, len(self.history) - self.visible_rows)
+        self.redraw()
+
+    def redraw(self) -> None:
+        """Shows the entries from self.top on, reusing one canvas item per row."""
+        rows, total = self.visible_rows, len(self.history)
+        self.top = max(0, min(self.top, total - rows))
+        while len(self._items) < rows:
+            self._items.append(self.canvas.create_text(4, len(self._items) * self.ROW_HEIGHT + 2,
+                                                        anchor="nw", font=self.FONT))
+        for row, item in enumerate(self._items):
+            index = self.top + row
+            self.canvas.itemconfigure(item, text=self.history[index] if row < rows and index < total else "")
+        if self.match is not None and self.top <= self.match < self.top + rows:
+            y = (self.match - self.top) * self.ROW_HEIGHT
+            self.canvas.coords(self._highlight, 0, y, self.canvas.winfo_width(), y + self.ROW_HEIGHT)
+        else:
+            self.canvas.coords(self._highlight, 0, 0, 0, 0)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        if self.match is None:
+            self.status.config(text=f"{total:,} calculations")
+
+    def yview(self, *args: str) -> None:
+        """Scrollbar command: "moveto FRACTION" or "scroll N units|pages"."""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.history))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.redraw()
+
+    def _wheel(self, event: tk.Event) -> None:
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.top -= 3
+        else:
+            self.top += 3
+        self.redraw()
+
+    def search(self, older: bool = False) -> None:
+        """Jumps to the newest match, or with older=True to the match before the current one."""
+        query = self.search_var.get().strip()
+        start = self.match - 1 if older and self.match is not None else None
+        self.match = self.history.find(query, start) if query else None
+        if self.match is not None:
+            if not self.top <= self.match < self.top + self.visible_rows:
+                self.top = self.match - self.visible_rows // 2
+            self.status.config(text=f"Match at #{self.match + 1:,} of {len(self.history):,}")
+        elif query:
+            self.status.config(text="No match")
+        self.redraw()
 
-# Import Pillow modules to handle JPEG images
-from PIL import Image, ImageTk
 
 class SimpleCalculatorApp:
-    def __init__(self, master: tk.Tk) -> None:
+    def __init__(self, master: tk.Tk, timer: StartupTimer | None = None,
+                 history_spill: str | None = None) -> None:
         """
         Initialize the application with the main window.
         
         Args:
             master (tk.Tk): The root window instance.
+            timer (StartupTimer | None): Receives a checkpoint after each startup phase.
+            history_spill (str | None): Text file that keeps history entries pushed
+                out of memory (see CalculationHistory).
         """
         self.master = master
         self.master.title("Simple Calculator - iD01t Academy")
+        self.job: BackgroundJob | None = None
+        self.history = CalculationHistory(spill_path=history_spill)
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
         self.set_app_icon()
+        if timer:
+            timer.mark("icon cached" if self.icon_cache.rebuilt else "icon")
         self.create_widgets()
+        if timer:
+            timer.mark("widgets")
     
     def set_app_icon(self) -> None:
         """
         Sets a fixed, high-resolution application icon on the title bar and taskbar.
-        The icon is loaded from 'id01t.jpg' using Pillow and stored as an instance variable
-        to prevent garbage collection.
+        Only the sizes the window shows at the screen's DPI are read from IconCache;
+        they are stored as instance variables to prevent garbage collection.
         """
+        self.icon_cache = IconCache()
         try:
-            # Open the JPEG image and convert it to a PhotoImage via Pillow.
-            image = Image.open("id01t.jpg")
-            self.icon = ImageTk.PhotoImage(image)
-            self.master.iconphoto(True, self.icon)
+            images = self.icon_cache.load(window_icon_sizes(self.master.winfo_fpixels("1i")))
+            # Tk 8.6 decodes PNG natively; base64 text works on every Tk build.
+            self.icons = [tk.PhotoImage(master=self.master, format="png",
+                                        data=base64.b64encode(images[size]).decode("ascii"))
+                          for size in sorted(images, reverse=True)]
+            self.icon = self.icons[0]
+            self.master.iconphoto(True, *self.icons)
         except Exception as e:
             print(f"Warning: App icon not loaded. {e}")
     
@@ -80,22 +625,46 @@ class SimpleCalculatorApp:
         ttk.Label(mainframe, text="Select operation:", font=("Helvetica", 12)) \
             .grid(row=3, column=0, sticky="W", pady=5)
         self.operation_var = tk.StringVar(value="Addition")
-        operations = ["Addition", "Subtraction", "Multiplication", "Division"]
+        operations = ["Addition", "Subtraction", "Multiplication", "Division", "Expression"]
         self.operation_menu = ttk.OptionMenu(mainframe, self.operation_var, operations[0], *operations)
         self.operation_menu.config(width=20)
         self.operation_menu.grid(row=3, column=1, sticky="E", pady=5)
         
-        # Button to trigger the calculation.
-        calc_btn = ttk.Button(mainframe, text="Calculate", command=self.calculate)
-        calc_btn.grid(row=4, column=0, columnspan=2, pady=20)
+        # Formula used by the Expression operation (x and y are the numbers above).
+        ttk.Label(mainframe, text="Expression (x, y):", font=("Helvetica", 12)) \
+            .grid(row=4, column=0, sticky="W", pady=5)
+        self.expression_entry = ttk.Entry(mainframe, width=25, font=("Helvetica", 12))
+        self.expression_entry.insert(0, "3*(x+2)/y")
+        self.expression_entry.grid(row=4, column=1, sticky="E", pady=5)
+        
+        # Digits for decimal arithmetic; blank keeps ordinary floats.
+        ttk.Label(mainframe, text="Precision (digits):", font=("Helvetica", 12)) \
+            .grid(row=5, column=0, sticky="W", pady=5)
+        self.precision_entry = ttk.Entry(mainframe, width=25, font=("Helvetica", 12))
+        self.precision_entry.grid(row=5, column=1, sticky="E", pady=5)
+        
+        # Buttons to trigger a calculation, start a batch file and cancel a running job.
+        button_frame = ttk.Frame(mainframe)
+        button_frame.grid(row=6, column=0, columnspan=2, pady=20)
+        self.calc_btn = ttk.Button(button_frame, text="Calculate", command=self.calculate)
+        self.calc_btn.pack(side="left", padx=5)
+        self.batch_btn = ttk.Button(button_frame, text="Batch CSV…", command=self.run_batch)
+        self.batch_btn.pack(side="left", padx=5)
+        self.cancel_btn = ttk.Button(button_frame, text="Cancel", command=self.cancel_job, state="disabled")
+        self.cancel_btn.pack(side="left", padx=5)
         
         # Label to display the calculation result.
-        self.result_label = ttk.Label(mainframe, text="Result: ", font=("Helvetica", 14, "bold"))
-        self.result_label.grid(row=5, column=0, columnspan=2, pady=10)
+        self.result_label = ttk.Label(mainframe, text="Result: ", font=("Helvetica", 14, "bold"), wraplength=420)
+        self.result_label.grid(row=7, column=0, columnspan=2, pady=10)
+        
+        # Progress of background jobs; hidden while idle.
+        self.progress = ttk.Progressbar(mainframe, length=300, maximum=100)
+        self.progress.grid(row=8, column=0, columnspan=2, pady=(0, 10))
+        self.progress.grid_remove()
         
         # Frame for clickable external links.
         link_frame = ttk.Frame(mainframe)
-        link_frame.grid(row=6, column=0, columnspan=2, pady=(30, 0))
+        link_frame.grid(row=9, column=0, columnspan=2, pady=(30, 0))
         link_style = {"foreground": "blue", "cursor": "hand2", "font": ("Helvetica", 10, "underline")}
         
         # Clickable link for iD01t.ca.
@@ -107,12 +676,27 @@ class SimpleCalculatorApp:
         link_github = tk.Label(link_frame, text="GitHub Repository", **link_style)
         link_github.pack(side="left", padx=10)
         link_github.bind("<Button-1>", lambda e: self.open_url("https://github.com/iD01t-Softwares/iD01t-Academy"))
+        
+        # Searchable tape of every result, beside the calculator.
+        self.history_panel = HistoryPanel(mainframe, self.history)
+        self.history_panel.grid(row=0, column=2, rowspan=10, sticky="NS", padx=(20, 0))
     
     def calculate(self) -> None:
         """
         Retrieves user inputs, performs the selected arithmetic operation, 
         and updates the result label with the computed output.
         """
+        operation = self.operation_var.get()
+        precision = self.precision_entry.get().strip()
+        if precision:
+            if not precision.isdigit() or not 0 < int(precision) <= 100_000_000:
+                messagebox.showerror("Input Error", "Precision must be a whole number of digits up to 100,000,000.")
+                return
+            # The worker parses the text itself: floats would round or overflow.
+            self.start_job(high_precision_job, (self.num1_entry.get().strip(), operation,
+                                                self.num2_entry.get().strip(),
+                                                self.expression_entry.get().strip(), int(precision)))
+            return
         try:
             # Convert the input strings to floats.
             num1 = float(self.num1_entry.get())
@@ -122,8 +706,19 @@ class SimpleCalculatorApp:
             return
         
         # Determine the operation and compute the result.
-        operation = self.operation_var.get()
-        if operation == "Addition":
+        if operation == "Expression":
+            text = self.expression_entry.get().strip()
+            try:
+                result = compile_expression(text)(x=num1, y=num2)
+            except ValueError as e:
+                messagebox.showerror("Expression Error", str(e))
+                return
+            except ZeroDivisionError:
+                messagebox.showerror("Math Error", "Division by zero is not allowed!")
+                return
+            self.show_result(f"{text} = {result}")
+            return
+        elif operation == "Addition":
             result = num1 + num2
             op_symbol = "+"
         elif operation == "Subtraction":
@@ -143,7 +738,83 @@ class SimpleCalculatorApp:
             return
         
         # Update the result label with the calculated output.
-        self.result_label.config(text=f"Result: {num1} {op_symbol} {num2} = {result}")
+        self.show_result(f"{num1} {op_symbol} {num2} = {result}")
+    
+    def show_result(self, text: str) -> None:
+        """Shows a result and appends it, time-stamped, to the history."""
+        self.result_label.config(text=f"Result: {text}")
+        self.history_panel.add(f"{time.strftime('%Y-%m-%d %H:%M:%S')}  {text}")
+    
+    def run_batch(self) -> None:
+        """
+        Asks for a CSV of num1,operator,num2 rows and evaluates it in the
+        background into NAME.results.csv beside it.
+        """
+        path = filedialog.askopenfilename(parent=self.master, title="Batch CSV",
+                                          filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if path:
+            self.start_job(batch_job, (path, os.path.splitext(path)[0] + ".results.csv"))
+    
+    def start_job(self, job, args: tuple) -> None:
+        """
+        Runs a job in a worker process while the window stays responsive.
+        
+        Args:
+            job: Module-level job function (see high_precision_job and batch_job).
+            args (tuple): The job's arguments.
+        """
+        if self.job is not None and not self.job.finished:
+            messagebox.showinfo("Busy", "A calculation is already running.")
+            return
+        self.calc_btn.config(state="disabled")
+        self.batch_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.result_label.config(text="Result: working…")
+        self.progress.grid()
+        self.job = BackgroundJob(self.master, job, args, self.show_progress, self.job_done, self.job_failed)
+        self.job.start()
+    
+    def show_progress(self, done: int, total: int) -> None:
+        """Updates the progress bar; an unknown total shows a moving bar instead."""
+        if total:
+            self.progress.stop()
+            self.progress.config(mode="determinate", value=100 * done / total)
+        elif str(self.progress.cget("mode")) != "indeterminate":
+            self.progress.config(mode="indeterminate")
+            self.progress.start(15)
+    
+    def cancel_job(self) -> None:
+        if self.job is not None and not self.job.finished:
+            self.cancel_btn.config(state="disabled")
+            self.result_label.config(text="Result: cancelling…")
+            self.job.cancel()
+    
+    def job_done(self, result: str | None) -> None:
+        self._reset_job_controls()
+        if result is None:
+            self.result_label.config(text="Result: cancelled")
+        else:
+            self.show_result(result)
+    
+    def job_failed(self, message: str) -> None:
+        self._reset_job_controls()
+        self.result_label.config(text="Result: ")
+        messagebox.showerror("Calculation Error", message)
+    
+    def _reset_job_controls(self) -> None:
+        self.progress.stop()
+        self.progress.config(mode="determinate", value=0)
+        self.progress.grid_remove()
+        self.calc_btn.config(state="normal")
+        self.batch_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+    
+    def close(self) -> None:
+        """Stops any running job and closes the window."""
+        if self.job is not None and not self.job.finished:
+            self.job.terminate()
+        self.history.close()
+        self.master.destroy()
     
     @staticmethod
     def open_url(url: str) -> None:
@@ -155,19 +826,90 @@ class SimpleCalculatorApp:
         """
         webbrowser.open(url)
 
+def check_event_loop_latency(app: SimpleCalculatorApp, budget_ms: float = 16.0, digits: int = 18_000_000,
+                             done=None) -> None:
+    """
+    Measures how late Tk timer callbacks run while a heavy job is in progress.
+
+    Starts a multiplication of two numbers with `digits` digits in the
+    background (several seconds of work in one C call) and, until it ends,
+    schedules a tick every 5 ms, recording the time between ticks. Prints the
+    median, 99th percentile and worst gap.
+
+    Args:
+        app (SimpleCalculatorApp): A calculator with a live window.
+        budget_ms (float): Longest acceptable gap between frames.
+        digits (int): Size of the operands; larger means a longer job.
+        done: Called with True when the worst gap is within the budget.
+    """
+    number = "0." + "142857" * (digits // 6)
+    app.start_job(high_precision_job, (number, "Multiplication", number, "", 2 * digits))
+    gaps: list[float] = []
+    last = time.perf_counter()
+
+    def tick() -> None:
+        nonlocal last
+        now = time.perf_counter()
+        gaps.append((now - last) * 1000)
+        last = now
+        if app.job is not None and not app.job.finished:
+            app.master.after(5, tick)
+            return
+        gaps.sort()
+        worst = gaps[-1]
+        print(f"Event loop during a {digits:,}-digit multiplication: {len(gaps)} ticks, "
+              f"median {gaps[len(gaps) // 2]:.1f} ms, p99 {gaps[int(len(gaps) * 0.99)]:.1f} ms, "
+              f"worst {worst:.1f} ms (budget {budget_ms:.0f} ms).")
+        if done:
+            done(worst <= budget_ms)
+
+    app.master.after(5, tick)
+
+
 def main() -> None:
     """
     Main entry point for the application. Initializes the root window,
     adjusts its size to fit the content, and starts the event loop.
+    With --timing, prints how long each phase took once the window is first drawn;
+    with --latency-check, runs check_event_loop_latency() and exits;
+    with --history-spill PATH, history pushed out of memory is kept in PATH.
     """
+    timer = StartupTimer() if "--timing" in sys.argv[1:] else None
+    spill = None
+    if "--history-spill" in sys.argv[1:-1]:
+        spill = sys.argv[sys.argv.index("--history-spill") + 1]
     root = tk.Tk()
-    app = SimpleCalculatorApp(root)
+    if timer:
+        timer.mark("tk init")
+    app = SimpleCalculatorApp(root, timer, spill)
+    if "--latency-check" in sys.argv[1:]:
+        passed = []
+
+        def finish(ok: bool) -> None:
+            passed.append(ok)
+            root.destroy()
+
+        root.after(200, check_event_loop_latency, app, 16.0, 18_000_000, finish)
+        root.mainloop()
+        sys.exit(0 if passed and passed[0] else 1)
     
     # Update layout and retrieve the required size based on the content.
     root.update_idletasks()
     required_width = root.winfo_reqwidth()
     required_height = root.winfo_reqheight()
     root.geometry(f"{required_width}x{required_height}")
+    if timer:
+        timer.mark("layout")
+
+        def first_draw(event: tk.Event) -> None:
+            if event.widget is root:
+                root.unbind("<Map>")
+                # Wait for pending redraws so the window has actually been painted.
+                root.update_idletasks()
+                timer.mark("first window")
+                print(timer.report())
+
+        root.bind("<Map>", first_draw)
     
     root.mainloop()
 
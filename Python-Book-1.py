@@ -18,9 +18,118 @@ Usage:
   Run the script using Python:
       python id01t_academy_projects_cli.py
   Then, follow the on-screen instructions to select and run a project example.
+
+  Optional flags:
+      --contacts-db PATH   Keep Chapter 6 contacts in an on-disk store at PATH
+                           instead of in memory.
+      --compact-contacts   Keep in-memory Chapter 6 contacts in a compact table
+                           (name arena plus packed phone numbers) instead of a
+                           dict; --bench-contact-memory [N] compares the two.
+      --bench-contact-search [N]
+                           Time contact name searches over N synthetic
+                           contacts (default 1,000,000) and exit.
+      --import-contacts FILE, --export-contacts FILE
+                           Stream contacts from a CSV or vCard file into the
+                           --contacts-db store, or from the store to a file,
+                           and exit. The format follows the extension (.vcf
+                           for vCard) unless --contacts-format is given.
+      --todo-db PATH       Keep Chapter 4 tasks in a write-ahead log with
+                           snapshots at PATH instead of in memory.
+      --session FILE       Keep each chapter's state when it is left: the
+                           to-do list, the contacts and a Guess the Number
+                           game in progress (leave it with 'q') are saved in
+                           FILE and restored on the next visit, also in
+                           later runs. Only the chapter being entered is
+                           read from FILE.
+      --calc-batch CSV     Evaluate a CSV of num1,operator,num2 rows with the
+                           vectorized calculator and exit ('-' for stdin).
+                           Results go to --calc-output (default stdout).
+      --bench-expressions  Compare cached and uncached expression evaluation
+                           throughput and exit.
+      --simulate-guess STRATEGY
+                           Play --games headless Guess the Number games with a
+                           binary, random or biased strategy over --workers
+                           processes (seeded by --seed) and print the
+                           attempt-count distribution.
+      --rps-tournament     Play a Rock, Paper, Scissors round-robin between the
+                           --bots (default: all) for --rounds rounds per pairing
+                           and print the leaderboard.
+      --grade PATH [PATH ...]
+                           Auto-grade learner versions of the chapter chosen
+                           with --grade-chapter (files, or folders of .py
+                           files). Each submission runs once per scenario in
+                           a separate, resource-limited Python process with
+                           scripted input, over --workers slots, and its
+                           output is compared with the reference chapter.
+                           --time-limit and --memory-limit bound each run;
+                           grades are cached by file hash in --grade-cache
+                           and --grade-report saves them as CSV.
+      --script FILE        Drive the menu headlessly with one reply per line
+                           from FILE ('-' for stdin); output is buffered.
+      --record FILE        Save the session (replies, seed, output digest) as
+                           a JSON transcript.
+      --replay FILE        Replay a recorded transcript and check its output.
+      --seed N             Seed for `random` in menu sessions and simulations.
+      --check-startup      Time cold starts of the text menu and fail when the
+                           median exceeds --startup-budget-ms (default 50 ms).
+      --serve [HOST:]PORT  Host the menu for a whole classroom: every TCP
+                           connection (telnet, nc) gets its own session with
+                           its own tasks, contacts and games. Sessions idle for
+                           --idle-timeout seconds are closed; at most
+                           --max-sessions run at once. Standalone scripts are
+                           not offered over the network.
+      --load-test [HOST:]PORT
+                           Connect --sessions simulated learners to a running
+                           --serve process, play --session-rounds rounds of a
+                           fixed scenario each and report replies/s and latency.
+      --metrics FILE       Time every step of a menu or --serve session, split
+                           into input wait, compute and render per chapter,
+                           count operations (todo.add, contacts.search, ...)
+                           and save latency histograms to FILE as JSON or, with
+                           --metrics-format prometheus, Prometheus text.
+      --profile            Run under cProfile and print the hottest code paths
+                           to stderr when the program ends.
+      --bench              Run the benchmark suite (chapter cores, script
+                           start-up, Tk calculator construction) and print the
+                           timings; --bench-save FILE stores them as a JSON
+                           baseline. --bench-only and --bench-scale pick and
+                           size the benchmarks.
+      --bench-compare BASELINE [RESULTS]
+                           Compare RESULTS (or a fresh run) with BASELINE and
+                           fail if any benchmark is more than
+                           --bench-threshold (default 10%) slower.
+
+  The standalone example scripts in this folder (Python-Book-1-1.py, ...) are
+  listed after Exit and are only imported when selected. Supporting engines
+  live in the academy package next to this script.
 """
 
-def chapter1_hello_world() -> None:
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+from collections.abc import Coroutine, MutableMapping
+from typing import TYPE_CHECKING
+
+from academy.console import (Console, LazyRows, RecordingConsole, ScriptedConsole, load_transcript, page_through,
+                             run_sync)
+from academy.registry import ChapterRegistry
+
+if TYPE_CHECKING:
+    from academy.guess import GuessGame
+    from academy.todo import TaskScheduler
+
+# Menu entries for the chapters below, plus the standalone scripts discovered
+# at startup. Engines used by a chapter are imported inside the chapter, so
+# they load only when it is selected.
+CHAPTERS = ChapterRegistry()
+EXIT_KEY = '7'
+
+
+@CHAPTERS.chapter("1", "Chapter 1: Hello, World and Basic I/O")
+async def chapter1_hello_world(console: Console) -> None:
     """
     Chapter 1: Hello, World and Basic I/O
     ---------------------------------------
@@ -32,19 +141,21 @@ def chapter1_hello_world() -> None:
       2. Prompt the user for their name.
       3. Print a personalized greeting.
     """
-    print("\n--- Chapter 1: Hello, World and Basic I/O ---")
-    print("Hello, World!")
-    name: str = input("What's your name? ")
-    print(f"Hello, {name}!")
+    console.print("\n--- Chapter 1: Hello, World and Basic I/O ---")
+    console.print("Hello, World!")
+    name: str = await console.input("What's your name? ")
+    console.print(f"Hello, {name}!")
 
 
-def chapter2_simple_calculator() -> None:
+@CHAPTERS.chapter("2", "Chapter 2: Simple Calculator")
+async def chapter2_simple_calculator(console: Console) -> None:
     """
     Chapter 2: Simple Calculator
     ----------------------------
     This function prompts the user to enter two numbers and choose an arithmetic
     operation (Addition, Subtraction, Multiplication, or Division). It then performs
-    the selected calculation and displays the result.
+    the selected calculation and displays the result. The Expression operation
+    evaluates a formula such as 3*(x+2)/y with x and y bound to the two numbers.
     
     Steps:
       1. Prompt for two numeric inputs.
@@ -52,45 +163,50 @@ def chapter2_simple_calculator() -> None:
       3. Perform the operation with proper error checking (including division by zero).
       4. Print the result.
     """
-    print("\n--- Chapter 2: Simple Calculator ---")
-    print("Welcome to the Simple Calculator!")
+    from academy.calculator import CALCULATOR_OPERATIONS, calculate, compile_expression
+    console.print("\n--- Chapter 2: Simple Calculator ---")
+    console.print("Welcome to the Simple Calculator!")
     try:
-        num1: float = float(input("Enter the first number: "))
-        num2: float = float(input("Enter the second number: "))
+        num1: float = float(await console.input("Enter the first number: "))
+        num2: float = float(await console.input("Enter the second number: "))
     except ValueError:
-        print("Invalid input! Please enter numeric values.")
+        console.print("Invalid input! Please enter numeric values.")
         return
 
-    print("\nSelect an operation:")
-    print("1. Addition (+)")
-    print("2. Subtraction (-)")
-    print("3. Multiplication (*)")
-    print("4. Division (/)")
-    operation = input("Enter your choice (1/2/3/4): ").strip()
-
-    if operation == '1':
-        result = num1 + num2
-        op_symbol = '+'
-    elif operation == '2':
-        result = num1 - num2
-        op_symbol = '-'
-    elif operation == '3':
-        result = num1 * num2
-        op_symbol = '*'
-    elif operation == '4':
-        if num2 == 0:
-            print("Error: Division by zero!")
+    console.print("\nSelect an operation:")
+    for key, (name, symbol) in CALCULATOR_OPERATIONS.items():
+        console.print(f"{key}. {name} ({symbol})")
+    console.print("5. Expression (e.g. 3*(x+2)/y)")
+    operation = (await console.input("Enter your choice (1/2/3/4/5): ")).strip()
+
+    if operation == '5':
+        text = (await console.input("Enter an expression using x and y: ")).strip()
+        console.count("calculator.expression")
+        try:
+            result = compile_expression(text)(x=num1, y=num2)
+        except ValueError as exc:
+            console.print(f"Error: {exc}")
             return
-        result = num1 / num2
-        op_symbol = '/'
-    else:
-        print("Invalid operation selected.")
+        except ZeroDivisionError:
+            console.print("Error: Division by zero!")
+            return
+        console.print(f"\nResult: {text} = {result} (x = {num1}, y = {num2})")
+        return
+    if operation not in CALCULATOR_OPERATIONS:
+        console.print("Invalid operation selected.")
+        return
+    op_name, op_symbol = CALCULATOR_OPERATIONS[operation]
+    console.count(f"calculator.{op_name.lower()}")
+    try:
+        result = calculate(num1, op_symbol, num2)
+    except ZeroDivisionError:
+        console.print("Error: Division by zero!")
         return
 
-    print(f"\nResult: {num1} {op_symbol} {num2} = {result}")
+    console.print(f"\nResult: {num1} {op_symbol} {num2} = {result}")
 
 
-def chapter3_guess_the_number() -> None:
+async def chapter3_guess_the_number(console: Console, game: GuessGame | None = None) -> None:
     """
     Chapter 3: Guess the Number Game
     --------------------------------
@@ -103,88 +219,188 @@ def chapter3_guess_the_number() -> None:
       2. Continuously prompt the user for guesses.
       3. Provide hints ("Too low" or "Too high") until the guess is correct.
       4. Display the total number of attempts.
+
+    Args:
+        console (Console): Where prompts are shown and replies come from.
+        game (GuessGame | None): A game to play or continue. When one is
+            given the user may leave with 'q' and pick the game up later;
+            by default a fresh game is played to the end.
     """
     import random
-    print("\n--- Chapter 3: Guess the Number Game ---")
-    target: int = random.randint(1, 100)
-    attempts: int = 0
-    print("I have selected a number between 1 and 100. Try to guess it!")
+    from academy.guess import GUESS_HINTS, GuessGame, check_guess
+    console.print("\n--- Chapter 3: Guess the Number Game ---")
+    resumable = game is not None
+    if game is None:
+        game = GuessGame()
+    if game.target:
+        guesses = "guess" if game.attempts == 1 else "guesses"
+        console.print(f"Welcome back! You have made {game.attempts} {guesses} so far.")
+    else:
+        game.target = random.randint(1, 100)
+        console.print("I have selected a number between 1 and 100. Try to guess it!")
+    if resumable:
+        console.print("Enter 'q' to leave and continue this game later.")
     
     while True:
+        reply = await console.input("Enter your guess: ")
+        if resumable and reply.strip().lower() == 'q':
+            console.print("Your game will be waiting for you.")
+            return
         try:
-            guess: int = int(input("Enter your guess: "))
+            guess: int = int(reply)
         except ValueError:
-            print("Please enter a valid integer.")
+            console.print("Please enter a valid integer.")
             continue
         
-        attempts += 1
+        game.attempts += 1
+        console.count("guess.attempt")
         
-        if guess < target:
-            print("Too low! Try again.")
-        elif guess > target:
-            print("Too high! Try again.")
+        hint = check_guess(guess, game.target)
+        if hint:
+            console.print(GUESS_HINTS[hint])
         else:
-            print(f"Congratulations! You guessed the number in {attempts} attempts.")
+            game.finished = True
+            console.print(f"Congratulations! You guessed the number in {game.attempts} attempts.")
             break
 
 
-def chapter4_todo_list_app() -> None:
+@CHAPTERS.chapter("3", "Chapter 3: Guess the Number Game", pass_args=True)
+async def run_guess_the_number(console: Console, args: argparse.Namespace) -> None:
+    """
+    Runs Guess the Number, continuing the game kept in the --session
+    checkpoint when there is one.
+    """
+    if args.checkpoint is None:
+        await chapter3_guess_the_number(console)
+        return
+    from academy.guess import GuessGame
+    with args.checkpoint.chapter_state(console, "guess", GuessGame.from_bytes, GuessGame.to_bytes,
+                                       GuessGame) as game:
+        await chapter3_guess_the_number(console, game)
+
+
+async def chapter4_todo_list_app(console: Console, tasks: TaskScheduler | None = None) -> None:
     """
     Chapter 4: To-Do List CLI App
     -----------------------------
     This function implements a menu-driven CLI for managing a to-do list.
-    Users can add tasks, view the list of tasks, or remove tasks interactively.
+    Users can add tasks with a priority, due date and tags, view or remove
+    them by their task number, see which task is due next, and filter the
+    list by tag or by due date. Long listings are shown a page at a time.
     
     Steps:
-      1. Display a menu of options (add, view, remove, or exit).
+      1. Display a menu of options (add, view, remove, next due, filters, or exit).
       2. Handle each operation based on user selection.
-      3. Maintain and update a list of tasks.
+      3. Maintain and update the tasks in a TaskScheduler.
+
+    Args:
+        console (Console): Where prompts are shown and replies come from.
+        tasks (TaskScheduler | None): List holding the tasks. Defaults to a
+            fresh in-memory list, so tasks vanish on return to the main menu.
     """
-    print("\n--- Chapter 4: To-Do List CLI App ---")
-    tasks: list[str] = []
+    from academy.todo import DEFAULT_PRIORITY, Task, TaskScheduler, parse_due_date, parse_priority, parse_tags
+    console.print("\n--- Chapter 4: To-Do List CLI App ---")
+    if tasks is None:
+        tasks = TaskScheduler()
     
     while True:
-        print("\n=== To-Do List App ===")
-        print("1. Add a task")
-        print("2. View tasks")
-        print("3. Remove a task")
-        print("4. Return to main menu")
-        choice = input("Enter your choice: ").strip()
+        console.print("\n=== To-Do List App ===")
+        console.print("1. Add a task")
+        console.print("2. View tasks")
+        console.print("3. Remove a task")
+        console.print("4. Show the next task due")
+        console.print("5. View tasks with a tag")
+        console.print("6. View tasks due between two dates")
+        console.print("7. Return to main menu")
+        # Commit the changes made so far before waiting on the user.
+        tasks.sync()
+        choice = (await console.input("Enter your choice: ")).strip()
         
         if choice == '1':
-            task = input("Enter a new task: ").strip()
-            tasks.append(task)
-            print("Task added!")
+            task = (await console.input("Enter a new task: ")).strip()
+            try:
+                priority = parse_priority(await console.input(f"Priority 1-5 (Enter for {DEFAULT_PRIORITY}): "))
+                due = parse_due_date(await console.input("Due date YYYY-MM-DD (Enter for none): "))
+                tags = parse_tags(await console.input("Tags, comma-separated (Enter for none): "))
+                added = tasks.add(task, priority, due, tags)
+            except ValueError as exc:
+                console.print(f"Task not added: {exc}")
+                continue
+            console.count("todo.add")
+            console.print(f"Task {added.task_id} added!")
         elif choice == '2':
+            console.count("todo.view")
             if tasks:
-                print("\nYour tasks:")
-                for index, task in enumerate(tasks, start=1):
-                    print(f"{index}. {task}")
+                console.print("\nYour tasks:")
+                await page_through(console, LazyRows(tasks), Task.describe, "Press Enter to return: ",
+                                   always_ask=False)
             else:
-                print("No tasks available.")
+                console.print("No tasks available.")
         elif choice == '3':
             if tasks:
-                print("Select a task to remove:")
-                for index, task in enumerate(tasks, start=1):
-                    print(f"{index}. {task}")
+                console.print("Select a task to remove:")
+                reply = await page_through(console, LazyRows(tasks), Task.describe, "Enter task number to remove: ")
                 try:
-                    index_to_remove: int = int(input("Enter task number to remove: ").strip()) - 1
-                    if 0 <= index_to_remove < len(tasks):
-                        removed_task = tasks.pop(index_to_remove)
-                        print(f"Removed task: {removed_task}")
+                    id_to_remove: int = int(reply)
+                    if id_to_remove in tasks:
+                        removed_task = tasks.remove(id_to_remove)
+                        console.count("todo.remove")
+                        console.print(f"Removed task: {removed_task.title}")
                     else:
-                        print("Invalid task number.")
+                        console.print("Invalid task number.")
                 except ValueError:
-                    print("Invalid input. Please enter a number.")
+                    console.print("Invalid input. Please enter a number.")
             else:
-                print("No tasks to remove.")
+                console.print("No tasks to remove.")
         elif choice == '4':
+            console.count("todo.next")
+            next_task = tasks.next_task()
+            if next_task is not None:
+                console.print(f"Next: {next_task.describe()}")
+            else:
+                console.print("No tasks available.")
+        elif choice in ('5', '6'):
+            if choice == '5':
+                tag = (await console.input("Enter a tag: ")).strip()
+                console.count("todo.filter_tag")
+                matches = tasks.with_tag(tag)
+            else:
+                try:
+                    start = parse_due_date(await console.input("From YYYY-MM-DD (Enter for any): "))
+                    end = parse_due_date(await console.input("To YYYY-MM-DD (Enter for any): "))
+                except ValueError as exc:
+                    console.print(f"Invalid input. {exc}")
+                    continue
+                console.count("todo.filter_due")
+                matches = tasks.due_between(start, end)
+            if matches:
+                await page_through(console, matches, Task.describe, "Press Enter to return: ", always_ask=False)
+            else:
+                console.print("No matching tasks.")
+        elif choice == '7':
             break
         else:
-            print("Invalid choice. Please try again.")
+            console.print("Invalid choice. Please try again.")
+
+
+@CHAPTERS.chapter("4", "Chapter 4: To-Do List CLI App", pass_args=True)
+async def run_todo_list_app(console: Console, args: argparse.Namespace) -> None:
+    """
+    Opens the to-do list selected on the command line (--todo-db, or the
+    list kept in the --session checkpoint) and runs the To-Do List App on it.
+    """
+    from academy.todo import TaskScheduler, open_task_store
+    if args.checkpoint is not None and not args.todo_db:
+        with args.checkpoint.chapter_state(console, "todo", TaskScheduler.from_bytes, TaskScheduler.to_bytes,
+                                           TaskScheduler) as tasks:
+            await chapter4_todo_list_app(console, tasks)
+        return
+    with open_task_store(args.todo_db) as tasks:
+        await chapter4_todo_list_app(console, tasks)
 
 
-def chapter5_rock_paper_scissors() -> None:
+@CHAPTERS.chapter("5", "Chapter 5: Rock, Paper, Scissors Game")
+async def chapter5_rock_paper_scissors(console: Console) -> None:
     """
     Chapter 5: Rock, Paper, Scissors Game
     -------------------------------------
@@ -199,129 +415,534 @@ def chapter5_rock_paper_scissors() -> None:
       4. Continue until the user types 'exit'.
     """
     import random
-    print("\n--- Chapter 5: Rock, Paper, Scissors Game ---")
-    moves = ['rock', 'paper', 'scissors']
+    from academy.rps import RPS_MOVES, rps_outcome
+    console.print("\n--- Chapter 5: Rock, Paper, Scissors Game ---")
+    moves = list(RPS_MOVES)
     
     while True:
-        user_move = input("\nEnter rock, paper, or scissors (or 'exit' to quit): ").strip().lower()
+        user_move = (await console.input("\nEnter rock, paper, or scissors (or 'exit' to quit): ")).strip().lower()
         if user_move == 'exit':
-            print("Thanks for playing!")
+            console.print("Thanks for playing!")
             break
         if user_move not in moves:
-            print("Invalid move. Please choose 'rock', 'paper', or 'scissors'.")
+            console.print("Invalid move. Please choose 'rock', 'paper', or 'scissors'.")
             continue
         
         computer_move = random.choice(moves)
-        print(f"Computer chose: {computer_move}")
+        console.count("rps.round")
+        console.print(f"Computer chose: {computer_move}")
         
-        if user_move == computer_move:
-            print("It's a tie!")
-        elif (user_move == 'rock' and computer_move == 'scissors') or \
-             (user_move == 'paper' and computer_move == 'rock') or \
-             (user_move == 'scissors' and computer_move == 'paper'):
-            print("You win!")
+        outcome = rps_outcome(moves.index(user_move), moves.index(computer_move))
+        if outcome == 0:
+            console.print("It's a tie!")
+        elif outcome == 1:
+            console.print("You win!")
         else:
-            print("You lose!")
+            console.print("You lose!")
 
 
-def chapter6_contact_manager() -> None:
+async def chapter6_contact_manager(console: Console, store: MutableMapping[str, str] | None = None) -> None:
     """
     Chapter 6: Simple Contact Manager
     ---------------------------------
     This function implements a simple contact management system via a CLI.
     Users can add contacts, view all contacts, search for a contact, or delete a contact.
+    Long contact listings are shown a page at a time.
+    Searches that do not name a contact exactly fall back to a case-insensitive
+    prefix, substring and typo-tolerant search over a ContactSearchIndex.
     
     Steps:
       1. Display a menu for contact management.
       2. Handle adding, viewing, searching, and deleting contacts.
-      3. Store contacts in a dictionary.
+      3. Store contacts in a dictionary-like contact store.
+
+    Args:
+        console (Console): Where prompts are shown and replies come from.
+        store (ContactStore | None): Backend holding the contacts. Defaults to a
+            fresh in-memory store, so contacts vanish on return to the main menu.
     """
-    print("\n--- Chapter 6: Simple Contact Manager ---")
-    contacts: dict[str, str] = {}
+    from academy.contacts import ContactSearchIndex, InMemoryContactStore
+    console.print("\n--- Chapter 6: Simple Contact Manager ---")
+    contacts = store if store is not None else InMemoryContactStore()
+    # Built on the first fuzzy search, then kept in sync with adds and deletes.
+    search_index: ContactSearchIndex | None = None
     
     while True:
-        print("\n=== Contact Manager ===")
-        print("1. Add a contact")
-        print("2. View contacts")
-        print("3. Search contact")
-        print("4. Delete a contact")
-        print("5. Return to main menu")
-        choice = input("Enter your choice: ").strip()
+        console.print("\n=== Contact Manager ===")
+        console.print("1. Add a contact")
+        console.print("2. View contacts")
+        console.print("3. Search contact")
+        console.print("4. Delete a contact")
+        console.print("5. Return to main menu")
+        choice = (await console.input("Enter your choice: ")).strip()
         
         if choice == '1':
-            name = input("Enter contact name: ").strip()
-            phone = input("Enter contact phone number: ").strip()
+            name = (await console.input("Enter contact name: ")).strip()
+            phone = (await console.input("Enter contact phone number: ")).strip()
+            if "\0" in name or "\0" in phone:
+                console.print("Names and phone numbers cannot contain NUL characters.")
+                continue
             contacts[name] = phone
-            print("Contact added!")
+            console.count("contacts.add")
+            if search_index is not None:
+                search_index.add(name)
+            console.print("Contact added!")
         elif choice == '2':
+            console.count("contacts.view")
             if contacts:
-                print("\nContacts:")
-                for name, phone in contacts.items():
-                    print(f"{name}: {phone}")
+                console.print("\nContacts:")
+                # Names are read only as far as the page on screen, and phone
+                # numbers are looked up for the rows shown.
+                await page_through(console, LazyRows(contacts), lambda name: f"{name}: {contacts[name]}",
+                                   "Press Enter to return: ", always_ask=False)
             else:
-                print("No contacts available.")
+                console.print("No contacts available.")
         elif choice == '3':
-            search_name = input("Enter the name to search: ").strip()
+            search_name = (await console.input("Enter the name to search: ")).strip()
+            console.count("contacts.search")
             if search_name in contacts:
-                print(f"{search_name}: {contacts[search_name]}")
+                console.print(f"{search_name}: {contacts[search_name]}")
             else:
-                print("Contact not found.")
+                if search_index is None:
+                    search_index = ContactSearchIndex(contacts)
+                matches = search_index.search(search_name) if search_name else []
+                if matches:
+                    console.print("No exact match. Closest contacts:")
+                    for name in matches:
+                        console.print(f"{name}: {contacts[name]}")
+                else:
+                    console.print("Contact not found.")
         elif choice == '4':
-            delete_name = input("Enter the name of the contact to delete: ").strip()
+            delete_name = (await console.input("Enter the name of the contact to delete: ")).strip()
             if delete_name in contacts:
                 del contacts[delete_name]
-                print("Contact deleted.")
+                console.count("contacts.delete")
+                if search_index is not None:
+                    search_index.discard(delete_name)
+                console.print("Contact deleted.")
             else:
-                print("Contact not found.")
+                console.print("Contact not found.")
         elif choice == '5':
             break
         else:
-            print("Invalid choice. Please try again.")
+            console.print("Invalid choice. Please try again.")
 
 
-def display_main_menu() -> None:
+@CHAPTERS.chapter("6", "Chapter 6: Simple Contact Manager", pass_args=True)
+async def run_contact_manager(console: Console, args: argparse.Namespace) -> None:
+    """
+    Opens the contact store selected on the command line (--contacts-db, or
+    the contacts kept in the --session checkpoint) and runs the Contact
+    Manager on it.
+    """
+    from academy.contacts import CompactContactStore, InMemoryContactStore, open_contact_store
+    if args.checkpoint is not None and not args.contacts_db:
+        store_type = CompactContactStore if args.compact_contacts else InMemoryContactStore
+        with args.checkpoint.chapter_state(console, "contacts", store_type.from_bytes, store_type.to_bytes,
+                                           store_type) as store:
+            await chapter6_contact_manager(console, store)
+        return
+    with open_contact_store(args.contacts_db, args.compact_contacts) as store:
+        await chapter6_contact_manager(console, store)
+
+
+def discover_scripts() -> None:
+    """
+    Adds the standalone example scripts next to this file to the menu,
+    numbered after the Exit option.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    CHAPTERS.discover(directory, exclude=(os.path.basename(__file__),), first_key=int(EXIT_KEY) + 1)
+
+
+def display_main_menu(console: Console) -> None:
     """
     Displays the main menu for the iD01t Academy Python Project Book 1 Examples.
     """
-    print("\n==========================================")
-    print("    iD01t Academy Project Examples CLI")
-    print("==========================================")
-    print("1. Chapter 1: Hello, World and Basic I/O")
-    print("2. Chapter 2: Simple Calculator")
-    print("3. Chapter 3: Guess the Number Game")
-    print("4. Chapter 4: To-Do List CLI App")
-    print("5. Chapter 5: Rock, Paper, Scissors Game")
-    print("6. Chapter 6: Simple Contact Manager")
-    print("7. Exit")
+    console.write(render_main_menu(len(CHAPTERS)))
+
+
+@functools.lru_cache(maxsize=1)
+def render_main_menu(entry_count: int) -> str:
+    """
+    Builds the main menu text. It only changes when chapters are registered,
+    so it is cached per number of entries and written with a single call.
+    """
+    lines = ["",
+             "==========================================",
+             "    iD01t Academy Project Examples CLI",
+             "=========================================="]
+    scripts = []
+    for entry in CHAPTERS:
+        if entry.path is None:
+            lines.append(f"{entry.key}. {entry.title}")
+        else:
+            scripts.append(entry)
+    lines.append(f"{EXIT_KEY}. Exit")
+    if scripts:
+        lines.append("------------------------------------------")
+        lines.append("Standalone example scripts:")
+        for entry in scripts:
+            window = " [opens a window]" if entry.is_gui else ""
+            lines.append(f"{entry.key}. {entry.title}{window}")
+    return "\n".join(lines) + "\n"
+
+
+def menu_range() -> str:
+    """Returns the range of menu numbers shown in the main prompt, e.g. "1-9"."""
+    return f"1-{max(int(EXIT_KEY), *(int(entry.key) for entry in CHAPTERS))}"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command-line flags accepted by the CLI.
+
+    Args:
+        argv (list[str] | None): Arguments to parse; defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(description="iD01t Academy Project Examples CLI")
+    parser.add_argument("--contacts-db", metavar="PATH",
+                        help="keep Chapter 6 contacts in an on-disk store at PATH")
+    parser.add_argument("--compact-contacts", action="store_true",
+                        help="keep in-memory Chapter 6 contacts in a compact table instead of a dict")
+    parser.add_argument("--bench-contact-memory", type=int, nargs="?", const=1_000_000, metavar="N",
+                        help="compare the memory per contact of a dict and the compact table and exit")
+    parser.add_argument("--bench-contact-search", type=int, nargs="?", const=1_000_000, metavar="N",
+                        help="time contact name searches over N synthetic contacts and exit")
+    parser.add_argument("--import-contacts", metavar="FILE",
+                        help="add the contacts in a CSV or vCard file to --contacts-db and exit ('-' for stdin)")
+    parser.add_argument("--export-contacts", metavar="FILE",
+                        help="write the contacts in --contacts-db to a CSV or vCard file and exit ('-' for stdout)")
+    parser.add_argument("--contacts-format", choices=("csv", "vcard"),
+                        help="file format for --import-contacts/--export-contacts (default: from the extension)")
+    parser.add_argument("--todo-db", metavar="PATH",
+                        help="keep Chapter 4 tasks in a write-ahead log with snapshots at PATH")
+    parser.add_argument("--session", metavar="FILE",
+                        help="keep chapter state (tasks, contacts, a game in progress) in FILE between visits and runs")
+    parser.add_argument("--calc-batch", metavar="CSV",
+                        help="evaluate a CSV of num1,operator,num2 rows and exit ('-' for stdin)")
+    parser.add_argument("--calc-output", metavar="CSV", default="-",
+                        help="where --calc-batch writes its results (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=65_536,
+                        help="rows evaluated per batch in --calc-batch mode")
+    parser.add_argument("--bench-expressions", action="store_true",
+                        help="benchmark cached vs uncached expression evaluation and exit")
+    parser.add_argument("--simulate-guess", metavar="STRATEGY",
+                        help="simulate Guess the Number games with a strategy (binary, random, biased)")
+    parser.add_argument("--games", type=int, default=1_000_000,
+                        help="games played by --simulate-guess")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for simulations (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for menu sessions and simulations (simulations default to 0)")
+    parser.add_argument("--rps-tournament", action="store_true",
+                        help="play a Rock, Paper, Scissors bot tournament and exit")
+    parser.add_argument("--bots", default=None,
+                        help="comma-separated bots for --rps-tournament (default: all)")
+    parser.add_argument("--rounds", type=int, default=10_000_000,
+                        help="rounds per pairing in --rps-tournament")
+    parser.add_argument("--grade", nargs="+", metavar="PATH",
+                        help="auto-grade learner submissions (files or folders of .py files) and exit")
+    parser.add_argument("--grade-chapter", metavar="N", default="2",
+                        help="chapter the --grade submissions implement, 1-6 (default: 2)")
+    parser.add_argument("--time-limit", type=float, default=2.0,
+                        help="wall-clock seconds per --grade run (default: 2)")
+    parser.add_argument("--memory-limit", type=int, default=256, metavar="MB",
+                        help="memory per --grade run in megabytes (default: 256)")
+    parser.add_argument("--grade-cache", metavar="DIR", default=".grade-cache",
+                        help="folder where --grade keeps grades by file hash (default: .grade-cache)")
+    parser.add_argument("--grade-report", metavar="CSV",
+                        help="save the --grade results as CSV")
+    session = parser.add_mutually_exclusive_group()
+    session.add_argument("--script", metavar="FILE",
+                         help="read menu replies from FILE, one per line ('-' for stdin)")
+    session.add_argument("--replay", metavar="FILE",
+                         help="replay a transcript saved with --record and verify its output")
+    parser.add_argument("--record", metavar="FILE",
+                        help="save the menu session as a JSON transcript")
+    parser.add_argument("--check-startup", action="store_true",
+                        help="time cold starts of the text menu and fail if over --startup-budget-ms")
+    parser.add_argument("--startup-budget-ms", type=float, default=50.0,
+                        help="cold-start budget for --check-startup (default: 50)")
+    parser.add_argument("--serve", metavar="[HOST:]PORT",
+                        help="serve a menu session to every TCP connection (host defaults to 127.0.0.1)")
+    parser.add_argument("--idle-timeout", type=float, default=300.0,
+                        help="seconds a --serve session may wait for a reply (default: 300)")
+    parser.add_argument("--max-sessions", type=int, default=10_000,
+                        help="concurrent --serve sessions before new connections are turned away")
+    parser.add_argument("--load-test", metavar="[HOST:]PORT",
+                        help="run simulated learners against a --serve process and exit")
+    parser.add_argument("--sessions", type=int, default=1000,
+                        help="simultaneous learners for --load-test")
+    parser.add_argument("--session-rounds", type=int, default=5,
+                        help="scenario rounds played by each --load-test learner")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="time each chapter step (input wait, compute, render) and save the metrics to FILE")
+    parser.add_argument("--metrics-format", choices=("json", "prometheus"), default="json",
+                        help="file format for --metrics (default: json)")
+    parser.add_argument("--profile", action="store_true",
+                        help="run under cProfile and print the hottest code paths to stderr")
+    parser.add_argument("--bench", action="store_true",
+                        help="run the benchmark suite and exit")
+    parser.add_argument("--bench-only", metavar="NAMES",
+                        help="comma-separated benchmark names or groups to run (e.g. contacts,rps.outcome)")
+    parser.add_argument("--bench-scale", type=float, default=1.0,
+                        help="multiplier for the work done by each benchmark (default: 1)")
+    parser.add_argument("--bench-save", metavar="FILE",
+                        help="save the benchmark results as a JSON baseline")
+    parser.add_argument("--bench-compare", nargs="+", metavar="FILE",
+                        help="compare RESULTS (or a fresh run) with a BASELINE; exits 1 on regressions")
+    parser.add_argument("--bench-threshold", type=float, default=0.10,
+                        help="slowdown (fraction) counted as a regression by --bench-compare (default: 0.10)")
+    # Set by run_cli() when --session is given: the open SessionCheckpoint.
+    parser.set_defaults(checkpoint=None)
+    return parser.parse_args(argv)
+
+
+async def run_main_menu(console: Console, args: argparse.Namespace) -> None:
+    """
+    Runs the interactive main menu on the given console until the user exits.
+
+    Args:
+        console (Console): Where prompts are shown and replies come from.
+        args (argparse.Namespace): Parsed command-line flags.
+    """
+    prompt = f"Select an example to run ({menu_range()}): "
+    while True:
+        display_main_menu(console)
+        choice = (await console.input(prompt)).strip()
+        entry = CHAPTERS.get(choice)
+        if entry is not None:
+            with console.section(f"chapter{entry.key}"):
+                await entry.run(console, args)
+        elif choice == EXIT_KEY:
+            console.print("Exiting iD01t Academy Project Examples. Goodbye!")
+            break
+        else:
+            console.print("Invalid choice. Please select a valid option.")
 
 
-def main() -> None:
+def check_startup(budget_ms: float, runs: int = 10) -> bool:
+    """
+    Measures cold starts of the text menu and compares the median to a budget.
+
+    Returns:
+        bool: True when the median start-up time is within the budget.
+    """
+    from academy.registry import measure_cold_start
+    timings = measure_cold_start(os.path.abspath(__file__), runs)
+    median_ms = 1000 * timings[len(timings) // 2]
+    print(f"Cold start over {runs} runs: median {median_ms:.1f} ms, "
+          f"best {1000 * timings[0]:.1f} ms, worst {1000 * timings[-1]:.1f} ms "
+          f"({len(CHAPTERS)} menu entries, budget {budget_ms:.0f} ms).")
+    return median_ms <= budget_ms
+
+
+def main(argv: list[str] | None = None) -> None:
     """
     Main entry point for the iD01t Academy Project Examples CLI Interface.
     
     Continuously displays the main menu and prompts the user to select an example to run,
     until the user chooses to exit.
+
+    Args:
+        argv (list[str] | None): Command-line arguments; defaults to sys.argv[1:].
     """
-    while True:
-        display_main_menu()
-        choice = input("Select an example to run (1-7): ").strip()
-        if choice == '1':
-            chapter1_hello_world()
-        elif choice == '2':
-            chapter2_simple_calculator()
-        elif choice == '3':
-            chapter3_guess_the_number()
-        elif choice == '4':
-            chapter4_todo_list_app()
-        elif choice == '5':
-            chapter5_rock_paper_scissors()
-        elif choice == '6':
-            chapter6_contact_manager()
-        elif choice == '7':
-            print("Exiting iD01t Academy Project Examples. Goodbye!")
-            break
-        else:
-            print("Invalid choice. Please select a valid option.")
+    args = parse_args(argv)
+    if not args.profile:
+        run_cli(args)
+        return
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run_cli, args)
+    finally:
+        print_profile(profiler)
+
+
+def print_profile(profiler: object, limit: int = 30) -> None:
+    """
+    Prints the hot paths of a profiled run to standard error: the functions
+    with the most cumulative time, then those with the most time of their own.
+    """
+    import pstats
+    stats = pstats.Stats(profiler, stream=sys.stderr).strip_dirs()
+    print("\n=== Profile: hot paths (cumulative time) ===", file=sys.stderr)
+    stats.sort_stats("cumulative").print_stats(limit)
+    print("=== Profile: hottest functions (own time) ===", file=sys.stderr)
+    stats.sort_stats("tottime").print_stats(limit)
+
+
+def serve_classroom(args: argparse.Namespace) -> None:
+    """
+    Serves the main menu to every TCP connection (--serve), optionally
+    collecting metrics across all sessions (--metrics).
+    """
+    # Standalone scripts call input() synchronously and would stall every
+    # session, so they are not discovered; on-disk contact stores and to-do
+    # lists cannot be shared between sessions either.
+    if args.contacts_db:
+        sys.exit("--contacts-db cannot be used with --serve; each session keeps its own contacts.")
+    if args.todo_db:
+        sys.exit("--todo-db cannot be used with --serve; each session keeps its own to-do list.")
+    if args.session:
+        sys.exit("--session cannot be used with --serve; each session keeps its own state.")
+    from academy.server import run_server
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
+    if not args.metrics:
+        run_server(functools.partial(run_main_menu, args=args), args.serve, args.idle_timeout, args.max_sessions)
+        return
+    from academy.metrics import InstrumentedConsole, Metrics
+    metrics = Metrics()
+
+    def session(console: Console) -> Coroutine[object, object, None]:
+        return run_main_menu(InstrumentedConsole(console, metrics), args)
+
+    run_server(session, args.serve, args.idle_timeout, args.max_sessions)
+    metrics.save(args.metrics, args.metrics_format)
+
+
+def grade_submissions(args: argparse.Namespace) -> None:
+    """
+    Auto-grades learner submissions of one chapter (--grade) against the
+    chapter registered under --grade-chapter.
+    """
+    # The reference runs must see fresh in-memory stores, like a learner's program.
+    if args.contacts_db or args.todo_db:
+        sys.exit("--contacts-db and --todo-db cannot be used with --grade.")
+    entry = CHAPTERS.get(args.grade_chapter)
+    if entry is None:
+        sys.exit(f"--grade-chapter must be a chapter number from 1 to {int(EXIT_KEY) - 1}.")
+    from academy.grader import run_grader
+    run_grader(args.grade, entry.key, functools.partial(entry.run, args=args), args.workers,
+               args.time_limit, args.memory_limit, args.grade_cache, args.grade_report)
+
+
+def run_bench(args: argparse.Namespace) -> bool:
+    """
+    Runs, saves and compares benchmarks as requested by the --bench flags.
+
+    Returns:
+        bool: False when --bench-compare found a regression.
+    """
+    from academy.bench import compare_results, load_results, run_benchmarks, save_results
+    compare = args.bench_compare or []
+    if len(compare) > 2:
+        sys.exit("--bench-compare takes a baseline and at most one results file.")
+    if len(compare) == 2:
+        current = load_results(compare[1])
+    else:
+        selected = args.bench_only.split(",") if args.bench_only else None
+        current = run_benchmarks(selected, args.bench_scale)
+    if args.bench_save:
+        save_results(current, args.bench_save)
+    if compare:
+        return compare_results(load_results(compare[0]), current, args.bench_threshold)
+    return True
+
+
+def run_cli(args: argparse.Namespace) -> None:
+    """
+    Runs the tool or menu session selected by the parsed command-line flags.
+    """
+    simulation_seed = 0 if args.seed is None else args.seed
+    if args.import_contacts or args.export_contacts:
+        if not args.contacts_db:
+            sys.exit("--import-contacts and --export-contacts need an on-disk store (--contacts-db PATH).")
+        from academy.contacts import run_contact_export, run_contact_import
+        if args.import_contacts:
+            run_contact_import(args.import_contacts, args.contacts_db, args.contacts_format)
+        if args.export_contacts:
+            run_contact_export(args.export_contacts, args.contacts_db, args.contacts_format)
+        return
+    if args.calc_batch:
+        from academy.calculator import run_calculator_batch
+        run_calculator_batch(args.calc_batch, args.calc_output, args.chunk_size)
+        return
+    if args.bench_expressions:
+        from academy.calculator import benchmark_expression_cache
+        benchmark_expression_cache()
+        return
+    if args.bench_contact_memory:
+        from academy.contacts import benchmark_contact_memory
+        benchmark_contact_memory(args.bench_contact_memory)
+        return
+    if args.bench_contact_search:
+        from academy.contacts import benchmark_contact_search
+        benchmark_contact_search(args.bench_contact_search)
+        return
+    if args.simulate_guess:
+        from academy.guess import run_guess_simulation
+        run_guess_simulation(args.simulate_guess, args.games, args.workers, simulation_seed)
+        return
+    if args.rps_tournament:
+        from academy.rps import RPS_BOTS, print_rps_tournament
+        bots = args.bots.split(",") if args.bots else list(RPS_BOTS)
+        print_rps_tournament(bots, args.rounds, args.workers, simulation_seed)
+        return
+    if args.grade:
+        grade_submissions(args)
+        return
+    if args.bench or args.bench_compare:
+        sys.exit(0 if run_bench(args) else 1)
+    if args.load_test:
+        from academy.server import run_load_test
+        sys.exit(0 if run_load_test(args.load_test, args.sessions, args.session_rounds) else 1)
+    if args.serve:
+        serve_classroom(args)
+        return
+    discover_scripts()
+    if args.check_startup:
+        sys.exit(0 if check_startup(args.startup_budget_ms) else 1)
+
+    seed = args.seed
+    expected_digest = None
+    if args.replay:
+        transcript = load_transcript(args.replay)
+        seed, expected_digest = transcript["seed"], transcript["output_sha256"]
+        console: Console = ScriptedConsole(transcript["replies"])
+    elif args.script == "-":
+        console = ScriptedConsole(sys.stdin)
+    elif args.script:
+        with open(args.script, encoding="utf-8") as source:
+            console = ScriptedConsole(source.read().splitlines())
+    else:
+        console = Console()
+    if seed is None and (args.record or expected_digest):
+        seed = int.from_bytes(os.urandom(4), "little")
+    if seed is not None:
+        import random
+        random.seed(seed)
+    if args.record or expected_digest:
+        console = recorder = RecordingConsole(console, seed)
+    if args.metrics:
+        from academy.metrics import InstrumentedConsole
+        console = InstrumentedConsole(console)
+    if args.session:
+        from academy.session import SessionCheckpoint
+        try:
+            args.checkpoint = SessionCheckpoint(args.session)
+        except ValueError as exc:
+            sys.exit(f"{exc} Remove it to start a new session.")
+
+    try:
+        run_sync(run_main_menu(console, args))
+    except EOFError:
+        pass
+    finally:
+        console.flush()
+        if args.checkpoint is not None:
+            args.checkpoint.close()
+        if args.metrics:
+            console.end_step()
+            console.metrics.save(args.metrics, args.metrics_format)
+    if args.record:
+        recorder.save(args.record)
+    if expected_digest and recorder.output_digest != expected_digest:
+        print("Replay diverged: output does not match the recorded session.", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
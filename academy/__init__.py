@@ -0,0 +1,7 @@
+"""
+iD01t Academy Support Package
+-----------------------------
+Engines and tools shared by the iD01t Academy example scripts. The chapter
+scripts import these modules lazily, only when a chapter or tool needs them,
+so the menu starts quickly and Python can reuse the cached bytecode.
+"""
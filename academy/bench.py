@@ -0,0 +1,650 @@
+"""
+Benchmark Suite
+---------------
+Times the core of every chapter at scale, the start-up of each example script
+and the construction of the Tk calculator, and compares runs against saved
+baselines.
+
+Each benchmark is a setup function registered with @benchmark. Setup builds
+its input data (not timed) and returns the timed body plus the number of
+operations the body performs. Every body runs ``repeat`` times and the best
+run is kept, which filters out most scheduler noise. Results are saved as
+JSON; compare_results() flags every benchmark whose time per operation grew
+by more than the threshold.
+
+GUI benchmarks need a display. When DISPLAY is unset they start a private
+Xvfb server if one is installed, and are reported as skipped otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+
+RESULTS_VERSION = 1
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MENU_SCRIPT = os.path.join(PROJECT_DIR, "Python-Book-1.py")
+HELLO_SCRIPT = os.path.join(PROJECT_DIR, "Python-Book-1-1.py")
+CALCULATOR_GUI_SCRIPT = os.path.join(PROJECT_DIR, "Python-Book-1-2.py")
+
+BenchmarkBody = Callable[[], object]
+BenchmarkSetup = Callable[[float], tuple[BenchmarkBody, int]]
+
+BENCHMARKS: dict[str, tuple[BenchmarkSetup, int, bool]] = {}
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark's setup when it cannot run here (e.g. no display)."""
+
+
+def benchmark(name: str, repeat: int = 5, needs_display: bool = False) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """
+    Registers a benchmark setup function under a dotted name.
+
+    Args:
+        name (str): Name such as "contacts.search"; the part before the dot groups it.
+        repeat (int): Timed runs; the best one is reported.
+        needs_display (bool): Whether the benchmark opens Tk windows.
+    """
+    def register(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS[name] = (setup, repeat, needs_display)
+        return setup
+    return register
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, int(count * scale))
+
+
+def load_script(path: str, name: str) -> object:
+    """Imports one of the example scripts (their file names are not valid module names)."""
+    import importlib.util
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_process(command: list[str], runs: int, stdin: bytes = b"") -> BenchmarkBody:
+    """Returns a body that starts a fresh interpreter ``runs`` times and waits for each."""
+    def body() -> None:
+        for _ in range(runs):
+            subprocess.run(command, input=stdin, stdout=subprocess.DEVNULL, check=True)
+    return body
+
+
+# --- Chapter 2: calculator ---------------------------------------------------
+
+@benchmark("calculator.calculate")
+def bench_calculate(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.calculator import calculate
+    count = _scaled(200_000, scale)
+    rows = [(float(i), "+-*/"[i % 4], float(i % 9 + 1)) for i in range(count)]
+
+    def body() -> None:
+        for num1, op_symbol, num2 in rows:
+            calculate(num1, op_symbol, num2)
+    return body, count
+
+
+@benchmark("calculator.batch", repeat=3)
+def bench_calculate_batch(scale: float) -> tuple[BenchmarkBody, int]:
+    from array import array
+    from academy.calculator import calculate_batch
+    count = _scaled(1_000_000, scale)
+    num1 = array("d", range(count))
+    num2 = array("d", (i % 9 for i in range(count)))
+    operators = ["+-*/"[i % 4] for i in range(count)]
+    return (lambda: calculate_batch(num1, operators, num2)), count
+
+
+@benchmark("calculator.expression")
+def bench_expression(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.calculator import compile_expression
+    count = _scaled(200_000, scale)
+
+    def body() -> None:
+        for i in range(count):
+            compile_expression("3*(x+2)/y")(x=float(i), y=float(i % 7 + 1))
+    return body, count
+
+
+# --- Chapter 3: guess the number --------------------------------------------
+
+@benchmark("guess.check_guess")
+def bench_check_guess(scale: float) -> tuple[BenchmarkBody, int]:
+    import random
+    from academy.guess import check_guess
+    count = _scaled(1_000_000, scale)
+    rng = random.Random(0)
+    guesses = [rng.randint(1, 100) for _ in range(count)]
+
+    def body() -> None:
+        for guess in guesses:
+            check_guess(guess, 50)
+    return body, count
+
+
+@benchmark("guess.simulate_binary", repeat=3)
+def bench_simulate_guess(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.guess import simulate_guess_games
+    games = _scaled(100_000, scale)
+    return (lambda: simulate_guess_games("binary", games, workers=1, seed=0)), games
+
+
+# --- Chapter 5: rock, paper, scissors ----------------------------------------
+
+@benchmark("rps.outcome")
+def bench_rps_outcome(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.rps import rps_outcome
+    count = _scaled(1_000_000, scale)
+    pairs = [(i % 3, i // 3 % 3) for i in range(count)]
+
+    def body() -> None:
+        for move_a, move_b in pairs:
+            rps_outcome(move_a, move_b)
+    return body, count
+
+
+@benchmark("rps.resolve_rounds")
+def bench_rps_resolve(scale: float) -> tuple[BenchmarkBody, int]:
+    import random
+    from academy.rps import _random_moves, resolve_rps_rounds
+    count = _scaled(10_000_000, scale)
+    rng = random.Random(0)
+    moves_a, moves_b = _random_moves(rng, count), _random_moves(rng, count)
+    return (lambda: resolve_rps_rounds(moves_a, moves_b)), count
+
+
+# --- Chapter 4: to-do list ---------------------------------------------------
+
+@benchmark("todo.session", repeat=3)
+def bench_todo_session(scale: float) -> tuple[BenchmarkBody, int]:
+    import io
+    from academy.console import ScriptedConsole, run_sync
+    menu = load_script(MENU_SCRIPT, "academy_bench_menu")
+    tasks = _scaled(5_000, scale)
+    replies = []
+    for i in range(tasks):
+        replies += ["1", f"Task {i}", str(i % 5 + 1), f"2026-{i % 12 + 1:02}-01", "study"]
+    # Listings longer than a page end at a pager prompt, answered with Enter.
+    replies += ["2", "g 3", "", "4", "5", "study", "", "6", "2026-03-01", "2026-04-30", ""]
+    for i in range(tasks // 2):
+        replies += ["3", str(i + 1)]
+    replies += ["2", "", "7"]
+
+    def body() -> None:
+        run_sync(menu.chapter4_todo_list_app(ScriptedConsole(replies, io.StringIO())))
+    return body, len(replies)
+
+
+@benchmark("todo.scheduler", repeat=3)
+def bench_todo_scheduler(scale: float) -> tuple[BenchmarkBody, int]:
+    import datetime
+    from academy.todo import TaskScheduler
+    count = _scaled(200_000, scale)
+    first_day = datetime.date(2026, 1, 1).toordinal()
+    rows = [(f"Task {i}", i % 5 + 1, datetime.date.fromordinal(first_day + i * 7919 % 730), (f"tag{i % 50}",))
+            for i in range(count)]
+    start, end = datetime.date(2026, 3, 1), datetime.date(2026, 3, 2)
+
+    def body() -> None:
+        tasks = TaskScheduler()
+        for title, priority, due, tags in rows:
+            tasks.add(title, priority, due, tags)
+        for _ in range(count // 1000):
+            tasks.with_tag("tag7")
+            tasks.due_between(start, end)
+        while tasks:
+            tasks.remove(tasks.next_task().task_id)
+    return body, 2 * count
+
+
+@benchmark("todo.durable", repeat=3)
+def bench_todo_durable(scale: float) -> tuple[BenchmarkBody, int]:
+    import atexit
+    import datetime
+    import shutil
+    import tempfile
+    from academy.todo import DurableTaskScheduler
+    count = _scaled(100_000, scale)
+    first_day = datetime.date(2026, 1, 1)
+    directory = tempfile.mkdtemp(prefix="academy-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+
+    def body() -> None:
+        path = os.path.join(directory, "todo.log")
+        for stale in (path, path + ".snapshot"):
+            if os.path.exists(stale):
+                os.remove(stale)
+        with DurableTaskScheduler(path) as tasks:
+            for i in range(count):
+                tasks.add(f"Task {i}", i % 5 + 1, first_day + datetime.timedelta(i % 365), (f"tag{i % 50}",))
+        with DurableTaskScheduler(path) as tasks:
+            tasks.next_task()
+    return body, 2 * count
+
+
+# --- Chapter 6: contact manager ----------------------------------------------
+
+def _contact_names(count: int) -> list[str]:
+    import random
+    rng = random.Random(0)
+    first = ["Ada", "Alan", "Grace", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Edsger", "Frances"]
+    last = ["Lovelace", "Turing", "Hopper", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Dijkstra"]
+    return [f"{rng.choice(first)} {rng.choice(last)} {i}" for i in range(count)]
+
+
+@benchmark("contacts.memory_store")
+def bench_memory_store(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.contacts import InMemoryContactStore
+    names = _contact_names(_scaled(100_000, scale))
+
+    def body() -> None:
+        store = InMemoryContactStore()
+        for name in names:
+            store[name] = "555-0100"
+        for name in names:
+            store[name]
+        for name in names:
+            del store[name]
+    return body, 3 * len(names)
+
+
+@benchmark("contacts.compact_store")
+def bench_compact_store(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.contacts import CompactContactStore
+    names = _contact_names(_scaled(100_000, scale))
+
+    def body() -> None:
+        store = CompactContactStore()
+        for name in names:
+            store[name] = "555-0100"
+        for name in names:
+            store[name]
+        for name in names:
+            del store[name]
+    return body, 3 * len(names)
+
+
+@benchmark("contacts.disk_store", repeat=3)
+def bench_disk_store(scale: float) -> tuple[BenchmarkBody, int]:
+    import atexit
+    import shutil
+    import tempfile
+    from academy.contacts import DiskContactStore
+    names = _contact_names(_scaled(100_000, scale))
+    directory = tempfile.mkdtemp(prefix="academy-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+
+    def body() -> None:
+        path = os.path.join(directory, "contacts.db")
+        for stale in (path, path + ".hint"):
+            if os.path.exists(stale):
+                os.remove(stale)
+        with DiskContactStore(path) as store:
+            for name in names:
+                store[name] = "555-0100"
+        with DiskContactStore(path) as store:
+            for name in names:
+                store[name]
+    return body, 2 * len(names)
+
+
+@benchmark("contacts.import_export", repeat=3)
+def bench_import_export(scale: float) -> tuple[BenchmarkBody, int]:
+    import io
+    from academy.contacts import (InMemoryContactStore, import_contacts, read_contacts_csv, read_contacts_vcard,
+                                  write_contacts_csv, write_contacts_vcard)
+    names = _contact_names(_scaled(100_000, scale))
+    source = io.StringIO()
+    write_contacts_csv(((name, f"555-{i % 10_000:04}") for i, name in enumerate(names)), source)
+    csv_text = source.getvalue()
+
+    def body() -> None:
+        store = InMemoryContactStore()
+        import_contacts(store, read_contacts_csv(io.StringIO(csv_text)))
+        vcards = io.StringIO()
+        write_contacts_vcard(store.items(), vcards)
+        vcards.seek(0)
+        import_contacts(store, read_contacts_vcard(vcards))
+    return body, 3 * len(names)
+
+
+@benchmark("contacts.index_build", repeat=3)
+def bench_index_build(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.contacts import ContactSearchIndex
+    names = _contact_names(_scaled(100_000, scale))
+    return (lambda: ContactSearchIndex(names)), len(names)
+
+
+@benchmark("contacts.search")
+def bench_contact_search(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.contacts import ContactSearchIndex
+    index = ContactSearchIndex(_contact_names(_scaled(100_000, scale)))
+    # Prefix, substring and typo (fuzzy fallback) queries in equal measure.
+    queries = ["ada lov", "grace h", "turing 12", "opper 4", "lovelase 99", "dijkstar 7"] * 50
+
+    def body() -> None:
+        for query in queries:
+            index.search(query)
+    return body, len(queries)
+
+
+# --- Session checkpoints ------------------------------------------------------
+
+def _session_with_tasks(count: int) -> str:
+    """Writes a checkpoint holding a to-do list of count tasks and a game; returns its path."""
+    import atexit
+    import datetime
+    import shutil
+    import tempfile
+    from academy.guess import GuessGame
+    from academy.session import SessionCheckpoint
+    from academy.todo import TaskScheduler
+    directory = tempfile.mkdtemp(prefix="academy-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+    tasks = TaskScheduler()
+    first_day = datetime.date(2026, 1, 1)
+    for i in range(count):
+        tasks.add(f"Task {i}", i % 5 + 1, first_day + datetime.timedelta(days=i % 365), ("study",))
+    path = os.path.join(directory, "session.ckpt")
+    with SessionCheckpoint(path) as checkpoint:
+        checkpoint.save("todo", tasks.to_bytes())
+        checkpoint.save("guess", GuessGame(42, 3).to_bytes())
+    return path
+
+
+@benchmark("session.resume_game")
+def bench_session_resume_game(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.guess import GuessGame
+    from academy.session import SessionCheckpoint
+    # A large to-do list sits in the same file; resuming the game must not read it.
+    path = _session_with_tasks(_scaled(200_000, scale))
+    resumes = 1000
+
+    def body() -> None:
+        for _ in range(resumes):
+            with SessionCheckpoint(path) as checkpoint:
+                checkpoint.restore("guess", GuessGame.from_bytes)
+    return body, resumes
+
+
+@benchmark("session.restore_todo", repeat=3)
+def bench_session_restore_todo(scale: float) -> tuple[BenchmarkBody, int]:
+    from academy.session import SessionCheckpoint
+    from academy.todo import TaskScheduler
+    count = _scaled(200_000, scale)
+    path = _session_with_tasks(count)
+
+    def body() -> None:
+        with SessionCheckpoint(path) as checkpoint:
+            checkpoint.restore("todo", TaskScheduler.from_bytes)
+    return body, count
+
+
+# --- Auto-grader ---------------------------------------------------------------
+
+_CHAPTER1_SUBMISSION = """
+print("\\n--- Chapter 1: Hello, World and Basic I/O ---")
+print("Hello, World!")
+name = input("What's your name? ")
+print(f"Hello, {name}!")
+"""
+
+
+@benchmark("grader.chapter1", repeat=3)
+def bench_grader(scale: float) -> tuple[BenchmarkBody, int]:
+    import atexit
+    import shutil
+    import tempfile
+    from academy.grader import GRADING_SCENARIOS, grade_submissions
+    menu = load_script(MENU_SCRIPT, "academy_bench_menu")
+    count = _scaled(8, scale)
+    directory = tempfile.mkdtemp(prefix="academy-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+    paths = []
+    # Distinct files, so every submission is run rather than deduplicated.
+    for number in range(count):
+        paths.append(os.path.join(directory, f"learner{number}.py"))
+        with open(paths[-1], "w", encoding="utf-8") as submission:
+            submission.write(f"# Learner {number}{_CHAPTER1_SUBMISSION}")
+
+    def body() -> None:
+        grades = grade_submissions(paths, "1", menu.chapter1_hello_world)
+        if any(grade.passed != len(grade.results) for grade in grades):
+            raise AssertionError("The reference submission failed to grade.")
+    return body, count * len(GRADING_SCENARIOS["1"])
+
+
+# --- Script start-up and the Tk calculator -----------------------------------
+
+@benchmark("startup.menu", repeat=3)
+def bench_startup_menu(scale: float) -> tuple[BenchmarkBody, int]:
+    runs = 5
+    return time_process([sys.executable, MENU_SCRIPT, "--script", "-"], runs, b"7\n"), runs
+
+
+@benchmark("startup.hello_world", repeat=3)
+def bench_startup_hello(scale: float) -> tuple[BenchmarkBody, int]:
+    runs = 5
+    return time_process([sys.executable, HELLO_SCRIPT], runs, b"Ada\n"), runs
+
+
+# Builds the calculator window once and closes it; run in a fresh interpreter.
+_GUI_STARTUP = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("calculator_gui", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+root = module.tk.Tk()
+module.SimpleCalculatorApp(root)
+root.update()
+root.destroy()
+"""
+
+
+@benchmark("startup.calculator_gui", repeat=3, needs_display=True)
+def bench_startup_gui(scale: float) -> tuple[BenchmarkBody, int]:
+    runs = 5
+    return time_process([sys.executable, "-c", _GUI_STARTUP, CALCULATOR_GUI_SCRIPT], runs), runs
+
+
+@benchmark("gui.construct_app", needs_display=True)
+def bench_construct_app(scale: float) -> tuple[BenchmarkBody, int]:
+    import io
+    calculator = load_script(CALCULATOR_GUI_SCRIPT, "academy_bench_calculator_gui")
+    count = _scaled(20, scale)
+
+    def body() -> None:
+        # Discard the warning printed when id01t.jpg is not next to the script.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(count):
+                root = calculator.tk.Tk()
+                calculator.SimpleCalculatorApp(root)
+                root.update_idletasks()
+                root.destroy()
+    return body, count
+
+
+@benchmark("gui.history_tape")
+def bench_history_tape(scale: float) -> tuple[BenchmarkBody, int]:
+    import random
+    import tempfile
+    calculator = load_script(CALCULATOR_GUI_SCRIPT, "academy_bench_calculator_gui")
+    count = _scaled(500_000, scale)
+    rng = random.Random(19)
+    # What the panel reads per frame: one screen of rows at a random scroll position.
+    tops = [rng.randrange(count) for _ in range(500)]
+    queries = ["= 1234", "* 77", "no such entry"]
+
+    def body() -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            history = calculator.CalculationHistory(capacity=count // 2,
+                                                    spill_path=os.path.join(directory, "history.log"))
+            for i in range(count):
+                history.append(f"2026-01-01 12:00:00  {i} * {i % 97} = {i * (i % 97)}")
+            for top in tops:
+                for index in range(top, min(top + 14, len(history))):
+                    history[index]
+            for query in queries:
+                history.find(query)
+            history.close()
+    return body, count
+
+
+@contextlib.contextmanager
+def virtual_display() -> Iterator[str | None]:
+    """
+    Makes a display available for Tk: the current one, or a private Xvfb
+    server for the duration of the block. Yields the display name, or None
+    when neither is available.
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        yield os.environ.get("DISPLAY", "")
+        return
+    import shutil
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        yield None
+        return
+    read_end, write_end = os.pipe()
+    server = subprocess.Popen([xvfb, "-displayfd", str(write_end), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                              pass_fds=(write_end,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_end)
+    try:
+        with os.fdopen(read_end) as announcement:
+            number = announcement.readline().strip()
+        if not number:
+            yield None
+            return
+        os.environ["DISPLAY"] = f":{number}"
+        try:
+            yield os.environ["DISPLAY"]
+        finally:
+            del os.environ["DISPLAY"]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_benchmarks(selected: list[str] | None = None, scale: float = 1.0) -> dict[str, object]:
+    """
+    Runs the registered benchmarks and collects their timings.
+
+    Args:
+        selected (list[str] | None): Name prefixes to run (e.g. ["contacts", "rps.outcome"]);
+            None runs everything.
+        scale (float): Multiplier for the amount of work per benchmark.
+
+    Returns:
+        dict[str, object]: Results in the baseline format written by save_results().
+    """
+    import platform
+    names = [name for name in BENCHMARKS
+             if not selected or any(name == prefix or name.startswith(prefix + ".") for prefix in selected)]
+    results: dict[str, dict[str, float]] = {}
+    skipped: dict[str, str] = {}
+    with contextlib.ExitStack() as stack:
+        display: str | None | bool = False
+        for name in names:
+            setup, repeat, needs_display = BENCHMARKS[name]
+            if needs_display and display is False:
+                display = stack.enter_context(virtual_display())
+            try:
+                if needs_display and display is None:
+                    raise BenchmarkSkipped("no display and Xvfb is not installed")
+                body, operations = setup(scale)
+            except (BenchmarkSkipped, ImportError) as exc:
+                skipped[name] = str(exc)
+                print(f"{name:<26} skipped: {exc}", flush=True)
+                continue
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                body()
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            best = timings[0]
+            results[name] = {"operations": operations, "best_s": best, "median_s": timings[len(timings) // 2],
+                             "ns_per_op": best * 1e9 / operations, "ops_per_s": operations / best}
+            print(f"{name:<26} {operations:>11,} ops  {best * 1000:>10.1f} ms  "
+                  f"{_format_rate(results[name]['ns_per_op'])}", flush=True)
+    return {"version": RESULTS_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "platform": platform.platform(), "scale": scale,
+            "results": results, "skipped": skipped}
+
+
+def _format_rate(ns_per_op: float) -> str:
+    if ns_per_op >= 1e6:
+        return f"{ns_per_op / 1e6:10.2f} ms/op"
+    if ns_per_op >= 1e3:
+        return f"{ns_per_op / 1e3:10.2f} us/op"
+    return f"{ns_per_op:10.1f} ns/op"
+
+
+def save_results(results: dict[str, object], path: str) -> None:
+    """Writes benchmark results as a JSON baseline."""
+    import json
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+        output.write("\n")
+
+
+def load_results(path: str) -> dict[str, object]:
+    """
+    Reads a baseline written by save_results().
+
+    Raises:
+        ValueError: If the file is not a supported baseline.
+    """
+    import json
+    with open(path, encoding="utf-8") as source:
+        data = json.load(source)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark results version {data.get('version')!r}.")
+    return data
+
+
+def compare_results(baseline: dict[str, object], current: dict[str, object], threshold: float = 0.10) -> bool:
+    """
+    Prints the change in time per operation for every benchmark in both runs.
+
+    Args:
+        baseline (dict[str, object]): Earlier results.
+        current (dict[str, object]): New results.
+        threshold (float): Allowed slowdown as a fraction (0.10 = 10% slower).
+
+    Returns:
+        bool: True when no benchmark regressed beyond the threshold.
+    """
+    old, new = baseline["results"], current["results"]
+    if baseline.get("scale") != current.get("scale"):
+        print(f"Note: baseline scale {baseline.get('scale')} differs from current scale {current.get('scale')}.")
+    regressions = []
+    print(f"{'benchmark':<26} {'baseline':>15} {'current':>15} {'change':>8}")
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            where = "baseline" if name not in old else "current run"
+            print(f"{name:<26} {'(missing from ' + where + ')':>40}")
+            continue
+        before, after = old[name]["ns_per_op"], new[name]["ns_per_op"]
+        change = after / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<26} {_format_rate(before)} {_format_rate(after)} {change:>+8.1%}{flag}")
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than {threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        return False
+    print(f"No regressions beyond {threshold:.0%}.")
+    return True
@@ -0,0 +1,414 @@
+"""
+Calculator Engine
+-----------------
+Arithmetic behind Chapter 2: Simple Calculator in Python-Book-1.py: the
+single-operation core, a vectorized batch evaluator with a streaming CSV mode,
+and a safe, cached expression compiler. Also the worker jobs of the GUI
+calculator (Python-Book-1-2.py), which live in this importable module so
+that they can be sent to a worker process under any start method.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, NamedTuple, TextIO
+
+
+CALCULATOR_OPERATIONS: dict[str, tuple[str, str]] = {
+    '1': ('Addition', '+'),
+    '2': ('Subtraction', '-'),
+    '3': ('Multiplication', '*'),
+    '4': ('Division', '/'),
+}
+
+
+def calculate(num1: float, op_symbol: str, num2: float) -> float:
+    """
+    Applies one calculator operation to two numbers.
+
+    Args:
+        num1 (float): Left operand.
+        op_symbol (str): One of '+', '-', '*' or '/'.
+        num2 (float): Right operand.
+
+    Raises:
+        ZeroDivisionError: When dividing by zero.
+        ValueError: When the operator is not supported.
+    """
+    if op_symbol == '+':
+        return num1 + num2
+    if op_symbol == '-':
+        return num1 - num2
+    if op_symbol == '*':
+        return num1 * num2
+    if op_symbol == '/':
+        return num1 / num2
+    raise ValueError(f"Unsupported operator: {op_symbol!r}")
+
+
+class BatchResult(NamedTuple):
+    """
+    Column-wise output of calculate_batch.
+
+    Attributes:
+        values: One result per row (NaN where the row failed).
+        zero_division: True for rows that divided by zero.
+        invalid: True for rows with an unsupported operator.
+    """
+    values: Sequence[float]
+    zero_division: Sequence[bool]
+    invalid: Sequence[bool]
+
+
+def _load_numpy() -> Any:
+    """Returns the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def calculate_batch(num1: Sequence[float], operators: Sequence[str], num2: Sequence[float]) -> BatchResult:
+    """
+    Evaluates whole columns of calculator operations at once.
+
+    With NumPy installed the columns are evaluated with one vectorized kernel
+    per operator and NumPy arrays are returned; otherwise a pure-Python kernel
+    returns ``array('d')`` values and lists of flags. Failing rows never abort
+    the batch: they yield NaN and are flagged in the result masks.
+
+    Args:
+        num1 (Sequence[float]): Left operands (list, array or NumPy array).
+        operators (Sequence[str]): One of '+', '-', '*', '/' per row.
+        num2 (Sequence[float]): Right operands.
+
+    Returns:
+        BatchResult: Values plus per-row division-by-zero and invalid masks.
+    """
+    if not len(num1) == len(operators) == len(num2):
+        raise ValueError("Operand and operator columns must have the same length.")
+    np = _load_numpy()
+    if np is not None:
+        left = np.asarray(num1, dtype=np.float64)
+        right = np.asarray(num2, dtype=np.float64)
+        ops = np.asarray(operators)
+        values = np.full(left.shape, np.nan)
+        zero_division = (ops == '/') & (right == 0)
+        invalid = np.ones(left.shape, dtype=bool)
+        kernels = {'+': np.add, '-': np.subtract, '*': np.multiply, '/': np.divide}
+        for symbol, kernel in kernels.items():
+            rows = ops == symbol
+            if symbol == '/':
+                rows &= ~zero_division
+            kernel(left, right, out=values, where=rows)
+            invalid &= ops != symbol
+        return BatchResult(values, zero_division, invalid)
+
+    nan = float("nan")
+    values = array("d", bytes(8 * len(num1)))
+    zero_division = [False] * len(num1)
+    invalid = [False] * len(num1)
+    for row, (a, symbol, b) in enumerate(zip(num1, operators, num2)):
+        try:
+            values[row] = calculate(a, symbol, b)
+        except ZeroDivisionError:
+            values[row], zero_division[row] = nan, True
+        except ValueError:
+            values[row], invalid[row] = nan, True
+    return BatchResult(values, zero_division, invalid)
+
+
+def stream_calculator_csv(source: Iterable[str], sink: TextIO, chunk_size: int = 65_536,
+                          on_chunk: Callable[[dict[str, int]], bool] | None = None) -> dict[str, int]:
+    """
+    Evaluates a CSV of ``num1,operator,num2`` rows in bounded-size chunks.
+
+    Rows are read, evaluated with calculate_batch and written back out one
+    chunk at a time, so memory use depends on chunk_size rather than on the
+    size of the input. An optional header row and blank rows are skipped.
+    The output has the columns ``num1,operator,num2,result,error`` where
+    error is empty, or one of "division by zero", "invalid operator" or
+    "invalid number".
+
+    Args:
+        source (Iterable[str]): Input CSV stream, or any iterable of its lines.
+        sink (TextIO): Output CSV stream.
+        chunk_size (int): Rows evaluated per batch.
+        on_chunk (Callable[[dict[str, int]], bool] | None): Called with the
+            running totals after each chunk is written; returning False
+            stops before the next chunk.
+
+    Returns:
+        dict[str, int]: Row counts for "rows", "zero_division" and "invalid".
+    """
+    import csv
+    import itertools
+    reader = csv.reader(source)
+    writer = csv.writer(sink, lineterminator="\n")
+    writer.writerow(["num1", "operator", "num2", "result", "error"])
+    totals = {"rows": 0, "zero_division": 0, "invalid": 0}
+    first_chunk = True
+    while True:
+        chunk = list(itertools.islice(reader, chunk_size))
+        if not chunk:
+            return totals
+        rows = [row for row in chunk if any(field.strip() for field in row)]
+        if first_chunk and rows and rows[0][0].strip().lower() == "num1":
+            rows = rows[1:]
+        first_chunk = first_chunk and not rows
+        left, ops, right, unparsable = [], [], [], []
+        for row in rows:
+            try:
+                a, symbol, b = row
+                left.append(float(a))
+                right.append(float(b))
+                ops.append(symbol.strip())
+                unparsable.append(False)
+            except ValueError:
+                left.append(0.0)
+                right.append(0.0)
+                ops.append('?')
+                unparsable.append(True)
+        result = calculate_batch(left, ops, right)
+        output = []
+        for row, value, zero, bad, unparsed in zip(rows, result.values, result.zero_division,
+                                                  result.invalid, unparsable):
+            if unparsed:
+                output.append([*row, "", "invalid number"])
+                totals["invalid"] += 1
+            elif zero:
+                output.append([*row, "", "division by zero"])
+                totals["zero_division"] += 1
+            elif bad:
+                output.append([*row, "", "invalid operator"])
+                totals["invalid"] += 1
+            else:
+                output.append([*row, repr(float(value)), ""])
+        writer.writerows(output)
+        totals["rows"] += len(rows)
+        if on_chunk is not None and not on_chunk(totals):
+            return totals
+
+
+def run_calculator_batch(input_path: str, output_path: str = "-", chunk_size: int = 65_536) -> None:
+    """
+    CLI mode for the batch calculator (``--calc-batch``).
+
+    Args:
+        input_path (str): CSV file to read, or '-' for standard input.
+        output_path (str): CSV file to write, or '-' for standard output.
+        chunk_size (int): Rows evaluated per batch.
+    """
+    import sys
+    import time
+    start = time.perf_counter()
+    source = sys.stdin if input_path == "-" else open(input_path, newline="")
+    sink = sys.stdout if output_path == "-" else open(output_path, "w", newline="")
+    try:
+        totals = stream_calculator_csv(source, sink, chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"Processed {totals['rows']} rows in {elapsed:.2f}s "
+          f"({totals['zero_division']} divisions by zero, {totals['invalid']} invalid rows).",
+          file=sys.stderr)
+
+
+class CompiledExpression:
+    """
+    A validated arithmetic expression compiled once and evaluated many times.
+
+    Only numbers, variable names, parentheses, unary +/- and the binary
+    operators + - * / // % are accepted, so evaluating an expression can never
+    call functions or touch attributes.
+    """
+
+    __slots__ = ("text", "variables", "_code")
+
+    _ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load,
+                      ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.UAdd, ast.USub)
+
+    def __init__(self, text: str) -> None:
+        """
+        Parses and validates an expression.
+
+        Args:
+            text (str): Expression such as "3*(x+2)/y".
+
+        Raises:
+            ValueError: If the expression is malformed or uses unsupported syntax.
+        """
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as exc:
+            raise ValueError(f"Invalid expression: {exc.msg}") from None
+        for node in ast.walk(tree):
+            if not isinstance(node, self._ALLOWED_NODES):
+                raise ValueError(f"Unsupported syntax in expression: {type(node).__name__}")
+            if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+                raise ValueError(f"Unsupported constant in expression: {node.value!r}")
+        self.text = text
+        self.variables = frozenset(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+        self._code = compile(tree, "<expression>", "eval")
+
+    def __call__(self, **bindings: float) -> float:
+        """
+        Evaluates the expression with the given variable values.
+
+        Raises:
+            ValueError: If a variable has no value.
+            ZeroDivisionError: When the expression divides by zero.
+        """
+        missing = self.variables.difference(bindings)
+        if missing:
+            raise ValueError(f"No value for: {', '.join(sorted(missing))}")
+        return eval(self._code, {"__builtins__": {}}, bindings)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(text: str) -> CompiledExpression:
+    """
+    Returns the compiled form of an expression, reusing it on repeated calls.
+
+    The cache is keyed on the expression text, so evaluating one formula
+    across many variable bindings parses it only once.
+    """
+    return CompiledExpression(text)
+
+
+OPERATION_SYMBOLS = {"Addition": "+", "Subtraction": "-", "Multiplication": "*", "Division": "/"}
+# Largest number of significant digits shown in the result label.
+SHOWN_DIGITS = 30
+
+
+def high_precision_job(num1_text: str, operation: str, num2_text: str, expression: str,
+                       digits: int, report, cancelled) -> str:
+    """
+    Worker job: evaluates one operation or expression with decimal arithmetic.
+
+    The numbers arrive as the text typed into the window and are parsed
+    here, so no precision is lost to floats and numbers too large for a
+    float are accepted. A single multiplication of two multi-million-digit numbers is
+    one long C call that cannot check for cancellation, which is why jobs
+    run in a process that Cancel can terminate.
+
+    Returns:
+        str: The result text for the result label.
+    """
+    import decimal
+    report(0, 0)
+    context = decimal.Context(prec=digits, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    with decimal.localcontext(context):
+        try:
+            num1, num2 = decimal.Decimal(num1_text.strip()), decimal.Decimal(num2_text.strip())
+        except decimal.InvalidOperation:
+            raise ValueError("Please enter valid numeric values.") from None
+        if operation == "Expression":
+            try:
+                result = compile_expression(expression)(x=num1, y=num2)
+            except TypeError:
+                raise ValueError("High-precision expressions accept whole-number constants only.") from None
+            label = expression
+        else:
+            op_symbol = OPERATION_SYMBOLS[operation]
+            result = {"+": num1.__add__, "-": num1.__sub__, "*": num1.__mul__, "/": num1.__truediv__}[op_symbol](num2)
+            label = f"x {op_symbol} y"
+    report(1, 1)
+    significant = len(result.as_tuple().digits)
+    shown = format(result, f".{SHOWN_DIGITS - 1}e") if significant > SHOWN_DIGITS else str(result)
+    return f"{label} = {shown} ({significant:,} digits)"
+
+
+def batch_job(input_path: str, output_path: str, report, cancelled) -> str:
+    """
+    Worker job: evaluates a CSV of num1,operator,num2 rows into a results CSV.
+
+    Rows are evaluated by stream_calculator_csv, exactly like the
+    --calc-batch mode, so files of any size use the same memory. Progress is
+    reported by bytes read; cancellation is checked after every chunk of
+    4,096 rows and removes the partial output.
+
+    Returns:
+        str: A summary for the result label.
+    """
+    import os
+    import time
+    total = os.path.getsize(input_path)
+    last_report = 0.0
+
+    def next_chunk(totals: dict[str, int]) -> bool:
+        nonlocal last_report
+        if cancelled():
+            return False
+        now = time.perf_counter()
+        if now - last_report >= 0.1:
+            report(source.tell(), total)
+            last_report = now
+        return True
+
+    with open(input_path, newline="") as source, open(output_path, "w", newline="") as sink:
+        # Lines are read with readline() rather than by iteration, which keeps tell() usable for progress.
+        totals = stream_calculator_csv(iter(source.readline, ""), sink, 4096, next_chunk)
+    if cancelled():
+        os.remove(output_path)
+        return f"Batch cancelled after {totals['rows']:,} rows."
+    report(total, total)
+    errors = totals["zero_division"] + totals["invalid"]
+    return f"{totals['rows']:,} rows ({errors:,} errors) written to {os.path.basename(output_path)}"
+
+
+def run_job(job, args: tuple, messages, cancel_event) -> None:
+    """
+    Entry point of the worker process: runs the job and posts messages back.
+
+    Args:
+        job: A job function from this module, called as job(*args, report, cancelled).
+        args (tuple): The job's arguments.
+        messages: Queue receiving ("progress", done, total), ("done", result)
+            or ("error", message) tuples.
+        cancel_event: Event set when the job should stop.
+    """
+    def report(done: int, total: int) -> None:
+        messages.put(("progress", done, total))
+    try:
+        result = job(*args, report, cancel_event.is_set)
+    except ZeroDivisionError:
+        messages.put(("error", "Division by zero is not allowed!"))
+    except (ValueError, OSError) as exc:
+        messages.put(("error", str(exc)))
+    except ArithmeticError:
+        messages.put(("error", "The result is undefined."))
+    else:
+        messages.put(("done", result))
+
+
+def benchmark_expression_cache(expression: str = "3*(x+2)/y", evaluations: int = 100_000) -> dict[str, float]:
+    """
+    Compares evaluation throughput with and without the compiled-expression cache.
+
+    Args:
+        expression (str): Formula to evaluate with x and y bound.
+        evaluations (int): Number of bindings evaluated in each mode.
+
+    Returns:
+        dict[str, float]: Evaluations per second for "cached" and "uncached".
+    """
+    import time
+    timings: dict[str, float] = {}
+    for mode, compiler in (("uncached", CompiledExpression), ("cached", compile_expression)):
+        start = time.perf_counter()
+        for i in range(evaluations):
+            compiler(expression)(x=float(i), y=float(i % 7 + 1))
+        timings[mode] = evaluations / (time.perf_counter() - start)
+    print(f"Expression: {expression}")
+    for mode, rate in timings.items():
+        print(f"  {mode:>8}: {rate:,.0f} evaluations/s")
+    print(f"  speed-up: {timings['cached'] / timings['uncached']:.1f}x")
+    return timings
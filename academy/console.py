@@ -0,0 +1,281 @@
+"""
+Console I/O for the Chapter Programs
+------------------------------------
+The chapters in Python-Book-1.py never call input() or print() directly. They
+are coroutines that talk to a Console, which lets the same chapter code run
+interactively, from a script, under a recorder or inside an event loop.
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import sys
+from collections.abc import Callable, Collection, Coroutine, Iterable, Iterator, Sequence
+from typing import TypeVar
+
+Row = TypeVar("Row")
+
+PAGE_SIZE = 20
+
+
+class Console:
+    """
+    Interactive console used by every chapter: replies come from input() and
+    output goes to standard output, exactly as in the original scripts.
+
+    Chapters are coroutines that ``await console.input(prompt)``. Consoles like
+    this one answer immediately, so run_sync() can drive a chapter without an
+    event loop; a console that has to wait for a reply (e.g. a network
+    connection) can suspend the chapter instead.
+    """
+
+    def __init__(self, output: io.TextIOBase | None = None) -> None:
+        self.output = output if output is not None else sys.stdout
+
+    def write(self, text: str) -> None:
+        self.output.write(text)
+
+    def print(self, *values: object, sep: str = " ", end: str = "\n") -> None:
+        """Writes values like the built-in print()."""
+        self.write(sep.join(map(str, values)) + end)
+
+    async def input(self, prompt: str = "") -> str:
+        """Shows the prompt and returns the user's reply without the newline."""
+        return input(prompt)
+
+    def flush(self) -> None:
+        self.output.flush()
+
+    def count(self, operation: str) -> None:
+        """Notes that a chapter performed an operation (e.g. "todo.add"); ignored unless instrumented."""
+
+    def section(self, name: str) -> _NoSection:
+        """Context manager marking a stretch of the session as one menu section; a no-op here."""
+        return _NO_SECTION
+
+
+class _NoSection:
+    """Stand-in for an instrumentation section when nothing is measured."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSection:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NO_SECTION = _NoSection()
+
+
+class ScriptedConsole(Console):
+    """
+    Console that answers prompts from a prepared list of replies.
+
+    Prompts are echoed to the output (replies are not, matching a run with
+    piped standard input), and output is collected in memory and written in
+    large blocks. EOFError is raised once the replies run out.
+    """
+
+    def __init__(self, replies: Iterable[str], output: io.TextIOBase | None = None,
+                 buffer_size: int = 1 << 16) -> None:
+        """
+        Args:
+            replies (Iterable[str]): One reply per prompt; trailing newlines are removed.
+            output (io.TextIOBase | None): Destination stream (default: standard output).
+            buffer_size (int): Characters collected before each write.
+        """
+        super().__init__(output)
+        self._replies = iter(replies)
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._buffer_size = buffer_size
+
+    def write(self, text: str) -> None:
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    async def input(self, prompt: str = "") -> str:
+        self.write(prompt)
+        reply = next(self._replies, None)
+        if reply is None:
+            raise EOFError("No more scripted replies.")
+        return reply.rstrip("\r\n")
+
+    def flush(self) -> None:
+        self.output.write("".join(self._buffer))
+        self.output.flush()
+        self._buffer.clear()
+        self._buffered = 0
+
+
+class RecordingConsole(Console):
+    """
+    Wraps another console and records a session for deterministic replay.
+
+    Every reply is kept in order together with a SHA-256 digest of everything
+    shown to the user. With the seed used for ``random`` this is enough to
+    replay the session exactly (see load_transcript()).
+    """
+
+    TRANSCRIPT_VERSION = 1
+
+    def __init__(self, inner: Console, seed: int) -> None:
+        super().__init__(inner.output)
+        import hashlib
+        self.inner = inner
+        self.seed = seed
+        self.replies: list[str] = []
+        self._digest = hashlib.sha256()
+
+    def write(self, text: str) -> None:
+        self._digest.update(text.encode())
+        self.inner.write(text)
+
+    async def input(self, prompt: str = "") -> str:
+        self._digest.update(prompt.encode())
+        reply = await self.inner.input(prompt)
+        self.replies.append(reply)
+        return reply
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def count(self, operation: str) -> None:
+        self.inner.count(operation)
+
+    def section(self, name: str) -> object:
+        return self.inner.section(name)
+
+    @property
+    def output_digest(self) -> str:
+        return self._digest.hexdigest()
+
+    def save(self, path: str) -> None:
+        """Writes the transcript as JSON."""
+        import json
+        with open(path, "w", encoding="utf-8") as transcript:
+            json.dump({"version": self.TRANSCRIPT_VERSION, "seed": self.seed,
+                       "replies": self.replies, "output_sha256": self.output_digest}, transcript)
+
+
+def load_transcript(path: str) -> dict[str, object]:
+    """
+    Reads a transcript written by RecordingConsole.save().
+
+    Raises:
+        ValueError: If the file is not a supported transcript.
+    """
+    import json
+    with open(path, encoding="utf-8") as transcript:
+        data = json.load(transcript)
+    if data.get("version") != RecordingConsole.TRANSCRIPT_VERSION:
+        raise ValueError(f"{path}: unsupported transcript version {data.get('version')!r}.")
+    return data
+
+
+class LazyRows(Sequence[Row]):
+    """
+    Read-only sequence over a collection that can only be iterated, such as
+    a to-do list or a contact store, for page_through().
+
+    A slice walks the collection only as far as its last row, and a slice
+    that starts where the previous one ended continues the same iteration,
+    so paging forward touches each row once and nothing past the page on
+    screen is read. Going back restarts the iteration from the first row.
+    The collection must not change while the rows are in use.
+    """
+
+    def __init__(self, collection: Collection[Row]) -> None:
+        self._collection = collection
+        self._length = len(collection)
+        self._iterator: Iterator[Row] | None = None
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            position = index + self._length if index < 0 else index
+            if not 0 <= position < self._length:
+                raise IndexError(index)
+            return self[position:position + 1][0]
+        start, stop, step = index.indices(self._length)
+        if step != 1:
+            return list(itertools.islice(self._collection, start, stop, step))
+        if self._iterator is None or start < self._position:
+            self._iterator, self._position = iter(self._collection), 0
+        rows = list(itertools.islice(self._iterator, start - self._position, max(stop - self._position, 0)))
+        self._position = max(start, self._position) + len(rows)
+        return rows
+
+
+async def page_through(console: Console, rows: Sequence[Row], render: Callable[[Row], str], prompt: str,
+                       page_size: int = PAGE_SIZE, always_ask: bool = True) -> str:
+    """
+    Shows a long listing one page at a time and returns the user's answer.
+
+    Only the rows of the visible page are rendered, and each page goes out in
+    a single console write. ``rows`` must support slicing: a list jumps to
+    any page at the cost of showing the next one, and a LazyRows view of a
+    collection reads only as far as the page on screen. Replies "n" and "p" move to
+    the next and previous page and "g N" jumps to page N; any other reply is
+    returned to the caller.
+
+    Args:
+        console (Console): Where pages are shown and replies come from.
+        rows (Sequence[Row]): The listing, e.g. a list of tasks.
+        render (Callable[[Row], str]): Formats one row as one line.
+        prompt (str): Question asked below the page, e.g. "Enter task
+            number to remove: "; the navigation keys are added to it when
+            there is more than one page.
+        page_size (int): Rows per page.
+        always_ask (bool): When False and everything fits on one page, the
+            page is shown and "" is returned without asking.
+
+    Returns:
+        str: The first reply that is not a navigation command, stripped.
+    """
+    pages = max(1, -(-len(rows) // page_size))
+    question = prompt.rstrip().rstrip(":?").rstrip()
+    page = 0
+    while True:
+        start = page * page_size
+        lines = [render(row) for row in rows[start:start + page_size]]
+        if pages > 1:
+            lines.append(f"-- Page {page + 1} of {pages} "
+                         f"(rows {start + 1}-{start + len(lines)} of {len(rows)}) --")
+        console.write("\n".join(lines) + "\n" if lines else "")
+        if pages == 1:
+            return (await console.input(prompt)).strip() if always_ask else ""
+        reply = (await console.input(f"{question} or [n]ext, [p]revious, [g N] go to page: ")).strip()
+        command, _, argument = reply.lower().partition(" ")
+        if command == "n":
+            page = min(page + 1, pages - 1)
+        elif command == "p":
+            page = max(page - 1, 0)
+        elif command == "g" and argument.strip().isdigit():
+            page = min(max(int(argument) - 1, 0), pages - 1)
+        else:
+            return reply
+
+
+def run_sync(coroutine: Coroutine[object, object, object]) -> object:
+    """
+    Runs a chapter coroutine whose console never suspends.
+
+    Raises:
+        RuntimeError: If the coroutine waits on something only an event loop
+            could provide.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("The chapter suspended; drive it with an asyncio event loop instead.")
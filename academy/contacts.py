@@ -0,0 +1,1295 @@
+"""
+Contact Storage and Search
+--------------------------
+Storage backends, the search index and the streaming CSV/vCard import and
+export behind Chapter 6: Simple Contact Manager in Python-Book-1.py.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from typing import TextIO
+
+
+class ContactStore(MutableMapping[str, str]):
+    """
+    Base class for the contact storage backends used by the Contact Manager.
+
+    A store behaves like the ``dict[str, str]`` of name -> phone number that
+    Chapter 6 has always used, so the menu code reads the same for every
+    backend. Stores can be used as context managers; ``close()`` releases any
+    files held by the backend.
+    """
+
+    _BLOB_LENGTH = struct.Struct("<Q")
+
+    def sync(self) -> None:
+        """Flushes pending writes to durable storage (no-op for memory stores)."""
+
+    def close(self) -> None:
+        """Releases resources held by the store (no-op for memory stores)."""
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes every contact: the length of the names blob, then the
+        names and the phone numbers as UTF-8 text, each followed by a NUL.
+
+        Raises:
+            ValueError: If a name or phone number contains a NUL character.
+        """
+        names = list(self)
+        name_blob = "".join([f"{name}\0" for name in names]).encode()
+        phone_blob = "".join([f"{self[name]}\0" for name in names]).encode()
+        if name_blob.count(0) != len(names) or phone_blob.count(0) != len(names):
+            raise ValueError("Contact names and phone numbers cannot contain NUL characters.")
+        return self._BLOB_LENGTH.pack(len(name_blob)) + name_blob + phone_blob
+
+    @staticmethod
+    def _unpack_contacts(data: bytes | memoryview) -> tuple[list[str], list[str]]:
+        view = memoryview(data)
+        try:
+            (length,) = ContactStore._BLOB_LENGTH.unpack_from(view)
+            start = ContactStore._BLOB_LENGTH.size
+            if start + length > len(view):
+                raise ValueError("truncated contact list")
+            names = str(view[start:start + length], "utf-8").split("\0")[:-1]
+            phones = str(view[start + length:], "utf-8").split("\0")[:-1]
+        except (struct.error, UnicodeDecodeError):
+            raise ValueError("not a serialized contact list") from None
+        if len(names) != len(phones):
+            raise ValueError("not a serialized contact list")
+        return names, phones
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "ContactStore":
+        """
+        Builds a store holding the contacts saved with to_bytes().
+
+        Raises:
+            ValueError: If the data is not a serialized contact list.
+        """
+        store = cls()
+        store.update(zip(*cls._unpack_contacts(data)))
+        return store
+
+    def __enter__(self) -> "ContactStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class InMemoryContactStore(ContactStore):
+    """
+    Keeps contacts in a plain dictionary, exactly like the original chapter.
+    Contacts disappear when the store is discarded.
+    """
+
+    def __init__(self) -> None:
+        self._contacts: dict[str, str] = {}
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "InMemoryContactStore":
+        store = cls()
+        store._contacts = dict(zip(*cls._unpack_contacts(data)))
+        return store
+
+    def __getitem__(self, name: str) -> str:
+        return self._contacts[name]
+
+    def __setitem__(self, name: str, phone: str) -> None:
+        self._contacts[name] = phone
+
+    def __delitem__(self, name: str) -> None:
+        del self._contacts[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._contacts
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._contacts)
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+
+class DiskContactStore(ContactStore):
+    """
+    Persists contacts in an append-only log with an on-disk hash index.
+
+    Layout:
+      * ``PATH`` is the log. After a 16-byte header (magic + generation id) it
+        holds one record per add or delete:
+        ``crc32 | op | name length | phone length | name | phone``.
+      * ``PATH.hint`` is a snapshot of the hash index, written on close and
+        after compaction. It is an open-addressing table of record offsets plus
+        a parallel table of name fingerprints, stored as raw ``array`` bytes so
+        reopening a store only costs two bulk reads, whatever its size.
+
+    Lookups hash the name, probe the table and read a single record from the
+    log, so add, search and delete stay O(1). Overwritten and deleted records
+    are counted as dead; once they outnumber the live contacts the log is
+    compacted into a fresh generation.
+
+    Writes are buffered; call ``sync()`` to force them to disk. A torn record
+    at the end of the log (e.g. after a crash) is detected by its checksum and
+    discarded on the next open.
+    """
+
+    _MAGIC = b"ID01TCS1"
+    _HINT_MAGIC = b"ID01TCH1"
+    _HEADER = struct.Struct("<8s8s")
+    _HINT_HEADER = struct.Struct("<8s8sQQQQ")
+    _RECORD = struct.Struct("<IBHH")
+    _PUT, _DELETE = 1, 2
+    _EMPTY, _TOMBSTONE = 0, -1
+    _MIN_CAPACITY = 1024
+    _MIN_DEAD_FOR_COMPACTION = 10_000
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens (or creates) the store at the given path.
+
+        Args:
+            path (str): Location of the log file; the index hint lives beside it.
+        """
+        self.path = path
+        self.hint_path = path + ".hint"
+        self._dead = 0
+        if not os.path.exists(path) or os.path.getsize(path) < self._HEADER.size:
+            self._create_log(path, os.urandom(8))
+        with open(path, "rb") as log:
+            magic, self._generation = self._HEADER.unpack(log.read(self._HEADER.size))
+        if magic != self._MAGIC:
+            raise ValueError(f"{path} is not an iD01t contact store.")
+        self._log_size = os.path.getsize(path)
+        replay_from = self._load_hint()
+        self._writer = open(path, "ab")
+        self._reader = open(path, "rb", buffering=0)
+        self._pending = False
+        self._replay(replay_from)
+
+    # -- Index -------------------------------------------------------------
+
+    def _reset_index(self, capacity: int) -> None:
+        self._slots = array("q", bytes(8 * capacity))
+        self._fingerprints = array("I", bytes(4 * capacity))
+        self._mask = capacity - 1
+        self._count = 0
+        self._used = 0
+
+    def _load_hint(self) -> int:
+        """Loads the index snapshot; returns the log offset to replay from."""
+        try:
+            with open(self.hint_path, "rb") as hint:
+                header = hint.read(self._HINT_HEADER.size)
+                magic, generation, log_size, count, dead, capacity = self._HINT_HEADER.unpack(header)
+                if magic != self._HINT_MAGIC or generation != self._generation or log_size > self._log_size:
+                    raise ValueError("stale hint")
+                slots, fingerprints = array("q"), array("I")
+                slots.fromfile(hint, capacity)
+                fingerprints.fromfile(hint, capacity)
+                checksum = int.from_bytes(hint.read(4), "little")
+            if zlib.crc32(fingerprints, zlib.crc32(slots)) != checksum:
+                raise ValueError("corrupt hint")
+        except (OSError, ValueError, EOFError, struct.error):
+            self._reset_index(self._MIN_CAPACITY)
+            return self._HEADER.size
+        self._slots, self._fingerprints = slots, fingerprints
+        self._mask = capacity - 1
+        self._count, self._dead = count, dead
+        self._used = capacity - slots.count(self._EMPTY)
+        return log_size
+
+    def _write_hint(self) -> None:
+        """Writes the index snapshot atomically next to the log."""
+        tmp_path = self.hint_path + ".tmp"
+        checksum = zlib.crc32(self._fingerprints, zlib.crc32(self._slots))
+        with open(tmp_path, "wb") as hint:
+            hint.write(self._HINT_HEADER.pack(self._HINT_MAGIC, self._generation, self._log_size,
+                                              self._count, self._dead, len(self._slots)))
+            self._slots.tofile(hint)
+            self._fingerprints.tofile(hint)
+            hint.write(checksum.to_bytes(4, "little"))
+        os.replace(tmp_path, self.hint_path)
+
+    def _lookup(self, key: bytes) -> tuple[int, int]:
+        """
+        Finds the table slot for a name.
+
+        Returns:
+            tuple[int, int]: (slot, record offset) when the name is present, or
+            (free slot to insert into, -1) when it is not.
+        """
+        fingerprint = zlib.crc32(key)
+        slots, fingerprints, mask = self._slots, self._fingerprints, self._mask
+        index = fingerprint & mask
+        free = -1
+        while True:
+            offset = slots[index]
+            if offset == self._EMPTY:
+                return (index if free < 0 else free), -1
+            if offset == self._TOMBSTONE:
+                if free < 0:
+                    free = index
+            elif fingerprints[index] == fingerprint and self._read_record(offset)[1] == key:
+                return index, offset
+            index = (index + 1) & mask
+
+    def _insert(self, key: bytes, offset: int) -> None:
+        slot, old = self._lookup(key)
+        if old >= 0:
+            self._slots[slot] = offset
+            self._dead += 1
+            return
+        if self._slots[slot] == self._EMPTY:
+            self._used += 1
+        self._slots[slot] = offset
+        self._fingerprints[slot] = zlib.crc32(key)
+        self._count += 1
+        if self._used * 3 > len(self._slots) * 2:
+            self._rehash()
+
+    def _remove(self, key: bytes) -> bool:
+        """Drops a name from the table, counting its record as dead."""
+        slot, old = self._lookup(key)
+        if old < 0:
+            return False
+        self._slots[slot] = self._TOMBSTONE
+        self._count -= 1
+        self._dead += 1
+        return True
+
+    def _rehash(self) -> None:
+        """Rebuilds the table, dropping tombstones and growing it if needed."""
+        old_slots, old_fingerprints, count = self._slots, self._fingerprints, self._count
+        capacity = self._MIN_CAPACITY
+        while capacity < count * 2:
+            capacity *= 2
+        self._reset_index(capacity)
+        slots, fingerprints, mask = self._slots, self._fingerprints, self._mask
+        for offset, fingerprint in zip(old_slots, old_fingerprints):
+            if offset > 0:
+                index = fingerprint & mask
+                while slots[index]:
+                    index = (index + 1) & mask
+                slots[index] = offset
+                fingerprints[index] = fingerprint
+        self._count = self._used = count
+
+    # -- Log ---------------------------------------------------------------
+
+    @classmethod
+    def _create_log(cls, path: str, generation: bytes) -> None:
+        with open(path, "wb") as log:
+            log.write(cls._HEADER.pack(cls._MAGIC, generation))
+
+    @classmethod
+    def _encode(cls, op: int, key: bytes, value: bytes = b"") -> bytes:
+        if len(key) > 0xFFFF or len(value) > 0xFFFF:
+            raise ValueError("Contact names and phone numbers must be shorter than 64 KiB.")
+        body = cls._RECORD.pack(0, op, len(key), len(value))[4:] + key + value
+        return zlib.crc32(body).to_bytes(4, "little") + body
+
+    def _read_record(self, offset: int) -> tuple[int, bytes, bytes]:
+        """Reads the record at the given log offset as (op, name, phone)."""
+        if self._pending:
+            self._writer.flush()
+            self._pending = False
+        self._reader.seek(offset)
+        data = self._reader.read(256)
+        _, op, key_len, value_len = self._RECORD.unpack_from(data)
+        end = self._RECORD.size + key_len + value_len
+        if end > len(data):
+            data += self._reader.read(end - len(data))
+        return op, data[self._RECORD.size:self._RECORD.size + key_len], data[self._RECORD.size + key_len:end]
+
+    def _append(self, record: bytes) -> int:
+        offset = self._log_size
+        self._writer.write(record)
+        self._log_size += len(record)
+        self._pending = True
+        return offset
+
+    def _scan(self, start: int, chunk_size: int = 1 << 20) -> Iterator[tuple[int, int, bytes, bytes]]:
+        """Yields (offset, op, name, phone) for every intact record from start."""
+        if self._pending:
+            self._writer.flush()
+            self._pending = False
+        header_size = self._RECORD.size
+        with open(self.path, "rb") as log:
+            log.seek(start)
+            data = b""
+            base = start
+            while True:
+                chunk = log.read(chunk_size)
+                if not chunk:
+                    return
+                data += chunk
+                position = 0
+                while position + header_size <= len(data):
+                    checksum, op, key_len, value_len = self._RECORD.unpack_from(data, position)
+                    end = position + header_size + key_len + value_len
+                    if end > len(data):
+                        break
+                    if zlib.crc32(data[position + 4:end]) != checksum:
+                        return
+                    key_end = position + header_size + key_len
+                    yield base + position, op, data[position + header_size:key_end], data[key_end:end]
+                    position = end
+                data = data[position:]
+                base += position
+
+    def _replay(self, start: int) -> None:
+        """Applies log records written after the index snapshot."""
+        end = start
+        for offset, op, key, value in self._scan(start):
+            if op == self._PUT:
+                self._insert(key, offset)
+            else:
+                self._remove(key)
+            end = offset + self._RECORD.size + len(key) + len(value)
+        if end < self._log_size:
+            # Drop a torn or corrupt tail so new records follow intact ones.
+            self._writer.truncate(end)
+            self._log_size = end
+
+    def compact(self) -> None:
+        """Rewrites the log with only live contacts and refreshes the hint."""
+        tmp_path = self.path + ".compact"
+        generation = os.urandom(8)
+        self._create_log(tmp_path, generation)
+        live: list[tuple[bytes, int]] = []
+        size = self._HEADER.size
+        with open(tmp_path, "ab") as log:
+            for offset, op, key, value in self._scan(self._HEADER.size):
+                if op == self._PUT and self._lookup(key)[1] == offset:
+                    record = self._encode(self._PUT, key, value)
+                    log.write(record)
+                    live.append((key, size))
+                    size += len(record)
+            log.flush()
+            os.fsync(log.fileno())
+        self._writer.close()
+        self._reader.close()
+        os.replace(tmp_path, self.path)
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb", buffering=0)
+        self._generation, self._log_size, self._dead = generation, size, 0
+        capacity = self._MIN_CAPACITY
+        while capacity < len(live) * 2:
+            capacity *= 2
+        self._reset_index(capacity)
+        for key, offset in live:
+            self._insert(key, offset)
+        self._write_hint()
+
+    def _maybe_compact(self) -> None:
+        if self._dead >= self._MIN_DEAD_FOR_COMPACTION and self._dead > self._count:
+            self.compact()
+
+    # -- Mapping interface -------------------------------------------------
+
+    def __getitem__(self, name: str) -> str:
+        offset = self._lookup(name.encode())[1]
+        if offset < 0:
+            raise KeyError(name)
+        return self._read_record(offset)[2].decode()
+
+    def __setitem__(self, name: str, phone: str) -> None:
+        key = name.encode()
+        offset = self._append(self._encode(self._PUT, key, phone.encode()))
+        self._insert(key, offset)
+        self._maybe_compact()
+
+    def __delitem__(self, name: str) -> None:
+        key = name.encode()
+        if not self._remove(key):
+            raise KeyError(name)
+        self._append(self._encode(self._DELETE, key))
+        self._maybe_compact()
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._lookup(name.encode())[1] >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for offset, op, key, _ in self._scan(self._HEADER.size):
+            if op == self._PUT and self._lookup(key)[1] == offset:
+                yield key.decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def sync(self) -> None:
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._pending = False
+
+    def close(self) -> None:
+        if self._writer.closed:
+            return
+        self.sync()
+        self._write_hint()
+        self._writer.close()
+        self._reader.close()
+
+
+class ContactView:
+    """
+    Read-only view of one contact in a CompactContactStore. Views hold only
+    the store and a slot number; the name and phone are decoded on access.
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: "CompactContactStore", slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def name(self) -> str:
+        return self._store._name_at(self._slot)
+
+    @property
+    def phone(self) -> str:
+        return self._store._phone_at(self._slot)
+
+    def __repr__(self) -> str:
+        return f"ContactView({self.name!r}, {self.phone!r})"
+
+
+class CompactContactStore(ContactStore):
+    """
+    Keeps contacts in memory in a handful of flat arrays instead of a dict.
+
+    Layout:
+      * names are UTF-8 encoded back to back in one ``bytearray`` arena;
+        each contact's slot records its offset (``array('Q')``) and length
+        (``array('H')``);
+      * a phone number is split into its ASCII digits and a format, the
+        phone with every digit replaced by '0' ("000-0000" for "555-0100").
+        Formats are stored once per store and numbered; each slot packs its
+        digits as a number in the low 50 bits and the format number above
+        them into one 64-bit integer (``array('Q')``), so "555-0100",
+        "(555) 010-0199" and "+1 555 0100" read back exactly as entered.
+        A phone with more than 15 digits (longer than any E.164 number), or
+        any phone once the store holds 8,192 different formats, is written
+        to the arena right after the name as UTF-8 instead;
+      * an open-addressing hash table of slot numbers (``array('i')``) with
+        a parallel table of 32-bit name hashes finds a name in O(1).
+
+    Deleting a contact frees its slot and leaves its bytes in the arena;
+    once freed slots outnumber live ones the arrays are rebuilt.
+
+    Target: at most 48 bytes per contact plus the UTF-8 length of the name
+    (18 for the slot and its packed phone, 16-32 for the hash tables
+    depending on how recently they doubled, and array growth slack),
+    against about 150 bytes for a ``dict[str, str]`` with the same short
+    names and "555-0100"-style phones. benchmark_contact_memory() measures
+    both on formatted phone numbers. The hash table is probed in Python
+    rather than C, so each operation is slower than on a dict; the store
+    trades speed for memory.
+    """
+
+    TARGET_BYTES_PER_CONTACT = 48
+
+    _EMPTY, _TOMBSTONE = -1, -2
+    _MIN_CAPACITY = 1024
+    _DIGIT_BITS = 50
+    _MAX_DIGITS = 15
+    _MAX_FORMATS = 1 << 13
+    _VERBATIM = 1 << 63
+    _FREE = 0xFFFF
+    _ZERO_DIGITS = str.maketrans("123456789", "000000000")
+
+    def __init__(self, contacts: Iterable[tuple[str, str]] = ()) -> None:
+        self._clear()
+        self.update(contacts)
+
+    def _clear(self) -> None:
+        self._arena = bytearray()
+        self._offsets = array("Q")
+        self._lengths = array("H")
+        self._phones = array("Q")
+        self._formats: list[tuple[str, ...]] = []
+        self._format_numbers: dict[str, int] = {}
+        self._freed = 0
+        self._stale_bytes = 0
+        self._reset_index(self._MIN_CAPACITY)
+
+    # -- Phones ------------------------------------------------------------
+
+    def _pack_phone(self, phone: str) -> tuple[int, bytes]:
+        """
+        Returns the packed phone and the bytes to store after the name
+        (empty unless the phone is kept verbatim).
+        """
+        template = phone.translate(self._ZERO_DIGITS)
+        pieces = template.split("0")
+        number = self._format_numbers.get(template)
+        if number is None and len(pieces) - 1 <= self._MAX_DIGITS and len(self._formats) < self._MAX_FORMATS:
+            number = self._format_numbers[template] = len(self._formats)
+            self._formats.append(tuple(pieces))
+        if number is None or len(pieces) - 1 > self._MAX_DIGITS:
+            data = phone.encode()
+            return self._VERBATIM | len(data), data
+        digits = _NON_ASCII_DIGITS.sub("", phone)
+        return (number << self._DIGIT_BITS) | int(digits or 0), b""
+
+    def _phone_at(self, slot: int) -> str:
+        packed = self._phones[slot]
+        if packed & self._VERBATIM:
+            offset = self._offsets[slot] + self._lengths[slot]
+            return self._arena[offset:offset + (packed & 0xFFFFFFFF)].decode()
+        pieces = self._formats[packed >> self._DIGIT_BITS]
+        if len(pieces) == 1:
+            return pieces[0]
+        digits = str(packed & ((1 << self._DIGIT_BITS) - 1)).zfill(len(pieces) - 1)
+        return "".join([piece + digit for piece, digit in zip(pieces, digits)]) + pieces[-1]
+
+    def _extra_bytes(self, slot: int) -> int:
+        """Length of the verbatim phone stored after the name, or 0."""
+        packed = self._phones[slot]
+        return packed & 0xFFFFFFFF if packed & self._VERBATIM else 0
+
+    def _name_at(self, slot: int) -> str:
+        offset = self._offsets[slot]
+        return self._arena[offset:offset + self._lengths[slot]].decode()
+
+    # -- Index -------------------------------------------------------------
+
+    def _reset_index(self, capacity: int) -> None:
+        self._table = array("i", [self._EMPTY]) * capacity
+        self._hashes = array("I", bytes(4 * capacity))
+        self._mask = capacity - 1
+        self._count = 0
+        self._used = 0
+
+    def _lookup(self, key: bytes, fingerprint: int) -> tuple[int, int]:
+        """
+        Finds the table position for an encoded name.
+
+        Returns:
+            tuple[int, int]: (position, slot) when the name is present, or
+            (free position to insert into, -1) when it is not.
+        """
+        table, hashes, mask = self._table, self._hashes, self._mask
+        arena, offsets, lengths = self._arena, self._offsets, self._lengths
+        index = fingerprint & mask
+        free = -1
+        while True:
+            slot = table[index]
+            if slot == self._EMPTY:
+                return (index if free < 0 else free), -1
+            if slot == self._TOMBSTONE:
+                if free < 0:
+                    free = index
+            elif hashes[index] == fingerprint and lengths[slot] == len(key):
+                offset = offsets[slot]
+                if arena[offset:offset + len(key)] == key:
+                    return index, slot
+            index = (index + 1) & mask
+
+    def _rebuild(self) -> None:
+        """Drops freed slots and their arena bytes, then the table's tombstones."""
+        arena, offsets, lengths, phones = bytearray(), array("Q"), array("H"), array("Q")
+        new_slots = array("i", [self._EMPTY]) * len(self._lengths)
+        for slot in self._live_slots():
+            new_slots[slot] = len(offsets)
+            offset, length = self._offsets[slot], self._lengths[slot]
+            offsets.append(len(arena))
+            lengths.append(length)
+            phones.append(self._phones[slot])
+            arena += self._arena[offset:offset + length + self._extra_bytes(slot)]
+        self._arena, self._offsets, self._lengths, self._phones = arena, offsets, lengths, phones
+        self._freed = self._stale_bytes = 0
+        table = self._table
+        for index, slot in enumerate(table):
+            if slot >= 0:
+                table[index] = new_slots[slot]
+        self._grow()
+
+    def _grow(self) -> None:
+        capacity = self._MIN_CAPACITY
+        while capacity < self._count * 2:
+            capacity *= 2
+        old_table, old_hashes, count = self._table, self._hashes, self._count
+        self._reset_index(capacity)
+        table, hashes, mask = self._table, self._hashes, self._mask
+        for slot, fingerprint in zip(old_table, old_hashes):
+            if slot >= 0:
+                index = fingerprint & mask
+                while table[index] != self._EMPTY:
+                    index = (index + 1) & mask
+                table[index] = slot
+                hashes[index] = fingerprint
+        self._count = self._used = count
+
+    def _live_slots(self) -> Iterator[int]:
+        for slot, length in enumerate(self._lengths):
+            if length != self._FREE:
+                yield slot
+
+    # -- Mapping interface -------------------------------------------------
+
+    def __getitem__(self, name: str) -> str:
+        key = name.encode()
+        slot = self._lookup(key, hash(key) & 0xFFFFFFFF)[1]
+        if slot < 0:
+            raise KeyError(name)
+        return self._phone_at(slot)
+
+    def __setitem__(self, name: str, phone: str) -> None:
+        key = name.encode()
+        if len(key) >= self._FREE:
+            raise ValueError("Contact names must be shorter than 64 KiB.")
+        fingerprint = hash(key) & 0xFFFFFFFF
+        index, slot = self._lookup(key, fingerprint)
+        packed, extra = self._pack_phone(phone)
+        if slot >= 0:
+            old_extra = self._extra_bytes(slot)
+            if extra:
+                # The verbatim phone must follow the name, so both move to the end of the arena.
+                self._stale_bytes += len(key) + old_extra
+                self._offsets[slot] = len(self._arena)
+                self._arena += key + extra
+            else:
+                self._stale_bytes += old_extra
+            self._phones[slot] = packed
+            if self._stale_bytes > len(self._arena) // 2 and self._stale_bytes >= 1 << 16:
+                self._rebuild()
+            return
+        slot = len(self._offsets)
+        self._offsets.append(len(self._arena))
+        self._lengths.append(len(key))
+        self._arena += key + extra
+        self._phones.append(packed)
+        if self._table[index] == self._EMPTY:
+            self._used += 1
+        self._table[index] = slot
+        self._hashes[index] = fingerprint
+        self._count += 1
+        if self._used * 3 > len(self._table) * 2:
+            self._grow()
+
+    def __delitem__(self, name: str) -> None:
+        key = name.encode()
+        index, slot = self._lookup(key, hash(key) & 0xFFFFFFFF)
+        if slot < 0:
+            raise KeyError(name)
+        self._table[index] = self._TOMBSTONE
+        self._stale_bytes += len(key) + self._extra_bytes(slot)
+        self._lengths[slot] = self._FREE
+        self._count -= 1
+        self._freed += 1
+        if self._freed > self._count and self._freed >= self._MIN_CAPACITY:
+            self._rebuild()
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        key = name.encode()
+        return self._lookup(key, hash(key) & 0xFFFFFFFF)[1] >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for slot in self._live_slots():
+            yield self._name_at(slot)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def views(self) -> Iterator[ContactView]:
+        """Yields a lightweight view of every contact, in insertion order."""
+        for slot in self._live_slots():
+            yield ContactView(self, slot)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the store's arrays and phone formats, in bytes."""
+        arrays = (self._offsets, self._lengths, self._phones, self._table, self._hashes)
+        formats = sum(sys.getsizeof(template) for template in self._format_numbers)
+        return (sys.getsizeof(self._arena) + sum(sys.getsizeof(column) for column in arrays)
+                + sys.getsizeof(self._format_numbers) + formats)
+
+
+def open_contact_store(path: str | None = None, compact: bool = False) -> ContactStore:
+    """
+    Opens the contact store backend for the Contact Manager.
+
+    Args:
+        path (str | None): Log file for an on-disk store, or None to keep
+            contacts in memory like the original chapter.
+        compact (bool): Keep in-memory contacts in a CompactContactStore
+            instead of a dictionary.
+
+    Returns:
+        ContactStore: The opened store.
+    """
+    if path is None:
+        return CompactContactStore() if compact else InMemoryContactStore()
+    return DiskContactStore(path)
+
+
+def normalize_name(name: str) -> str:
+    """Case-folds a contact name and collapses runs of whitespace."""
+    return " ".join(name.casefold().split())
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Computes the Levenshtein distance between two strings, giving up early.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+        limit (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or limit + 1 if it exceeds the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if a == b:
+        return 0
+    # A shared prefix or suffix never changes the distance.
+    shortest = min(len(a), len(b))
+    start = 0
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shortest - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    # Only cells within `limit` of the diagonal can stay within the limit,
+    # so each row computes at most 2 * limit + 1 of them.
+    over = limit + 1
+    previous = [min(j, over) for j in range(len(b) + 1)]
+    for i, char_a in enumerate(a, start=1):
+        current = [over] * (len(b) + 1)
+        current[0] = best = min(i, over)
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != b[j - 1]), over)
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        previous = current
+    return previous[-1]
+
+
+class ContactSearchIndex:
+    """
+    Incrementally maintained search index over contact names.
+
+    Matching is case-insensitive and ignores repeated whitespace. Two
+    structures back the searches:
+      * a sorted list of (normalized name, name) pairs answers prefix queries
+        with a binary search followed by a slice of the next k entries;
+      * a trigram inverted index maps every three-letter window of a padded,
+        normalized name to the ids of the names containing it. Substring and
+        typo-tolerant queries start from the posting list of their rarest
+        trigram, so a query containing an uncommon trigram only looks at
+        the few names that share it.
+
+    Substring queries examine at most MAX_CANDIDATES names from those
+    postings and typo-tolerant ones MAX_FUZZY_CANDIDATES (each costs an
+    edit-distance check), which keeps every lookup under a millisecond
+    on a million names even when all of a query's trigrams are common
+    ("ada", "lovelace"). Past that cap the top-k is ranked among the names
+    examined, in the order they were added, rather than among all matches.
+
+    Posting lists are compact ``array('I')`` id lists. Deleting a name only
+    retires its id; the postings are rebuilt once retired ids outnumber live
+    ones.
+    """
+
+    MAX_CANDIDATES = 400
+    MAX_FUZZY_CANDIDATES = 100
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._rebuild(names)
+
+    def _rebuild(self, names: Iterable[str]) -> None:
+        self._sorted: list[tuple[str, str]] = []
+        self._ids: dict[str, int] = {}
+        self._names: list[str | None] = []
+        self._keys: list[str | None] = []
+        self._postings: dict[str, array] = {}
+        self._retired = 0
+        self.update(names)
+
+    @staticmethod
+    def _trigrams(text: str) -> set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _index(self, name: str) -> None:
+        """Adds a name to the id table and postings, appending to the sorted list."""
+        key = normalize_name(name)
+        name_id = len(self._names)
+        self._ids[name] = name_id
+        self._names.append(name)
+        self._keys.append(key)
+        self._sorted.append((key, name))
+        for trigram in self._trigrams(f"  {key} "):
+            postings = self._postings.get(trigram)
+            if postings is None:
+                postings = self._postings[trigram] = array("I")
+            postings.append(name_id)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def add(self, name: str) -> None:
+        """
+        Indexes a contact name (no-op if it is already indexed).
+
+        Inserting into the sorted list is O(n), which suits one interactive
+        add at a time; use update() to index many names.
+        """
+        if name in self._ids:
+            return
+        self._index(name)
+        entry = self._sorted.pop()
+        bisect.insort(self._sorted, entry)
+
+    def update(self, names: Iterable[str]) -> None:
+        """
+        Indexes many contact names at once, skipping those already indexed.
+
+        The new entries are appended and the sorted list is sorted once, so
+        loading n names costs O(n log n) rather than n insertions.
+        """
+        added = len(self._sorted)
+        for name in names:
+            if name not in self._ids:
+                self._index(name)
+        if len(self._sorted) > added:
+            self._sorted.sort()
+
+    def discard(self, name: str) -> None:
+        """Removes a contact name from the index if present."""
+        name_id = self._ids.pop(name, None)
+        if name_id is None:
+            return
+        entry = (self._keys[name_id], name)
+        self._names[name_id] = self._keys[name_id] = None
+        del self._sorted[bisect.bisect_left(self._sorted, entry)]
+        self._retired += 1
+        if self._retired > len(self._ids):
+            self._rebuild([name for _, name in self._sorted])
+
+    def prefix(self, query: str, k: int = 10) -> list[str]:
+        """Returns up to k names starting with the query, in alphabetical order."""
+        key = normalize_name(query)
+        start = bisect.bisect_left(self._sorted, (key, ""))
+        matches = []
+        for entry_key, name in self._sorted[start:start + k]:
+            if not entry_key.startswith(key):
+                break
+            matches.append(name)
+        return matches
+
+    def _rarest(self, trigrams: Iterable[str]) -> list[array]:
+        """Returns the posting lists of the trigrams, rarest first."""
+        empty = array("I")
+        return sorted((self._postings.get(trigram, empty) for trigram in trigrams), key=len)
+
+    def _containing(self, key: str, pattern: str) -> list[int]:
+        """Returns the ids of live names containing key among the first MAX_CANDIDATES sharing pattern's rarest trigram."""
+        keys = self._keys
+        ids = itertools.islice(self._rarest(self._trigrams(pattern))[0], self.MAX_CANDIDATES)
+        return [name_id for name_id in ids if keys[name_id] is not None and key in keys[name_id]]
+
+    def substring(self, query: str, k: int = 10) -> list[str]:
+        """
+        Returns up to k names containing the query.
+
+        Names where the query starts a word rank first, then shorter names.
+        Those are looked for first, among the names that share the query's
+        rarest word-start trigram, and the remaining names only when fewer
+        than k were found.
+        """
+        key = normalize_name(query)
+        if len(key) < 3:
+            return self.prefix(key, k)
+        ranked: dict[str, tuple[bool, int, str]] = {}
+        for pattern in (f" {key}", key):
+            for name_id in self._containing(key, pattern):
+                text, name = self._keys[name_id], self._names[name_id]
+                if name not in ranked:
+                    at_word = text.startswith(key) or f" {key}" in text
+                    ranked[name] = (not at_word, len(text), name)
+            if len(ranked) >= k:
+                break
+        return [name for _, _, name in heapq.nsmallest(k, ranked.values())]
+
+    def fuzzy(self, query: str, k: int = 10, max_distance: int = 2) -> list[str]:
+        """
+        Returns up to k names within max_distance edits of the query,
+        closest first. A name also matches when one of its words is close
+        enough, so "jnes" finds "Alice Jones".
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        query_trigrams = self._trigrams(f"  {key} ")
+        # Each edit destroys at most three trigrams, so any close enough name
+        # shares at least one of the 3 * max_distance + 1 rarest ones.
+        rarest = self._rarest(query_trigrams)[:3 * max_distance + 1]
+        key_chars = set(key)
+        seen: set[int] = set()
+        # Names share most of their words, so each distinct word is measured once per query.
+        distances: dict[str, int] = {}
+        scored = []
+        limit = self.MAX_FUZZY_CANDIDATES
+        for name_id in itertools.chain.from_iterable(itertools.islice(ids, limit) for ids in rarest):
+            if name_id in seen:
+                continue
+            if len(seen) == limit:
+                break
+            seen.add(name_id)
+            candidate = self._keys[name_id]
+            if candidate is None:
+                continue
+            distance = max_distance + 1
+            for text in (candidate, *candidate.split()):
+                known = distances.get(text)
+                if known is None:
+                    # Each edit adds or removes at most one distinct character,
+                    # which rules most words out before the full computation.
+                    if abs(len(text) - len(key)) > max_distance or len(key_chars ^ set(text)) > 2 * max_distance:
+                        known = max_distance + 1
+                    else:
+                        known = edit_distance(key, text, max_distance)
+                    distances[text] = known
+                distance = min(distance, known)
+            if distance <= max_distance:
+                scored.append((distance, self._names[name_id]))
+        return [name for _, name in heapq.nsmallest(k, scored)]
+
+    def search(self, query: str, k: int = 10) -> list[str]:
+        """
+        Returns up to k ranked matches: exact, then prefix and substring
+        matches. Typo-tolerant matches are only tried when nothing else matched.
+        """
+        results: list[str] = []
+        seen: set[str] = set()
+        for finder in (self.prefix, self.substring, self.fuzzy):
+            if finder == self.fuzzy and results:
+                break
+            for name in finder(query, k):
+                if name not in seen:
+                    seen.add(name)
+                    results.append(name)
+            if len(results) >= k:
+                break
+        key = normalize_name(query)
+        results.sort(key=lambda name: normalize_name(name) != key)
+        return results[:k]
+
+
+# -- Bulk import and export -------------------------------------------------
+
+_NON_DIGITS = re.compile(r"\D+")
+_NON_ASCII_DIGITS = re.compile(r"[^0-9]+")
+
+
+def normalize_phone(phone: str) -> str:
+    """Keeps only the digits of a phone number and a leading '+'."""
+    digits = _NON_DIGITS.sub("", phone)
+    return "+" + digits if phone.lstrip().startswith("+") else digits
+
+
+def contact_format(path: str, requested: str | None = None) -> str:
+    """Returns the requested format, or the one implied by the file extension (CSV by default)."""
+    if requested:
+        return requested
+    return "vcard" if path.lower().endswith((".vcf", ".vcard")) else "csv"
+
+
+def read_contacts_csv(source: TextIO) -> Iterator[tuple[str, str]]:
+    """
+    Streams (name, phone) pairs from ``name,phone`` CSV rows.
+
+    A header row starting with "name" is skipped and a missing phone column
+    reads as an empty phone number. Only the current row is held in memory.
+    """
+    import csv
+    reader = csv.reader(source)
+    for row in reader:
+        if reader.line_num == 1 and row and row[0].strip().lower() == "name":
+            continue
+        if row:
+            yield row[0], row[1] if len(row) > 1 else ""
+
+
+def _vcard_unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return re.sub(r"\\(.)", lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def read_contacts_vcard(source: TextIO) -> Iterator[tuple[str, str]]:
+    """
+    Streams (name, phone) pairs from vCard 2.1-4.0 cards.
+
+    The name comes from FN (or N when FN is missing) and the phone from the
+    first TEL property. Folded lines are joined as they are read, so only the
+    current card is held in memory.
+    """
+    name = structured_name = phone = None
+    logical = ""
+    for raw in itertools.chain(source, ("",)):
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            logical += line[1:]
+            continue
+        current, logical = logical, line
+        prop, colon, value = current.partition(":")
+        if not colon:
+            continue
+        # Drop the group prefix ("item1.TEL") and parameters ("TEL;TYPE=cell").
+        prop = prop.split(";", 1)[0].rsplit(".", 1)[-1].upper()
+        if prop == "BEGIN":
+            name = structured_name = phone = None
+        elif prop == "FN":
+            name = _vcard_unescape(value)
+        elif prop == "N":
+            family, _, rest = value.partition(";")
+            given = rest.split(";", 1)[0]
+            structured_name = _vcard_unescape(f"{given} {family}".strip())
+        elif prop == "TEL" and phone is None:
+            phone = _vcard_unescape(value.removeprefix("tel:"))
+        elif prop == "END":
+            yield name or structured_name or "", phone or ""
+
+
+def write_contacts_csv(contacts: Iterable[tuple[str, str]], sink: TextIO) -> int:
+    """Streams (name, phone) pairs out as ``name,phone`` CSV rows; returns the row count."""
+    import csv
+    writer = csv.writer(sink, lineterminator="\n")
+    writer.writerow(["name", "phone"])
+    count = 0
+    for count, row in enumerate(contacts, start=1):
+        writer.writerow(row)
+    return count
+
+
+def _vcard_line(prop: str, value: str) -> str:
+    """Escapes a value and folds the line at 75 characters, as RFC 6350 asks."""
+    value = value.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;").replace("\n", "\\n")
+    line = f"{prop}:{value}"
+    if len(line) <= 75:
+        return line + "\r\n"
+    return "\r\n ".join(line[i:i + 74] for i in range(0, len(line), 74)) + "\r\n"
+
+
+def write_contacts_vcard(contacts: Iterable[tuple[str, str]], sink: TextIO) -> int:
+    """Streams (name, phone) pairs out as vCard 4.0 cards; returns the card count."""
+    count = 0
+    for count, (name, phone) in enumerate(contacts, start=1):
+        sink.write(f"BEGIN:VCARD\r\nVERSION:4.0\r\n{_vcard_line('FN', name)}"
+                   f"{_vcard_line('TEL;VALUE=text', phone)}END:VCARD\r\n")
+    return count
+
+
+CONTACT_READERS: dict[str, Callable[[TextIO], Iterator[tuple[str, str]]]] = {
+    "csv": read_contacts_csv,
+    "vcard": read_contacts_vcard,
+}
+CONTACT_WRITERS: dict[str, Callable[[Iterable[tuple[str, str]], TextIO], int]] = {
+    "csv": write_contacts_csv,
+    "vcard": write_contacts_vcard,
+}
+
+
+def import_contacts(store: MutableMapping[str, str], records: Iterable[tuple[str, str]],
+                    batch_size: int = 10_000) -> dict[str, int]:
+    """
+    Adds a stream of (name, phone) records to a store in batches.
+
+    At most batch_size records are held at once, whatever the size of the
+    input; nothing else is remembered between batches. Each record is
+    checked against the store itself, under the same key the store uses
+    (the name with runs of whitespace collapsed): a name that is not there
+    yet is imported, one stored with the same phone number (compared with
+    normalize_phone) is a duplicate, and one stored with a different number
+    has its number replaced and is counted as updated. Records later in the
+    same batch see the earlier ones. Records without a name are counted as
+    invalid.
+
+    Args:
+        store (MutableMapping[str, str]): Destination store.
+        records (Iterable[tuple[str, str]]): Source records, e.g. from read_contacts_csv().
+        batch_size (int): Records validated and written per batch.
+
+    Returns:
+        dict[str, int]: Counts for "rows", "imported", "updated", "duplicates" and "invalid".
+    """
+    totals = {"rows": 0, "imported": 0, "updated": 0, "duplicates": 0, "invalid": 0}
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            return totals
+        totals["rows"] += len(batch)
+        accepted: dict[str, str] = {}
+        for name, phone in batch:
+            name, phone = " ".join(name.split()), phone.strip()
+            if not name:
+                totals["invalid"] += 1
+                continue
+            current = accepted[name] if name in accepted else store.get(name)
+            if current is None:
+                totals["imported"] += 1
+            elif normalize_phone(current) == normalize_phone(phone):
+                totals["duplicates"] += 1
+                continue
+            else:
+                totals["updated"] += 1
+            accepted[name] = phone
+        store.update(accepted)
+
+
+def _open_contact_file(path: str, mode: str) -> TextIO:
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    return open(path, mode, encoding="utf-8-sig" if mode == "r" else "utf-8", newline="")
+
+
+def run_contact_import(path: str, store_path: str, file_format: str | None = None,
+                       batch_size: int = 10_000) -> None:
+    """
+    CLI mode for bulk contact import (``--import-contacts``).
+
+    Args:
+        path (str): CSV or vCard file to read, or '-' for standard input.
+        store_path (str): On-disk contact store to add the contacts to.
+        file_format (str | None): "csv" or "vcard"; guessed from the extension when None.
+        batch_size (int): Records validated and written per batch.
+    """
+    import time
+    start = time.perf_counter()
+    source = _open_contact_file(path, "r")
+    try:
+        with open_contact_store(store_path) as store:
+            totals = import_contacts(store, CONTACT_READERS[contact_format(path, file_format)](source), batch_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    elapsed = time.perf_counter() - start
+    print(f"Imported {totals['imported']} of {totals['rows']} rows in {elapsed:.2f}s "
+          f"({totals['rows'] / max(elapsed, 1e-9):,.0f} rows/s; {totals['updated']} updated, "
+          f"{totals['duplicates']} duplicates, {totals['invalid']} invalid rows).", file=sys.stderr)
+
+
+def run_contact_export(path: str, store_path: str, file_format: str | None = None) -> None:
+    """
+    CLI mode for bulk contact export (``--export-contacts``). Contacts are
+    streamed from the store to the file one at a time.
+
+    Args:
+        path (str): CSV or vCard file to write, or '-' for standard output.
+        store_path (str): On-disk contact store to export.
+        file_format (str | None): "csv" or "vcard"; guessed from the extension when None.
+    """
+    import time
+    start = time.perf_counter()
+    sink = _open_contact_file(path, "w")
+    try:
+        with open_contact_store(store_path) as store:
+            count = CONTACT_WRITERS[contact_format(path, file_format)](store.items(), sink)
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"Exported {count} contacts in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} rows/s).",
+          file=sys.stderr)
+
+
+def benchmark_contact_memory(count: int = 1_000_000) -> dict[str, float]:
+    """
+    Compares the memory used per contact by a ``dict[str, str]`` and a
+    CompactContactStore holding the same synthetic contacts, with phone
+    numbers formatted the way Chapter 6 users type them ("555-0100"), and
+    checks the store against CompactContactStore.TARGET_BYTES_PER_CONTACT.
+
+    Args:
+        count (int): Contacts stored in each container.
+
+    Returns:
+        dict[str, float]: Bytes per contact for "dict" and "compact", and
+        the "target" for the compact store including the name.
+    """
+    import gc
+    import tracemalloc
+    name_length = len("Contact 00000000")
+    usage: dict[str, float] = {}
+    for mode, build in (("dict", dict), ("compact", CompactContactStore)):
+        gc.collect()
+        tracemalloc.start()
+        container = build((f"Contact {i:08d}", f"555-{i % 10_000:04d}") for i in range(count))
+        usage[mode] = tracemalloc.get_traced_memory()[0] / count
+        tracemalloc.stop()
+        del container
+    usage["target"] = CompactContactStore.TARGET_BYTES_PER_CONTACT + name_length
+    print(f"Contacts: {count:,} ({name_length}-character names, phone numbers like 555-0100)")
+    for mode in ("dict", "compact"):
+        print(f"  {mode:>8}: {usage[mode]:,.1f} bytes/contact")
+    print(f"  saving: {usage['dict'] / usage['compact']:.1f}x")
+    verdict = "met" if usage["compact"] <= usage["target"] else "MISSED"
+    print(f"  target: {usage['target']:,.0f} bytes/contact ({verdict})")
+    return usage
+
+
+def benchmark_contact_search(count: int = 1_000_000, budget_ms: float = 1.0, repeat: int = 5) -> dict[str, float]:
+    """
+    Times ContactSearchIndex.search() on synthetic contacts for each kind of
+    query and checks every one against a latency budget.
+
+    The names combine a handful of common first and last names with a number
+    ("Ada Lovelace 123"), so most trigrams are shared by a large part of the
+    set, the worst case for the trigram index.
+
+    Args:
+        count (int): Contacts in the index.
+        budget_ms (float): Slowest acceptable median lookup in milliseconds.
+        repeat (int): Timed runs per query; the median is reported.
+
+    Returns:
+        dict[str, float]: Median milliseconds per query kind.
+    """
+    import random
+    import statistics
+    import time
+    rng = random.Random(0)
+    first = ["Ada", "Alan", "Grace", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Edsger", "Frances"]
+    last = ["Lovelace", "Turing", "Hopper", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Dijkstra"]
+    names = [f"{rng.choice(first)} {rng.choice(last)} {i}" for i in range(count)]
+    index = ContactSearchIndex(names)
+    queries = {"exact": names[count // 2], "prefix": "ada lov", "substring": "opper 4", "common word": "lovelace",
+               "typo": "Grace Hoper", "typo in full name": f"Grace Hoper {count // 2}", "no match": "dijkstar 7"}
+    timings: dict[str, float] = {}
+    for label, query in queries.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            index.search(query)
+            samples.append(time.perf_counter() - start)
+        timings[label] = statistics.median(samples) * 1000
+    print(f"Search over {count:,} contacts (median of {repeat} runs, budget {budget_ms:g} ms):")
+    for label, elapsed in timings.items():
+        print(f"  {label:>17}: {elapsed:7.3f} ms{'' if elapsed <= budget_ms else '  OVER BUDGET'}")
+    return timings
@@ -0,0 +1,421 @@
+"""
+Auto-Grader
+-----------
+Grades learner versions of the chapter programs against the reference
+chapters in Python-Book-1.py. Every submission is run once per scenario in a
+fresh, resource-limited Python process with the scenario's replies on
+standard input, and its output is compared line by line with what the
+reference chapter prints for the same replies and random seed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+from collections.abc import Awaitable, Callable, Iterable
+from typing import NamedTuple
+
+from academy.console import Console, ScriptedConsole, run_sync
+
+ReferenceChapter = Callable[[Console], Awaitable[None]]
+
+# Bumped whenever grading itself changes, so cached grades are not reused.
+GRADER_VERSION = 1
+
+
+class GradingScenario(NamedTuple):
+    """
+    One scripted run of a chapter.
+
+    Attributes:
+        name: Short label shown in reports, e.g. "division by zero".
+        replies: One line of standard input per prompt.
+        seed: Seed for ``random`` in both the reference and the submission.
+    """
+    name: str
+    replies: tuple[str, ...]
+    seed: int = 0
+
+
+def _guess_scenario(name: str, seed: int) -> GradingScenario:
+    """A Guess the Number game that searches for the target the seed picks."""
+    target = random.Random(seed).randint(1, 100)
+    replies, low, high = ["fifty"], 1, 100
+    while True:
+        guess = (low + high) // 2
+        replies.append(str(guess))
+        if guess == target:
+            return GradingScenario(name, tuple(replies), seed)
+        if guess < target:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+GRADING_SCENARIOS: dict[str, tuple[GradingScenario, ...]] = {
+    "1": (
+        GradingScenario("greeting", ("Ada",)),
+        GradingScenario("empty name", ("",)),
+        GradingScenario("name with spaces", ("Grace Brewster Hopper",)),
+    ),
+    "2": (
+        GradingScenario("addition", ("2", "3", "1")),
+        GradingScenario("float rounding", ("0.1", "0.2", "1")),
+        GradingScenario("subtraction", ("-4.5", "10", "2")),
+        GradingScenario("multiplication", ("1e308", "10", "3")),
+        GradingScenario("division", ("7", "2", "4")),
+        GradingScenario("division by zero", ("1", "0", "4")),
+        GradingScenario("invalid number", ("one", "2")),
+        GradingScenario("invalid operation", ("1", "2", "9")),
+        GradingScenario("expression", ("4", "2", "5", "3*(x+2)/y")),
+        GradingScenario("expression dividing by zero", ("4", "0", "5", "x/y")),
+        GradingScenario("malformed expression", ("4", "2", "5", "3*(x+")),
+    ),
+    "3": (
+        _guess_scenario("binary search, seed 1", 1),
+        _guess_scenario("binary search, seed 2", 2),
+        _guess_scenario("binary search, seed 3", 3),
+    ),
+    "4": (
+        GradingScenario("empty list", ("2", "3", "4", "7")),
+        GradingScenario("add, view and remove", ("1", "Read chapter 4", "", "", "", "1", "Practice", "1",
+                                                 "2030-01-31", "study, daily", "2", "4", "3", "1", "2", "7")),
+        GradingScenario("invalid input", ("1", "Bad priority", "9", "1", "Bad date", "2", "tomorrow",
+                                          "1", "Keep", "", "", "", "3", "x", "3", "42", "8", "7")),
+        GradingScenario("filters", ("1", "A", "2", "2030-02-01", "work", "1", "B", "5", "2030-03-01", "home",
+                                    "5", "work", "5", "none", "6", "2030-01-01", "2030-02-15", "6", "soon", "7")),
+    ),
+    "5": (
+        GradingScenario("three rounds", ("rock", "paper", "scissors", "exit"), 5),
+        GradingScenario("invalid move and case", ("Lizard", " ROCK ", "Exit"), 6),
+    ),
+    "6": (
+        GradingScenario("add, view and search", ("1", "Ada Lovelace", "555-0100", "1", "Alan Turing", "555-0199",
+                                                 "2", "3", "Ada Lovelace", "5")),
+        GradingScenario("fuzzy search", ("1", "Grace Hopper", "555-0142", "3", "grace", "3", "Hoper", "3",
+                                         "Nobody", "5")),
+        GradingScenario("delete and invalid choice", ("2", "1", "Ada", "1", "4", "Ada", "4", "Ada", "9", "5")),
+    ),
+}
+
+
+class ScenarioResult(NamedTuple):
+    """
+    Outcome of one scenario.
+
+    Attributes:
+        scenario: Name of the scenario.
+        status: "pass", "wrong output", "crashed", "time limit",
+            "memory limit", "output limit" or "unreadable".
+        detail: First differing line, the last line of the error output, or
+            why the submission file could not be read.
+    """
+    scenario: str
+    status: str
+    detail: str = ""
+
+
+class SubmissionGrade(NamedTuple):
+    """
+    Grade of one submission file.
+
+    Attributes:
+        path: The submission.
+        sha256: Digest of its contents ("" when the file could not be read).
+        results: One ScenarioResult per scenario, in order.
+        cached: True when the grade came from the cache.
+    """
+    path: str
+    sha256: str
+    results: tuple[ScenarioResult, ...]
+    cached: bool = False
+
+    @property
+    def passed(self) -> int:
+        return sum(result.status == "pass" for result in self.results)
+
+
+def reference_output(chapter: ReferenceChapter, scenario: GradingScenario) -> str:
+    """
+    Returns what the reference chapter prints for a scenario.
+
+    Prompts are included and replies are not, exactly as when a program
+    reads piped standard input.
+    """
+    import io
+    output = io.StringIO()
+    console = ScriptedConsole(scenario.replies, output)
+    random.seed(scenario.seed)
+    try:
+        run_sync(chapter(console))
+    except EOFError:
+        pass
+    console.flush()
+    return output.getvalue()
+
+
+def normalize_output(text: str) -> list[str]:
+    """Splits output into lines, ignoring trailing spaces and blank lines."""
+    return [line.rstrip() for line in text.splitlines() if line.strip()]
+
+
+def compare_output(expected: str, actual: str) -> str:
+    """
+    Compares two outputs after normalize_output().
+
+    Returns:
+        str: "" when they match, otherwise a description of the first difference.
+    """
+    expected_lines, actual_lines = normalize_output(expected), normalize_output(actual)
+    for number, (want, got) in enumerate(zip(expected_lines, actual_lines), 1):
+        if want != got:
+            return f"line {number}: expected {want!r}, got {got!r}"
+    if len(expected_lines) > len(actual_lines):
+        return f"line {len(actual_lines) + 1}: expected {expected_lines[len(actual_lines)]!r}, got end of output"
+    if len(actual_lines) > len(expected_lines):
+        return f"line {len(expected_lines) + 1}: unexpected {actual_lines[len(expected_lines)]!r}"
+    return ""
+
+
+# Runs in the child: applies the limits to itself, seeds random and runs the
+# submission as __main__. Limits are set here rather than in a preexec_fn,
+# which is unsafe while the grader's worker threads are running.
+_SANDBOX = """
+import random, runpy, sys
+seed, memory, cpu, output, path = sys.argv[1:6]
+try:
+    import resource
+except ImportError:
+    resource = None
+if resource is not None:
+    import signal
+    for limit, value in ((resource.RLIMIT_AS, int(memory)), (resource.RLIMIT_CPU, int(cpu)),
+                         (resource.RLIMIT_FSIZE, int(output))):
+        resource.setrlimit(limit, (value, value))
+    # Python ignores SIGXFSZ; restore it so exceeding the output limit ends the run.
+    signal.signal(signal.SIGXFSZ, signal.SIG_DFL)
+random.seed(int(seed))
+sys.argv = [path]
+runpy.run_path(path, run_name="__main__")
+"""
+
+# Signals sent by the kernel when a resource limit is exceeded (POSIX only).
+_SIGXCPU = getattr(signal, "SIGXCPU", None)
+_SIGXFSZ = getattr(signal, "SIGXFSZ", None)
+
+
+def run_submission(path: str, scenario: GradingScenario, expected: str, time_limit: float = 2.0,
+                   memory_limit: int = 256 << 20, output_limit: int = 1 << 20) -> ScenarioResult:
+    """
+    Runs a submission on one scenario and checks its output.
+
+    The submission runs in isolated mode (no user site-packages, environment
+    variables or current directory on sys.path) inside an empty temporary
+    directory, with a minimal environment. On POSIX systems its address
+    space, CPU time and output size are capped with resource limits; the
+    wall-clock limit applies everywhere. This keeps runaway or careless code
+    in check but is not a security boundary against hostile code.
+
+    Args:
+        path (str): The submission script.
+        scenario (GradingScenario): Replies and seed.
+        expected (str): The reference output for the scenario.
+        time_limit (float): Wall-clock seconds before the run is stopped.
+        memory_limit (int): Address-space limit in bytes.
+        output_limit (int): Bytes of output the submission may produce.
+
+    Returns:
+        ScenarioResult: The outcome.
+    """
+    import tempfile
+    env = {"PATH": os.environ.get("PATH", "")}
+    if "SYSTEMROOT" in os.environ:
+        env["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
+    command = [sys.executable, "-I", "-X", "utf8", "-c", _SANDBOX, str(scenario.seed), str(memory_limit),
+               str(int(time_limit) + 1), str(output_limit), os.path.abspath(path)]
+    with tempfile.TemporaryDirectory(prefix="academy-grade-") as sandbox:
+        # Output goes to files so the output limit also bounds what is read back.
+        with open(os.path.join(sandbox, ".stdout"), "w+b") as stdout, \
+                open(os.path.join(sandbox, ".stderr"), "w+b") as stderr:
+            try:
+                completed = subprocess.run(command, input="".join(f"{reply}\n" for reply in scenario.replies),
+                                           stdout=stdout, stderr=stderr, cwd=sandbox, env=env,
+                                           timeout=time_limit, text=True, encoding="utf-8")
+            except subprocess.TimeoutExpired:
+                return ScenarioResult(scenario.name, "time limit", f"still running after {time_limit:g}s")
+            stdout.seek(0)
+            stderr.seek(0)
+            actual = stdout.read(output_limit).decode("utf-8", "replace")
+            errors = stderr.read(output_limit).decode("utf-8", "replace").strip().splitlines()
+    last_error = errors[-1] if errors else ""
+    if _SIGXCPU and completed.returncode == -_SIGXCPU:
+        return ScenarioResult(scenario.name, "time limit", "CPU time limit exceeded")
+    if _SIGXFSZ and completed.returncode == -_SIGXFSZ:
+        return ScenarioResult(scenario.name, "output limit", f"more than {output_limit:,} bytes of output")
+    if "MemoryError" in last_error:
+        return ScenarioResult(scenario.name, "memory limit", last_error)
+    if completed.returncode != 0:
+        return ScenarioResult(scenario.name, "crashed", last_error or f"exit status {completed.returncode}")
+    difference = compare_output(expected, actual)
+    if difference:
+        return ScenarioResult(scenario.name, "wrong output", difference)
+    return ScenarioResult(scenario.name, "pass")
+
+
+class GradeCache:
+    """
+    Grades stored on disk by submission digest, one small JSON file each.
+
+    The key also covers the scenarios, the reference outputs, the limits and
+    GRADER_VERSION, so changing any of them re-grades every submission.
+    """
+
+    def __init__(self, directory: str, suite_key: str) -> None:
+        self.directory = directory
+        self.suite_key = suite_key
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, sha256: str) -> str:
+        key = hashlib.sha256(f"{self.suite_key}:{sha256}".encode()).hexdigest()
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, sha256: str) -> tuple[ScenarioResult, ...] | None:
+        try:
+            with open(self._path(sha256), encoding="utf-8") as entry:
+                return tuple(ScenarioResult(*result) for result in json.load(entry))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, sha256: str, results: tuple[ScenarioResult, ...]) -> None:
+        path = self._path(sha256)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as entry:
+            json.dump([list(result) for result in results], entry)
+        os.replace(tmp_path, path)
+
+
+def find_submissions(paths: Iterable[str]) -> list[str]:
+    """Expands folders into the .py files they contain (recursively), keeping files as given."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in sorted(os.walk(path)):
+                found.extend(os.path.join(folder, name) for name in sorted(names) if name.endswith(".py"))
+        else:
+            found.append(path)
+    return found
+
+
+def grade_submissions(paths: Iterable[str], chapter_key: str, reference: ReferenceChapter,
+                      workers: int | None = None, time_limit: float = 2.0, memory_limit: int = 256 << 20,
+                      cache_dir: str | None = None) -> list[SubmissionGrade]:
+    """
+    Grades many submissions of one chapter in parallel.
+
+    Each (submission, scenario) pair is a separate run, and the runs are
+    spread over `workers` slots so that all cores stay busy. The pool only
+    starts child processes and waits for them, so it uses threads; the
+    submissions themselves run in parallel processes. Identical files are
+    run once, and with a cache directory grades are reused across calls.
+
+    Args:
+        paths (Iterable[str]): Submission scripts.
+        chapter_key (str): Menu key of the chapter they implement ("1" to "6").
+        reference (ReferenceChapter): The reference chapter, called with a console.
+        workers (int | None): Runs at a time (default: CPU count).
+        time_limit (float): Wall-clock seconds per run.
+        memory_limit (int): Address-space limit per run in bytes.
+        cache_dir (str | None): Folder for cached grades, or None.
+
+    Returns:
+        list[SubmissionGrade]: One grade per path, in the given order. A
+        file that cannot be read fails every scenario as "unreadable"
+        instead of stopping the batch.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    scenarios = GRADING_SCENARIOS.get(chapter_key)
+    if not scenarios:
+        raise ValueError(f"No grading scenarios for chapter {chapter_key!r}; "
+                         f"choose from {', '.join(GRADING_SCENARIOS)}.")
+    expected = [reference_output(reference, scenario) for scenario in scenarios]
+    suite = hashlib.sha256(json.dumps([GRADER_VERSION, chapter_key, time_limit, memory_limit,
+                                       [list(scenario) for scenario in scenarios], expected]).encode())
+    cache = GradeCache(cache_dir, suite.hexdigest()) if cache_dir else None
+
+    digests: dict[str, str] = {}
+    unreadable: dict[str, tuple[ScenarioResult, ...]] = {}
+    for path in paths:
+        try:
+            with open(path, "rb") as submission:
+                digests[path] = hashlib.sha256(submission.read()).hexdigest()
+        except OSError as exc:
+            reason = exc.strerror or str(exc)
+            unreadable[path] = tuple(ScenarioResult(scenario.name, "unreadable", reason) for scenario in scenarios)
+            digests[path] = ""
+    results: dict[str, tuple[ScenarioResult, ...]] = {}
+    cached: set[str] = set()
+    pending: dict[str, str] = {}
+    for path, digest in digests.items():
+        if path in unreadable or digest in results or digest in pending:
+            continue
+        hit = cache.get(digest) if cache else None
+        if hit is not None and len(hit) == len(scenarios):
+            results[digest] = hit
+            cached.add(digest)
+        else:
+            pending[digest] = path
+
+    runs = [(digest, path, index) for digest, path in pending.items() for index in range(len(scenarios))]
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        outcomes = list(pool.map(lambda run: run_submission(run[1], scenarios[run[2]], expected[run[2]],
+                                                            time_limit, memory_limit), runs))
+    for digest in pending:
+        results[digest] = ()
+    for (digest, _, _), outcome in zip(runs, outcomes):
+        results[digest] += (outcome,)
+    if cache:
+        for digest in pending:
+            cache.put(digest, results[digest])
+    return [SubmissionGrade(path, digest, unreadable[path] if path in unreadable else results[digest], digest in cached)
+            for path, digest in digests.items()]
+
+
+def write_grade_report(grades: list[SubmissionGrade], path: str) -> None:
+    """Writes one CSV row per submission: path, digest, score and failed scenarios."""
+    import csv
+    with open(path, "w", newline="", encoding="utf-8") as report:
+        writer = csv.writer(report)
+        writer.writerow(["path", "sha256", "passed", "total", "failed"])
+        for grade in grades:
+            failed = "; ".join(f"{result.scenario} ({result.status})"
+                               for result in grade.results if result.status != "pass")
+            writer.writerow([grade.path, grade.sha256, grade.passed, len(grade.results), failed])
+
+
+def run_grader(paths: list[str], chapter_key: str, reference: ReferenceChapter, workers: int | None,
+               time_limit: float, memory_limit_mb: int, cache_dir: str | None,
+               report_path: str | None = None) -> None:
+    """CLI mode for the auto-grader (``--grade``)."""
+    import time
+    submissions = find_submissions(paths)
+    start = time.perf_counter()
+    grades = grade_submissions(submissions, chapter_key, reference, workers, time_limit,
+                               memory_limit_mb << 20, cache_dir)
+    elapsed = time.perf_counter() - start
+    for grade in grades:
+        print(f"{grade.path}: {grade.passed}/{len(grade.results)}{' (cached)' if grade.cached else ''}")
+        for result in grade.results:
+            if result.status != "pass":
+                print(f"    {result.scenario}: {result.status}" + (f" - {result.detail}" if result.detail else ""))
+    if report_path:
+        write_grade_report(grades, report_path)
+    unique = {grade.sha256 for grade in grades if grade.sha256}
+    fresh = {grade.sha256 for grade in grades if grade.sha256 and not grade.cached}
+    runs = len(fresh) * len(GRADING_SCENARIOS[chapter_key])
+    print(f"Graded {len(grades)} submissions ({len(unique)} distinct, {len(unique) - len(fresh)} from cache) "
+          f"in {elapsed:.2f}s; {runs} runs ({runs / elapsed:,.0f} runs/s).", file=sys.stderr)
@@ -0,0 +1,187 @@
+"""
+Guess the Number Engine
+-----------------------
+Hint logic shared by Chapter 3: Guess the Number Game in Python-Book-1.py and a
+headless, parallel Monte-Carlo simulator for comparing guessing strategies.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from collections.abc import Callable
+
+
+GUESS_HINTS: dict[int, str] = {
+    -1: "Too low! Try again.",
+    1: "Too high! Try again.",
+}
+
+
+def check_guess(guess: int, target: int) -> int:
+    """
+    Compares a guess with the target number.
+
+    Returns:
+        int: -1 if the guess is too low, 1 if it is too high, 0 if it is correct.
+    """
+    return (guess > target) - (guess < target)
+
+
+class GuessGame:
+    """
+    A game of Guess the Number that can be left and picked up again.
+
+    A target of 0 means no number has been drawn yet.
+    """
+
+    __slots__ = ("target", "attempts", "finished")
+
+    _STATE = struct.Struct("<BI")
+
+    def __init__(self, target: int = 0, attempts: int = 0) -> None:
+        self.target = target
+        self.attempts = attempts
+        self.finished = False
+
+    def to_bytes(self) -> bytes | None:
+        """Serializes a game in progress; returns None when there is nothing to keep."""
+        if self.finished or not self.target:
+            return None
+        return self._STATE.pack(self.target, self.attempts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> GuessGame:
+        """
+        Restores a game saved with to_bytes().
+
+        Raises:
+            ValueError: If the data is not a saved game.
+        """
+        try:
+            target, attempts = cls._STATE.unpack(data)
+        except struct.error:
+            raise ValueError("not a saved Guess the Number game") from None
+        return cls(target, attempts)
+
+
+def binary_search_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guesses the middle of the remaining range."""
+    return (low + high) // 2
+
+
+def random_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guesses uniformly at random within the remaining range."""
+    return rng.randint(low, high)
+
+
+def biased_strategy(low: int, high: int, rng: random.Random) -> int:
+    """Guesses a quarter of the way into the remaining range."""
+    return low + (high - low) // 4
+
+
+GUESS_STRATEGIES: dict[str, Callable[[int, int, random.Random], int]] = {
+    "binary": binary_search_strategy,
+    "random": random_strategy,
+    "biased": biased_strategy,
+}
+
+
+def play_guess_game(strategy: Callable[[int, int, random.Random], int], target: int,
+                    rng: random.Random, low: int = 1, high: int = 100) -> int:
+    """
+    Plays one headless game of Guess the Number.
+
+    The strategy is told the range that is still consistent with the hints so
+    far, exactly the information a player gets from "Too low"/"Too high".
+
+    Returns:
+        int: Number of attempts needed to find the target.
+    """
+    attempts = 0
+    while True:
+        guess = strategy(low, high, rng)
+        attempts += 1
+        hint = check_guess(guess, target)
+        if hint == 0:
+            return attempts
+        if hint < 0:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def _simulate_guess_shard(strategy_name: str, games: int, seed: int, low: int, high: int) -> dict[int, int]:
+    """Plays a shard of games with its own seeded RNG; returns attempts -> games."""
+    rng = random.Random(seed)
+    strategy = GUESS_STRATEGIES[strategy_name]
+    histogram: dict[int, int] = {}
+    for _ in range(games):
+        attempts = play_guess_game(strategy, rng.randint(low, high), rng, low, high)
+        histogram[attempts] = histogram.get(attempts, 0) + 1
+    return histogram
+
+
+def simulate_guess_games(strategy: str = "binary", games: int = 1_000_000, workers: int | None = None,
+                         seed: int = 0, low: int = 1, high: int = 100,
+                         shard_size: int = 50_000) -> dict[int, int]:
+    """
+    Runs many headless games in parallel and collects attempt counts.
+
+    Games are split into fixed-size shards, each with an RNG seeded from
+    (seed, shard number), and the shards are spread over a ProcessPoolExecutor.
+    The distribution therefore depends only on the seed, not on the number of
+    workers.
+
+    Args:
+        strategy (str): Name of a strategy in GUESS_STRATEGIES.
+        games (int): Total number of games to play.
+        workers (int | None): Worker processes (default: CPU count; 1 runs inline).
+        seed (int): Base seed for the shard RNGs.
+        low (int): Smallest possible target.
+        high (int): Largest possible target.
+        shard_size (int): Games per shard.
+
+    Returns:
+        dict[int, int]: Number of games (value) that took each attempt count (key).
+    """
+    if strategy not in GUESS_STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(GUESS_STRATEGIES)}.")
+    shards = [(strategy, min(shard_size, games - start), seed * 1_000_003 + number, low, high)
+              for number, start in enumerate(range(0, games, shard_size))]
+    if workers == 1:
+        results = [_simulate_guess_shard(*shard) for shard in shards]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_guess_shard, *zip(*shards)))
+    histogram: dict[int, int] = {}
+    for result in results:
+        for attempts, count in result.items():
+            histogram[attempts] = histogram.get(attempts, 0) + count
+    return dict(sorted(histogram.items()))
+
+
+def print_attempt_distribution(histogram: dict[int, int], width: int = 40) -> None:
+    """Prints an attempt-count histogram with summary statistics."""
+    games = sum(histogram.values())
+    if not games:
+        print("No games played.")
+        return
+    mean = sum(attempts * count for attempts, count in histogram.items()) / games
+    peak = max(histogram.values())
+    print(f"Games: {games}  Mean attempts: {mean:.3f}  Worst case: {max(histogram)}")
+    for attempts, count in histogram.items():
+        bar = "#" * max(1, round(width * count / peak))
+        print(f"{attempts:>4} attempts: {count:>10} ({100 * count / games:6.2f}%) {bar}")
+
+
+def run_guess_simulation(strategy: str, games: int, workers: int | None, seed: int) -> None:
+    """CLI mode for the Guess the Number simulator (``--simulate-guess``)."""
+    import time
+    start = time.perf_counter()
+    histogram = simulate_guess_games(strategy, games, workers, seed)
+    elapsed = time.perf_counter() - start
+    print(f"Strategy: {strategy}")
+    print_attempt_distribution(histogram)
+    print(f"Simulated {games} games in {elapsed:.2f}s ({games / elapsed:,.0f} games/s).")
@@ -0,0 +1,322 @@
+"""
+Session Instrumentation
+-----------------------
+Opt-in timing and counters for the chapter programs.
+
+An InstrumentedConsole wraps the console a session runs on. Because every
+chapter talks to the user only through its console, the wrapper can split a
+session into time spent waiting for the user (input wait), time spent
+producing output (render) and everything in between (compute), per chapter.
+Chapters also report what they did with ``console.count("todo.add")``; the
+plain Console ignores those calls, so sessions without instrumentation pay
+only for an empty method call.
+
+Latencies go into LatencyHistogram, a log-linear histogram in the style of
+HdrHistogram: constant memory, about 1.6% relative precision at any scale and
+exact percentiles up to that precision. Metrics.save() exports everything as
+JSON or in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+
+from academy.console import Console
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations in nanoseconds.
+
+    Values below 128 ns get a bucket each. Above that, every power-of-two range
+    is split into 64 equal buckets, so a recorded value is known to within
+    1/64 of itself. An hour fits in about 2,600 buckets.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    SUB_BUCKET_BITS = 7
+    HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+    def __init__(self) -> None:
+        self.counts = array("Q")
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @classmethod
+    def bucket_index(cls, value: int) -> int:
+        """Returns the bucket holding a non-negative value."""
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+        return cls.HALF * shift + (value >> shift)
+
+    @classmethod
+    def bucket_range(cls, index: int) -> tuple[int, int]:
+        """Returns the lowest and highest value counted in a bucket."""
+        if index < 2 * cls.HALF:
+            return index, index
+        shift = index // cls.HALF - 1
+        top = index - cls.HALF * shift
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Adds one duration in nanoseconds (negative values count as 0)."""
+        if value < 0:
+            value = 0
+        index = self.bucket_index(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Adds every value recorded in another histogram."""
+        if not other.count:
+            return
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the value at the given percentile (0-100), in nanoseconds.
+
+        The result is the midpoint of the bucket holding that rank, clamped to
+        the smallest and largest values recorded.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = self.bucket_range(index)
+                return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, object]:
+        """Summary statistics plus the non-empty buckets as [lowest value, count] pairs."""
+        return {
+            "count": self.count,
+            "sum_ns": self.total,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "mean_ns": self.total // self.count if self.count else 0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "p999_ns": self.percentile(99.9),
+            "buckets": [[self.bucket_range(index)[0], count]
+                        for index, count in enumerate(self.counts) if count],
+        }
+
+
+class Metrics:
+    """
+    Everything measured in a run: phase histograms per menu section,
+    per-operation counters and per-operation latency histograms.
+    """
+
+    QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self) -> None:
+        self.phases: dict[tuple[str, str], LatencyHistogram] = {}
+        self.sections: dict[str, LatencyHistogram] = {}
+        self.operations: dict[str, LatencyHistogram] = {}
+        self.counters: dict[str, int] = {}
+
+    def phase(self, section: str, phase: str) -> LatencyHistogram:
+        """Returns the histogram of one phase (input_wait, compute, render) of a section."""
+        histogram = self.phases.get((section, phase))
+        if histogram is None:
+            histogram = self.phases[section, phase] = LatencyHistogram()
+        return histogram
+
+    def section(self, section: str) -> LatencyHistogram:
+        """Returns the histogram of complete visits to a section (e.g. one chapter run)."""
+        histogram = self.sections.get(section)
+        if histogram is None:
+            histogram = self.sections[section] = LatencyHistogram()
+        return histogram
+
+    def operation(self, operation: str) -> LatencyHistogram:
+        """Returns the latency histogram of an operation such as "contacts.search"."""
+        histogram = self.operations.get(operation)
+        if histogram is None:
+            histogram = self.operations[operation] = LatencyHistogram()
+        return histogram
+
+    def count(self, operation: str, amount: int = 1) -> None:
+        self.counters[operation] = self.counters.get(operation, 0) + amount
+
+    def to_json(self) -> dict[str, object]:
+        sections: dict[str, dict[str, object]] = {}
+        for name, histogram in self.sections.items():
+            sections.setdefault(name, {})["total"] = histogram.to_dict()
+        for (name, phase), histogram in self.phases.items():
+            sections.setdefault(name, {})[phase] = histogram.to_dict()
+        return {
+            "unit": "ns",
+            "sections": sections,
+            "operations": {name: histogram.to_dict() for name, histogram in self.operations.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_prometheus(self, prefix: str = "id01t") -> str:
+        """Renders the metrics in the Prometheus text exposition format (seconds)."""
+        lines: list[str] = []
+
+        def summary(name: str, help_text: str, series: list[tuple[str, LatencyHistogram]]) -> None:
+            if not series:
+                return
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for labels, histogram in series:
+                for quantile in self.QUANTILES:
+                    lines.append(f'{prefix}_{name}{{{labels},quantile="{quantile}"}} '
+                                 f"{histogram.percentile(quantile * 100) / 1e9:.9f}")
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {histogram.total / 1e9:.9f}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {histogram.count}")
+
+        summary("section_seconds", "Time from entering to leaving a menu section.",
+                [(f'section="{name}"', histogram) for name, histogram in sorted(self.sections.items())])
+        summary("phase_seconds", "Time per step of a section, split into input wait, compute and render.",
+                [(f'section="{name}",phase="{phase}"', histogram)
+                 for (name, phase), histogram in sorted(self.phases.items())])
+        summary("operation_seconds", "Time from the prompt that started an operation to the next prompt.",
+                [(f'operation="{name}"', histogram) for name, histogram in sorted(self.operations.items())])
+        if self.counters:
+            lines.append(f"# HELP {prefix}_operations_total Operations performed by the chapters.")
+            lines.append(f"# TYPE {prefix}_operations_total counter")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f'{prefix}_operations_total{{operation="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str, format: str = "json") -> None:
+        """
+        Writes the metrics to a file.
+
+        Args:
+            path (str): Destination file.
+            format (str): "json" or "prometheus".
+
+        Raises:
+            ValueError: For an unknown format.
+        """
+        if format == "json":
+            import json
+            text = json.dumps(self.to_json(), indent=2) + "\n"
+        elif format == "prometheus":
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown metrics format {format!r}; use json or prometheus.")
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(text)
+
+    def report(self) -> str:
+        """A short human-readable table of median and p99 per section phase."""
+        lines = [f"{'section':<12} {'phase':<11} {'count':>8} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for (name, phase), histogram in sorted(self.phases.items()):
+            lines.append(f"{name:<12} {phase:<11} {histogram.count:>8} {histogram.percentile(50) / 1e6:>9.3f} "
+                         f"{histogram.percentile(99) / 1e6:>9.3f} {histogram.max / 1e6:>9.3f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<24} {value:>8}")
+        return "\n".join(lines)
+
+
+class _Section:
+    """Context manager attributing a stretch of a session to a menu section."""
+
+    __slots__ = ("console", "name", "start")
+
+    def __init__(self, console: InstrumentedConsole, name: str) -> None:
+        self.console = console
+        self.name = name
+
+    def __enter__(self) -> _Section:
+        console = self.console
+        console.end_step()
+        console.stack.append(self.name)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        console = self.console
+        console.end_step()
+        console.stack.pop()
+        console.metrics.section(self.name).record(time.perf_counter_ns() - self.start)
+
+
+class InstrumentedConsole(Console):
+    """
+    Wraps another console and times every step of a session.
+
+    A step runs from one reply to the next prompt. Its duration is split into
+    render time (inside write()) and compute time (the rest); the wait for the
+    reply itself is recorded as input_wait. Steps are attributed to the
+    innermost section (``with console.section("chapter4"):``), and to the last
+    operation passed to count() during the step.
+    """
+
+    def __init__(self, inner: Console, metrics: Metrics | None = None) -> None:
+        super().__init__(inner.output)
+        self.inner = inner
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.stack = ["menu"]
+        self._step_start = time.perf_counter_ns()
+        self._render_ns = 0
+        self._operation: str | None = None
+
+    def write(self, text: str) -> None:
+        start = time.perf_counter_ns()
+        self.inner.write(text)
+        self._render_ns += time.perf_counter_ns() - start
+
+    def end_step(self) -> None:
+        """Records the step that has just finished and starts a new one."""
+        now = time.perf_counter_ns()
+        elapsed = now - self._step_start
+        section = self.stack[-1]
+        self.metrics.phase(section, "render").record(self._render_ns)
+        self.metrics.phase(section, "compute").record(elapsed - self._render_ns)
+        if self._operation is not None:
+            self.metrics.operation(self._operation).record(elapsed)
+            self._operation = None
+        self._render_ns = 0
+        self._step_start = now
+
+    async def input(self, prompt: str = "") -> str:
+        self.end_step()
+        start = self._step_start
+        try:
+            return await self.inner.input(prompt)
+        finally:
+            self._step_start = time.perf_counter_ns()
+            self.metrics.phase(self.stack[-1], "input_wait").record(self._step_start - start)
+
+    def count(self, operation: str) -> None:
+        self.metrics.count(operation)
+        self._operation = operation
+
+    def section(self, name: str) -> _Section:
+        return _Section(self, name)
+
+    def flush(self) -> None:
+        self.inner.flush()
@@ -0,0 +1,217 @@
+"""
+Chapter Registry
+----------------
+A dispatch table for the main menu of Python-Book-1.py. Each entry carries its
+menu key, title and how to run it, so adding a chapter is a single
+registration. Standalone example scripts (Python-Book-1-1.py, ...) are
+discovered from their file names and docstrings without importing them; a
+script and its dependencies (tkinter, Pillow, ...) are only loaded when its
+entry is selected.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import re
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+
+from academy.console import Console, run_sync
+
+ChapterRunner = Callable[..., Awaitable[None]]
+
+_IMPORT_PATTERN = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_]\w*)", re.MULTILINE)
+
+
+class ChapterEntry:
+    """
+    One menu entry.
+
+    Built-in chapters are coroutine functions taking the console (and, when
+    ``pass_args`` is set, the parsed command-line flags). Script entries point
+    at a standalone example whose ``main()`` is run with input() and print()
+    routed through the console.
+    """
+
+    __slots__ = ("key", "title", "runner", "pass_args", "path", "imports", "_module")
+
+    def __init__(self, key: str, title: str, runner: ChapterRunner | None = None, *,
+                 pass_args: bool = False, path: str | None = None,
+                 imports: tuple[str, ...] = ()) -> None:
+        self.key = key
+        self.title = title
+        self.runner = runner
+        self.pass_args = pass_args
+        self.path = path
+        self.imports = imports
+        self._module = None
+
+    @property
+    def is_gui(self) -> bool:
+        """True for scripts that open a Tk window."""
+        return "tkinter" in self.imports
+
+    def load_module(self) -> object:
+        """Imports the entry's script on first use and returns the module."""
+        if self._module is None:
+            import importlib.util
+            name = "academy_script_" + re.sub(r"\W", "_", os.path.basename(self.path)[:-3]).lower()
+            spec = importlib.util.spec_from_file_location(name, self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._module = module
+        return self._module
+
+    async def run(self, console: Console, args: object = None) -> None:
+        """
+        Runs the chapter on the given console.
+
+        A standalone script that fails to import or raises while running is
+        reported on the console and the menu carries on; running out of
+        scripted input (EOFError) still ends the session.
+        """
+        if self.runner is not None:
+            if self.pass_args:
+                await self.runner(console, args)
+            else:
+                await self.runner(console)
+            return
+        try:
+            module = self.load_module()
+        except EOFError:
+            raise
+        except Exception as exc:
+            console.print(f"Could not start {self.title}: {exc}")
+            return
+
+        def script_input(prompt: object = "") -> str:
+            return run_sync(console.input(str(prompt)))
+
+        def script_print(*values: object, sep: str | None = " ", end: str | None = "\n",
+                         file: object = None, flush: bool = False) -> None:
+            if file is not None and file is not sys.stdout:
+                builtins.print(*values, sep=sep, end=end, file=file, flush=flush)
+            else:
+                console.print(*values, sep=" " if sep is None else sep, end="\n" if end is None else end)
+
+        # The standalone scripts call input()/print() directly; shadow them in
+        # the script's globals so scripted and recorded sessions still apply.
+        module.input, module.print = script_input, script_print
+        try:
+            module.main()
+        except EOFError:
+            raise
+        except Exception as exc:
+            console.print(f"{self.title} stopped with an error: {exc}")
+        finally:
+            del module.input, module.print
+
+
+class ChapterRegistry:
+    """
+    Ordered collection of menu entries keyed by their menu number.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, ChapterEntry] = {}
+        self._ordered: list[ChapterEntry] | None = None
+
+    def add(self, entry: ChapterEntry) -> ChapterEntry:
+        if entry.key in self._entries:
+            raise ValueError(f"Menu key {entry.key!r} is already used by {self._entries[entry.key].title!r}.")
+        self._entries[entry.key] = entry
+        self._ordered = None
+        return entry
+
+    def chapter(self, key: str, title: str, *, pass_args: bool = False) -> Callable[[ChapterRunner], ChapterRunner]:
+        """
+        Decorator registering a built-in chapter coroutine under a menu key.
+        """
+        def register(runner: ChapterRunner) -> ChapterRunner:
+            self.add(ChapterEntry(key, title, runner, pass_args=pass_args))
+            return runner
+        return register
+
+    def discover(self, directory: str, pattern: str = r"Python-Book-[\w-]+\.py",
+                 exclude: tuple[str, ...] = (), first_key: int = 1) -> list[ChapterEntry]:
+        """
+        Registers the standalone example scripts found in a directory.
+
+        Only the start of each file is read (for its title and imports); the
+        scripts themselves are imported when selected.
+
+        Args:
+            directory (str): Folder to scan.
+            pattern (str): Regular expression file names must match.
+            exclude (tuple[str, ...]): File names to skip (e.g. the menu script).
+            first_key (int): Lowest menu number to hand out.
+
+        Returns:
+            list[ChapterEntry]: The newly registered entries.
+        """
+        found = []
+        matcher = re.compile(pattern)
+        key = first_key
+        for name in sorted(os.listdir(directory)):
+            if name in exclude or not matcher.fullmatch(name):
+                continue
+            path = os.path.join(directory, name)
+            title, imports = read_script_metadata(path)
+            while str(key) in self._entries:
+                key += 1
+            found.append(self.add(ChapterEntry(str(key), title, path=path, imports=imports)))
+        return found
+
+    def get(self, key: str) -> ChapterEntry | None:
+        return self._entries.get(key)
+
+    def __iter__(self) -> Iterator[ChapterEntry]:
+        if self._ordered is None:
+            self._ordered = sorted(self._entries.values(), key=lambda entry: int(entry.key))
+        return iter(self._ordered)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def read_script_metadata(path: str, limit: int = 16_384) -> tuple[str, tuple[str, ...]]:
+    """
+    Reads a script's title (first line of its docstring) and imported modules.
+
+    Args:
+        path (str): Script to inspect.
+        limit (int): Maximum number of characters read.
+
+    Returns:
+        tuple[str, tuple[str, ...]]: The title (the file name when there is no
+        docstring) and the sorted top-level names of imported modules.
+    """
+    with open(path, encoding="utf-8") as script:
+        text = script.read(limit)
+    title = os.path.basename(path)
+    match = re.search(r'^[rRuU]?("""|\'\'\')\s*(.+)', text, re.MULTILINE)
+    if match:
+        title = match.group(2).strip().strip('"\'')
+    return title, tuple(sorted(set(_IMPORT_PATTERN.findall(text))))
+
+
+def measure_cold_start(script: str, runs: int = 10, replies: str = "7\n") -> list[float]:
+    """
+    Times complete cold starts of a menu script in fresh interpreters.
+
+    Each run starts ``python SCRIPT --script -``, answers the menu with the
+    given replies (by default "7", i.e. Exit) and waits for it to finish.
+
+    Returns:
+        list[float]: Wall-clock seconds per run, sorted.
+    """
+    import subprocess
+    import time
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, "--script", "-"], input=replies.encode(),
+                       stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)
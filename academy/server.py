@@ -0,0 +1,372 @@
+"""
+Classroom Server
+----------------
+Hosts the chapter programs for many learners at once from a single process.
+
+Each TCP connection gets its own session: the main menu coroutine from
+Python-Book-1.py runs on a StreamConsole, so every chapter's state (to-do
+list, contacts, the number to guess) lives in that session's coroutine frames
+and nowhere else. The protocol is plain lines of UTF-8 text, so telnet or
+``nc HOST PORT`` work as clients. Prompts are sent without a trailing newline
+and end in ": " or "? ".
+
+Per-session memory stays bounded because replies are limited to one line of
+max_line bytes, output is sent as soon as the chapter asks for input and is
+not read further until the client has accepted it (drain), and idle sessions
+are closed after idle_timeout seconds.
+
+run_load_test() is the bundled load generator: it plays a fixed classroom
+scenario from many simulated learners and reports throughput and latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from academy.console import Console
+
+SessionFactory = Callable[[Console], Awaitable[None]]
+
+# Replies sent by each simulated learner per scenario round, one per prompt.
+LOAD_TEST_ROUND = (
+    "1", "Learner",                                  # Chapter 1
+    "2", "12", "4", "4",                             # Chapter 2: 12 / 4
+    "4", "1", "Read chapter 4", "", "", "", "2", "7",  # Chapter 4: add and view a task
+    "6", "1", "Ada Lovelace", "555-0100", "3", "ada", "5",  # Chapter 6: add and search
+)
+
+
+class SessionTimeout(EOFError):
+    """Raised inside a session when the learner has been idle for too long."""
+
+
+def parse_address(text: str, default_host: str = "127.0.0.1") -> tuple[str, int]:
+    """
+    Parses "PORT" or "HOST:PORT".
+
+    Raises:
+        ValueError: If the port is not a number.
+    """
+    host, _, port = text.rpartition(":")
+    return host or default_host, int(port)
+
+
+def raise_file_limit() -> None:
+    """Raises the open-file soft limit to the hard limit so thousands of sockets fit."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard if hard != resource.RLIM_INFINITY else 65_536, hard))
+        except (ValueError, OSError):
+            pass
+
+
+class StreamConsole(Console):
+    """
+    Console for one network session.
+
+    Output is collected in memory and sent in a single write whenever the
+    chapter asks for input. The write is followed by ``drain()``, so a client
+    that stops reading holds up only its own session. Replies are read a line
+    at a time; ``waiting_since`` records when the current wait (for the client
+    to take the output or to reply) began, so the server can expire idle
+    sessions without a timer per reply.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Args:
+            reader (asyncio.StreamReader): Incoming side of the connection.
+            writer (asyncio.StreamWriter): Outgoing side of the connection.
+        """
+        self.output = None
+        self.reader = reader
+        self.writer = writer
+        self.waiting_since: float | None = None
+        self.expired = False
+        self._buffer: list[str] = []
+
+    def write(self, text: str) -> None:
+        self._buffer.append(text)
+
+    async def send(self) -> None:
+        """Sends the buffered output and waits until the transport accepts it."""
+        if self._buffer:
+            self.writer.write("".join(self._buffer).encode("utf-8"))
+            self._buffer.clear()
+            await self.writer.drain()
+
+    async def input(self, prompt: str = "") -> str:
+        """
+        Sends pending output and the prompt, then waits for one line.
+
+        Raises:
+            EOFError: When the client disconnects.
+            SessionTimeout: When the server expired the session while waiting.
+            ValueError: When the reply is longer than the reader's line limit.
+        """
+        self._buffer.append(prompt)
+        self.waiting_since = time.monotonic()
+        try:
+            await self.send()
+            line = await self.reader.readline()
+        finally:
+            self.waiting_since = None
+        if self.expired:
+            raise SessionTimeout("No reply in time.")
+        if not line:
+            raise EOFError("Client disconnected.")
+        return line.decode("utf-8", "replace").rstrip("\r\n")
+
+    def expire(self) -> None:
+        """Ends the current wait for a reply; input() then raises SessionTimeout."""
+        self.expired = True
+        self.reader.feed_eof()
+        if self.writer.transport.get_write_buffer_size():
+            # Stuck in drain(): the client stopped reading, so drop the connection.
+            self.writer.transport.abort()
+
+    def flush(self) -> None:
+        """Hands buffered output to the transport without waiting for it to be sent."""
+        if self._buffer and not self.writer.is_closing():
+            self.writer.write("".join(self._buffer).encode("utf-8"))
+        self._buffer.clear()
+
+
+class ChapterServer:
+    """
+    Accepts connections and runs one session coroutine per connection.
+    """
+
+    def __init__(self, session: SessionFactory, idle_timeout: float = 300.0,
+                 max_sessions: int = 10_000, max_line: int = 1024) -> None:
+        """
+        Args:
+            session (SessionFactory): Coroutine function run for each connection,
+                e.g. the main menu of Python-Book-1.py.
+            idle_timeout (float): Seconds a session may wait for a reply.
+            max_sessions (int): Connections served at once; later ones are turned away.
+            max_line (int): Longest reply accepted, in bytes.
+        """
+        self.session = session
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.max_line = max_line
+        self.active = 0
+        self.peak = 0
+        self.served = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.failed = 0
+        self._consoles: set[StreamConsole] = set()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Runs one learner's session from connect to disconnect."""
+        if self.active >= self.max_sessions:
+            self.rejected += 1
+            writer.write(b"The classroom is full. Please try again later.\n")
+            await self._close(writer)
+            return
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        console = StreamConsole(reader, writer)
+        self._consoles.add(console)
+        try:
+            await self.session(console)
+        except SessionTimeout:
+            console.print(f"\nSession closed: no reply for {self.idle_timeout:g} seconds.")
+        except (EOFError, ConnectionError):
+            pass
+        except ValueError:
+            # StreamReader.readline() reports an over-long line as ValueError.
+            console.print(f"\nSession closed: replies are limited to {self.max_line} bytes.")
+        except Exception as exc:
+            self.failed += 1
+            print(f"Session error: {exc!r}", file=sys.stderr)
+        finally:
+            self.timed_out += console.expired
+            self._consoles.discard(console)
+            self.active -= 1
+            self.served += 1
+            console.flush()
+            await self._close(writer)
+
+    async def expire_idle_sessions(self) -> None:
+        """
+        Periodically ends sessions that have waited longer than idle_timeout.
+
+        One sweep over all sessions replaces a timer per reply, which keeps the
+        per-reply cost of the event loop low with thousands of sessions.
+        """
+        interval = max(0.05, min(self.idle_timeout / 4, 5.0))
+        while True:
+            await asyncio.sleep(interval)
+            deadline = time.monotonic() - self.idle_timeout
+            for console in self._consoles:
+                if console.waiting_since is not None and console.waiting_since < deadline:
+                    console.expire()
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def serve(self, host: str, port: int, ready: Callable[[str, int], None] | None = None) -> None:
+        """
+        Listens on host:port until cancelled or sent SIGTERM.
+
+        Args:
+            host (str): Interface to bind.
+            port (int): TCP port; 0 picks a free one.
+            ready (Callable[[str, int], None] | None): Called with the bound address.
+        """
+        server = await asyncio.start_server(self.handle, host, port, limit=self.max_line, backlog=4096)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        if ready is not None:
+            ready(bound_host, bound_port)
+        try:
+            import signal
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (ImportError, AttributeError, NotImplementedError):
+            pass  # No SIGTERM handling on this platform; Ctrl+C still works.
+        sweeper = asyncio.create_task(self.expire_idle_sessions())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+    def summary(self) -> str:
+        """One line of session counters plus the process's peak memory."""
+        line = (f"Served {self.served} sessions (peak {self.peak} concurrent, "
+                f"{self.timed_out} timed out, {self.rejected} turned away, {self.failed} failed)")
+        try:
+            import resource
+        except ImportError:
+            return line + "."
+        peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_kib //= 1024
+        return line + f", peak memory {peak_kib / 1024:.1f} MiB."
+
+
+def run_server(session: SessionFactory, address: str, idle_timeout: float = 300.0,
+               max_sessions: int = 10_000) -> None:
+    """
+    Serves sessions on the given address until interrupted (Ctrl+C or SIGTERM).
+
+    Args:
+        session (SessionFactory): Coroutine function run for each connection.
+        address (str): "PORT" or "HOST:PORT" (host defaults to 127.0.0.1).
+        idle_timeout (float): Seconds a session may wait for a reply.
+        max_sessions (int): Connections served at once.
+    """
+    host, port = parse_address(address)
+    raise_file_limit()
+    server = ChapterServer(session, idle_timeout, max_sessions)
+
+    def ready(bound_host: str, bound_port: int) -> None:
+        print(f"Serving the chapter programs on {bound_host}:{bound_port} "
+              f"(idle timeout {idle_timeout:g} s, up to {max_sessions} sessions). Press Ctrl+C to stop.",
+              flush=True)
+
+    try:
+        asyncio.run(server.serve(host, port, ready))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    print(server.summary())
+
+
+_PROMPT_ENDINGS = (b": ", b"? ")
+
+
+async def _read_prompt(reader: asyncio.StreamReader, timeout: float) -> bytes:
+    """Reads output until it ends in a prompt (or the server closes the connection)."""
+    received = b""
+    while not received.endswith(_PROMPT_ENDINGS):
+        chunk = await asyncio.wait_for(reader.read(65_536), timeout)
+        if not chunk:
+            break
+        received += chunk
+    return received
+
+
+async def _simulated_learner(host: str, port: int, rounds: int, latencies: list[float],
+                             connect_gate: asyncio.Semaphore, timeout: float) -> bool:
+    """
+    Plays the load-test scenario once over a fresh connection.
+
+    Returns:
+        bool: True when the session ended with the server's goodbye message.
+    """
+    async with connect_gate:
+        reader, writer = await asyncio.open_connection(host, port)
+    clock = time.perf_counter
+    try:
+        await _read_prompt(reader, timeout)
+        for _ in range(rounds):
+            for reply in LOAD_TEST_ROUND:
+                start = clock()
+                writer.write(reply.encode() + b"\n")
+                await _read_prompt(reader, timeout)
+                latencies.append(clock() - start)
+        writer.write(b"7\n")
+        farewell = await reader.read()
+        return b"Goodbye!" in farewell
+    finally:
+        writer.close()
+
+
+async def _load_test(host: str, port: int, sessions: int, rounds: int, timeout: float) -> tuple[int, list[float], float]:
+    latencies: list[float] = []
+    # Limit connection attempts in flight so the listen backlog never overflows.
+    connect_gate = asyncio.Semaphore(256)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_simulated_learner(host, port, rounds, latencies, connect_gate, timeout)
+                                     for _ in range(sessions)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    completed = sum(1 for result in results if result is True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        print(f"{len(errors)} sessions failed, e.g. {errors[0]!r}", file=sys.stderr)
+    return completed, latencies, elapsed
+
+
+def run_load_test(address: str, sessions: int = 1000, rounds: int = 5, timeout: float = 30.0) -> bool:
+    """
+    Connects many simulated learners to a running server and reports the results.
+
+    Every learner keeps its connection open for the whole scenario, so all
+    sessions are live on the server at the same time.
+
+    Args:
+        address (str): "PORT" or "HOST:PORT" of the server.
+        sessions (int): Simultaneous learners.
+        rounds (int): Times each learner plays LOAD_TEST_ROUND.
+        timeout (float): Seconds to wait for any single reply.
+
+    Returns:
+        bool: True when every session completed.
+    """
+    host, port = parse_address(address)
+    raise_file_limit()
+    completed, latencies, elapsed = asyncio.run(_load_test(host, port, sessions, rounds, timeout))
+    latencies.sort()
+    print(f"{completed}/{sessions} sessions completed in {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:,.0f} replies/s).")
+    if latencies:
+        def percentile(fraction: float) -> float:
+            return 1000 * latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+        print(f"Reply latency: p50 {percentile(0.50):.2f} ms, p99 {percentile(0.99):.2f} ms, "
+              f"max {1000 * latencies[-1]:.2f} ms.")
+    return completed == sessions
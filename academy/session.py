@@ -0,0 +1,230 @@
+"""
+Session Checkpoints
+-------------------
+Chapter state that outlives a visit to the chapter and the program itself
+(--session in Python-Book-1.py): the to-do list, the contacts and a game of
+Guess the Number in progress are saved when their chapter is left and
+restored the next time it is entered.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+
+from academy.console import Console
+
+State = TypeVar("State")
+
+
+class SessionCheckpoint:
+    """
+    Per-chapter state kept in one memory-mapped file.
+
+    Layout (little-endian):
+      * a 24-byte header: magic, format version, number of sections, length
+        and CRC-32 of the directory, and a CRC-32 of the header itself;
+      * the directory: one 40-byte entry per section with its name (up to
+        16 bytes of UTF-8), offset, length and CRC-32;
+      * the sections, each starting on its own page.
+
+    Opening a checkpoint maps the file and checks only the header and the
+    directory. A section is checksummed and decoded when its chapter is
+    entered, straight from the mapping, so resuming one chapter reads that
+    chapter's pages and no others.
+
+    save() encodes only the chapter being left. The other sections are
+    copied into the new file byte for byte, with their checksums, without
+    being decoded, and the new file replaces the old one with os.replace(),
+    so a crash leaves either the old or the new checkpoint. A section whose
+    content did not change is not written at all.
+
+    VERSION is stored in the header and must be raised whenever the file
+    layout or a chapter's encoding changes; files of another version are
+    refused rather than misread.
+    """
+
+    VERSION = 1
+    _MAGIC = b"ID01TSC1"
+    _HEADER = struct.Struct("<8sHHIII")
+    _ENTRY = struct.Struct("<16sQQI4x")
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens the checkpoint at path; a missing file is an empty checkpoint.
+
+        Raises:
+            ValueError: If the file is not a session checkpoint, was written
+                by another format version, or its directory is damaged.
+        """
+        self.path = path
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._sections: dict[str, tuple[int, int, int]] = {}
+        self._open()
+
+    def _open(self) -> None:
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        if os.fstat(file.fileno()).st_size == 0:
+            file.close()
+            return
+        self._file = file
+        self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._sections = self._read_directory()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_directory(self) -> dict[str, tuple[int, int, int]]:
+        """Returns name -> (offset, length, crc) after checking the header and directory."""
+        mapping = self._map
+        header_size = self._HEADER.size
+        if len(mapping) < header_size or mapping[:8] != self._MAGIC:
+            raise ValueError(f"{self.path} is not an iD01t session checkpoint.")
+        magic, version, count, directory_length, directory_crc, header_crc = self._HEADER.unpack_from(mapping)
+        if zlib.crc32(mapping[:header_size - 4]) != header_crc:
+            raise ValueError(f"{self.path} is damaged (bad header checksum).")
+        if version != self.VERSION:
+            raise ValueError(f"{self.path} uses checkpoint format {version}; "
+                             f"this version reads format {self.VERSION}.")
+        directory = mapping[header_size:header_size + directory_length]
+        if directory_length != count * self._ENTRY.size or len(directory) != directory_length \
+                or zlib.crc32(directory) != directory_crc:
+            raise ValueError(f"{self.path} is damaged (bad directory).")
+        sections = {}
+        for name, offset, length, crc in self._ENTRY.iter_unpack(directory):
+            if offset + length > len(mapping):
+                raise ValueError(f"{self.path} is truncated.")
+            sections[name.rstrip(b"\0").decode()] = (offset, length, crc)
+        return sections
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sections
+
+    def restore(self, name: str, decode: Callable[[memoryview], State]) -> State | None:
+        """
+        Decodes one chapter's saved state.
+
+        Args:
+            name (str): Section name, e.g. "todo".
+            decode (Callable[[memoryview], State]): Builds the state from the
+                section's bytes; it must not keep the view.
+
+        Returns:
+            State | None: The state, or None when nothing is saved under name.
+
+        Raises:
+            ValueError: If the section fails its checksum or cannot be decoded.
+        """
+        entry = self._sections.get(name)
+        if entry is None:
+            return None
+        offset, length, crc = entry
+        with memoryview(self._map) as whole, whole[offset:offset + length] as view:
+            if zlib.crc32(view) != crc:
+                raise ValueError(f"The saved {name} state in {self.path} is damaged.")
+            try:
+                return decode(view)
+            except ValueError as exc:
+                raise ValueError(f"The saved {name} state in {self.path} is unreadable ({exc}).") from None
+
+    def save(self, name: str, payload: bytes | None) -> None:
+        """
+        Stores one chapter's encoded state, or removes it when payload is None.
+
+        Raises:
+            ValueError: If the name is longer than 16 bytes.
+        """
+        key = name.encode()
+        if len(key) > 16:
+            raise ValueError(f"Section names are limited to 16 bytes: {name!r}.")
+        checksum = zlib.crc32(payload) if payload is not None else 0
+        current = self._sections.get(name)
+        if payload is None and current is None:
+            return
+        if payload is not None and current is not None and current[1:] == (len(payload), checksum):
+            return
+        sections: list[tuple[str, int, int, bytes | None]] = [
+            (other, length, crc, None) for other, (_, length, crc) in self._sections.items() if other != name]
+        if payload is not None:
+            sections.append((name, len(payload), checksum, payload))
+
+        page = mmap.PAGESIZE
+        offset = self._HEADER.size + len(sections) * self._ENTRY.size
+        placed = []
+        for section_name, length, crc, data in sections:
+            offset = -(-offset // page) * page
+            placed.append((section_name, offset, length, crc, data))
+            offset += length
+        directory = b"".join(self._ENTRY.pack(section_name.encode(), start, length, crc)
+                             for section_name, start, length, crc, _ in placed)
+        fields = self._HEADER.pack(self._MAGIC, self.VERSION, len(placed), len(directory),
+                                   zlib.crc32(directory), 0)[:-4]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(fields + zlib.crc32(fields).to_bytes(4, "little"))
+            out.write(directory)
+            for section_name, start, length, _, data in placed:
+                out.seek(start)
+                if data is not None:
+                    out.write(data)
+                else:
+                    source = self._sections[section_name][0]
+                    with memoryview(self._map) as whole, whole[source:source + length] as view:
+                        out.write(view)
+            out.flush()
+            os.fsync(out.fileno())
+        # The old mapping must be released before its file is replaced.
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._open()
+
+    @contextlib.contextmanager
+    def chapter_state(self, console: Console, name: str, decode: Callable[[memoryview], State],
+                      encode: Callable[[State], bytes | None], fresh: Callable[[], State]) -> Iterator[State]:
+        """
+        Provides a chapter's saved state for one visit and saves it afterwards.
+
+        The state is saved however the visit ends, including end of input.
+        Damaged state is reported on the console and replaced by fresh().
+
+        Args:
+            console (Console): Where a damaged section is reported.
+            name (str): Section name.
+            decode (Callable[[memoryview], State]): See restore().
+            encode (Callable[[State], bytes | None]): Serializes the state; None removes it.
+            fresh (Callable[[], State]): Creates the state when none is saved.
+        """
+        try:
+            state = self.restore(name, decode)
+        except ValueError as exc:
+            console.print(f"{exc} Starting over.")
+            state = None
+        if state is None:
+            state = fresh()
+        try:
+            yield state
+        finally:
+            self.save(name, encode(state))
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+        self._sections = {}
+
+    def __enter__(self) -> SessionCheckpoint:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,631 @@
+"""
+To-Do Engine
+------------
+Task storage and scheduling behind Chapter 4: To-Do List CLI App in
+Python-Book-1.py.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import functools
+import gc
+import heapq
+import os
+import struct
+import time
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+
+DEFAULT_PRIORITY = 3
+PRIORITY_RANGE = range(1, 6)
+
+# Heap key for tasks without a due date: after every dated task.
+_NO_DUE = datetime.date.max.toordinal() + 1
+
+
+class Task(NamedTuple):
+    """
+    One entry of the to-do list.
+
+    Attributes:
+        task_id: Stable id, never reused while the list exists.
+        title: What needs doing.
+        priority: 1 (most urgent) to 5 (least urgent).
+        due: Due date, or None.
+        tags: Lower-case tags, in the order given.
+    """
+    task_id: int
+    title: str
+    priority: int = DEFAULT_PRIORITY
+    due: datetime.date | None = None
+    tags: tuple[str, ...] = ()
+
+    def describe(self) -> str:
+        """Formats the task as one line of the to-do listing."""
+        details = [f"priority {self.priority}"]
+        if self.due is not None:
+            details.append(f"due {self.due.isoformat()}")
+        if self.tags:
+            details.append(" ".join(f"#{tag}" for tag in self.tags))
+        return f"[{self.task_id}] {self.title} ({', '.join(details)})"
+
+
+def parse_priority(text: str) -> int:
+    """
+    Parses a priority typed as a number from 1 to 5; blank means DEFAULT_PRIORITY.
+
+    Raises:
+        ValueError: If the text is not a whole number from 1 to 5.
+    """
+    text = text.strip()
+    if not text:
+        return DEFAULT_PRIORITY
+    if not text.isdecimal() or int(text) not in PRIORITY_RANGE:
+        raise ValueError(f"Priority must be a number between {PRIORITY_RANGE[0]} and {PRIORITY_RANGE[-1]}.")
+    return int(text)
+
+
+def parse_due_date(text: str) -> datetime.date | None:
+    """
+    Parses a due date typed as YYYY-MM-DD; blank means no due date.
+
+    Raises:
+        ValueError: If the text is not a valid date.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise ValueError("Dates must be real calendar dates written as YYYY-MM-DD.") from None
+
+
+def normalize_tag(tag: str) -> str:
+    """Lower-cases a tag and drops surrounding whitespace and any '#' prefix."""
+    return tag.strip().lstrip("#").lower()
+
+
+def parse_tags(text: str) -> tuple[str, ...]:
+    """Splits comma- or space-separated tags, dropping '#' prefixes and duplicates."""
+    tags = (normalize_tag(tag) for tag in text.replace(",", " ").split())
+    return tuple(dict.fromkeys(tag for tag in tags if tag))
+
+
+class TaskScheduler:
+    """
+    Indexed to-do list with stable task ids.
+
+    Structures:
+      * ``_tasks`` maps id -> Task in insertion order, so listing, lookup and
+        removal by id are O(1) and ids never shift when a task is removed;
+      * a heap of (due ordinal, priority, id) answers "what is next?";
+        removal leaves the entry behind and next_task() discards such stale
+        entries as it meets them, so every operation stays O(log n). The
+        heap is rebuilt once stale entries outnumber live tasks;
+      * ``_by_tag`` maps each tag to the ids carrying it;
+      * ``_by_day`` buckets ids by due date, with the distinct due days kept
+        in a sorted list. Range queries bisect the day list and walk only the
+        buckets inside the range. The day list holds one entry per distinct
+        date, not per task, so keeping it sorted is cheap even at millions
+        of tasks.
+
+    to_bytes() and from_bytes() save and restore the whole list in the
+    columnar layout described in DurableTaskScheduler.
+    """
+
+    # Columns of a snapshot, in file order, with their array typecodes
+    # ("" for UTF-8 text, each item followed by a NUL).
+    _SECTIONS = (("ids", "q"), ("priorities", "B"), ("days", "i"), ("titles", ""), ("tags", ""),
+                 ("heap_days", "i"), ("heap_priorities", "B"), ("heap_ids", "q"),
+                 ("tag_names", ""), ("tag_counts", "q"), ("tag_ids", "q"),
+                 ("day_keys", "i"), ("day_counts", "q"), ("day_ids", "q"))
+    _COLUMNS_HEADER = struct.Struct("<QQ")
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._tasks: dict[int, Task] = {}
+        self._heap: list[tuple[int, int, int]] = []
+        self._stale = 0
+        self._by_tag: dict[str, set[int]] = {}
+        self._by_day: dict[int, set[int]] = {}
+        self._days: list[int] = []
+        self._next_id = 1
+        for task in tasks:
+            self._insert(task)
+
+    def add(self, title: str, priority: int = DEFAULT_PRIORITY, due: datetime.date | None = None,
+            tags: Iterable[str] = ()) -> Task:
+        """
+        Adds a task and returns it with its new id. Tags are normalized with
+        normalize_tag(), so "#Study" and "study" are the same tag.
+
+        Raises:
+            ValueError: If the priority is outside 1-5, the title contains a
+                NUL character or a tag contains whitespace (to_bytes() could
+                not store them).
+        """
+        tags = tuple(dict.fromkeys(map(normalize_tag, tags)))
+        if priority not in PRIORITY_RANGE:
+            raise ValueError(f"Priority must be between {PRIORITY_RANGE[0]} and {PRIORITY_RANGE[-1]}.")
+        if "\0" in title or any(not tag or tag.split() != [tag] or "\0" in tag for tag in tags):
+            raise ValueError("Titles cannot contain NUL characters and tags cannot contain whitespace.")
+        task = Task(self._next_id, title, priority, due, tags)
+        self._insert(task)
+        return task
+
+    def _insert(self, task: Task) -> None:
+        self._tasks[task.task_id] = task
+        self._next_id = max(self._next_id, task.task_id + 1)
+        day = task.due.toordinal() if task.due is not None else _NO_DUE
+        heapq.heappush(self._heap, (day, task.priority, task.task_id))
+        for tag in task.tags:
+            self._by_tag.setdefault(tag, set()).add(task.task_id)
+        if task.due is not None:
+            bucket = self._by_day.get(day)
+            if bucket is None:
+                bucket = self._by_day[day] = set()
+                bisect.insort(self._days, day)
+            bucket.add(task.task_id)
+
+    def remove(self, task_id: int) -> Task:
+        """
+        Removes a task by id and returns it.
+
+        Raises:
+            KeyError: If there is no task with that id.
+        """
+        task = self._tasks.pop(task_id)
+        for tag in task.tags:
+            ids = self._by_tag[tag]
+            ids.discard(task_id)
+            if not ids:
+                del self._by_tag[tag]
+        if task.due is not None:
+            day = task.due.toordinal()
+            bucket = self._by_day[day]
+            bucket.discard(task_id)
+            if not bucket:
+                del self._by_day[day]
+                del self._days[bisect.bisect_left(self._days, day)]
+        self._stale += 1
+        if self._stale > len(self._tasks) and self._stale > 1024:
+            self._compact_heap()
+        return task
+
+    def next_task(self) -> Task | None:
+        """Returns the task due soonest (most urgent first on ties), or None if the list is empty."""
+        heap = self._heap
+        while heap and heap[0][2] not in self._tasks:
+            heapq.heappop(heap)
+            self._stale -= 1
+        return self._tasks[heap[0][2]] if heap else None
+
+    def with_tag(self, tag: str) -> list[Task]:
+        """Returns the tasks carrying a tag, oldest first."""
+        ids = self._by_tag.get(normalize_tag(tag), ())
+        return [self._tasks[task_id] for task_id in sorted(ids)]
+
+    def due_between(self, start: datetime.date | None, end: datetime.date | None) -> list[Task]:
+        """
+        Returns the tasks due within [start, end], soonest first.
+
+        Args:
+            start (date | None): First day of the range; None means no lower bound.
+            end (date | None): Last day of the range; None means no upper bound.
+        """
+        low = bisect.bisect_left(self._days, start.toordinal()) if start is not None else 0
+        high = bisect.bisect_right(self._days, end.toordinal()) if end is not None else len(self._days)
+        found = []
+        for day in self._days[low:high]:
+            found.extend(sorted((self._tasks[task_id] for task_id in self._by_day[day]),
+                                key=lambda task: (task.priority, task.task_id)))
+        return found
+
+    def _compact_heap(self) -> None:
+        """Drops stale heap entries."""
+        self._heap = [entry for entry in self._heap if entry[2] in self._tasks]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    # -- Columnar form -----------------------------------------------------
+
+    def _dump_columns(self) -> list[bytes]:
+        """Returns the list as one bytes object per entry of _SECTIONS."""
+        self._compact_heap()
+        tasks = list(self._tasks.values())
+        tag_names = list(self._by_tag)
+        columns = {
+            "ids": array("q", self._tasks),
+            "priorities": array("B", [task.priority for task in tasks]),
+            "days": array("i", [task.due.toordinal() if task.due is not None else 0 for task in tasks]),
+            "titles": "".join([f"{task.title}\0" for task in tasks]),
+            "tags": "".join([f"{' '.join(task.tags)}\0" for task in tasks]),
+            "heap_days": array("i", [entry[0] for entry in self._heap]),
+            "heap_priorities": array("B", [entry[1] for entry in self._heap]),
+            "heap_ids": array("q", [entry[2] for entry in self._heap]),
+            "tag_names": "".join([f"{tag}\0" for tag in tag_names]),
+            "tag_counts": array("q", [len(self._by_tag[tag]) for tag in tag_names]),
+            "tag_ids": array("q", [task_id for tag in tag_names for task_id in self._by_tag[tag]]),
+            "day_keys": array("i", self._days),
+            "day_counts": array("q", [len(self._by_day[day]) for day in self._days]),
+            "day_ids": array("q", [task_id for day in self._days for task_id in self._by_day[day]]),
+        }
+        return [column.tobytes() if isinstance(column, array) else column.encode()
+                for column in (columns[name] for name, _ in self._SECTIONS)]
+
+    def _load_columns(self, view: memoryview, lengths: Iterable[int], next_id: int) -> None:
+        """Replaces the list with the columns in view, laid out back to back."""
+        position = 0
+        columns: dict[str, object] = {}
+        for (name, typecode), length in zip(self._SECTIONS, lengths):
+            chunk = view[position:position + length]
+            if typecode:
+                column = array(typecode)
+                column.frombytes(chunk)
+                columns[name] = column
+            else:
+                columns[name] = str(chunk, "utf-8").split("\0")[:-1]
+            position += length
+
+        ids, days = columns["ids"], columns["days"]
+        dates = {day: datetime.date.fromordinal(day) for day in columns["day_keys"]}
+        tags = map(tuple, map(str.split, columns["tags"]))
+        # Rows become Task tuples without calling the Python-level
+        # Task.__new__, and the collector is paused: it would otherwise walk
+        # the growing heap of new tuples many times over.
+        make_task = functools.partial(tuple.__new__, Task)
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            rows = zip(ids, columns["titles"], columns["priorities"], map(dates.get, days), tags)
+            self._tasks = dict(zip(ids, map(make_task, rows)))
+            # The heap was written in heap order, so it needs no heapify.
+            self._heap = list(zip(columns["heap_days"], columns["heap_priorities"], columns["heap_ids"]))
+            self._by_tag = self._load_groups(columns["tag_names"], columns["tag_counts"], columns["tag_ids"])
+            self._by_day = self._load_groups(columns["day_keys"], columns["day_counts"], columns["day_ids"])
+        finally:
+            if collecting:
+                gc.enable()
+        self._stale = 0
+        self._days = list(columns["day_keys"])
+        self._next_id = next_id
+
+    @staticmethod
+    def _load_groups(keys: Iterable[object], counts: array, ids: array) -> dict:
+        groups = {}
+        position = 0
+        for key, count in zip(keys, counts):
+            groups[key] = set(ids[position:position + count])
+            position += count
+        return groups
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the whole list: the next id and the column lengths,
+        followed by the columns of _SECTIONS.
+        """
+        sections = self._dump_columns()
+        return b"".join([self._COLUMNS_HEADER.pack(self._next_id, len(sections)),
+                         array("Q", map(len, sections)).tobytes(), *sections])
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "TaskScheduler":
+        """
+        Rebuilds a list saved with to_bytes().
+
+        Raises:
+            ValueError: If the data is not a serialized list.
+        """
+        view = memoryview(data)
+        try:
+            next_id, section_count = cls._COLUMNS_HEADER.unpack_from(view)
+        except struct.error:
+            raise ValueError("not a serialized to-do list") from None
+        start = cls._COLUMNS_HEADER.size + 8 * section_count
+        if section_count != len(cls._SECTIONS) or len(view) < start:
+            raise ValueError("not a serialized to-do list")
+        lengths = array("Q")
+        lengths.frombytes(view[cls._COLUMNS_HEADER.size:start])
+        if start + sum(lengths) != len(view):
+            raise ValueError("truncated to-do list")
+        scheduler = cls()
+        scheduler._load_columns(view[start:], lengths, next_id)
+        return scheduler
+
+    def sync(self) -> None:
+        """Flushes pending writes to durable storage (no-op for in-memory lists)."""
+
+    def close(self) -> None:
+        """Releases resources held by the list (no-op for in-memory lists)."""
+
+    def __enter__(self) -> "TaskScheduler":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getitem__(self, task_id: int) -> Task:
+        return self._tasks[task_id]
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+class DurableTaskScheduler(TaskScheduler):
+    """
+    TaskScheduler persisted as a write-ahead log plus periodic snapshots.
+
+    Layout:
+      * ``PATH`` is the log. After a 16-byte header (magic + id of the
+        snapshot it continues, zero for none) it holds one record per add
+        or remove: ``crc32 | op | payload length | payload``.
+      * ``PATH.snapshot`` is the whole list in columnar form: arrays of ids,
+        priorities and due days, the titles and tags as two joined text
+        blobs, and the heap, tag index and day index exactly as they are in
+        memory. Recovery reads it with a single sequential read and rebuilds
+        every structure with bulk ``array`` and ``str.split`` calls, then
+        replays only the log records written after it.
+
+    Records are appended to a buffered writer and made durable by group
+    commit: the log is fsynced once ``commit_records`` records are pending
+    or ``commit_interval`` seconds have passed since the last fsync, so an
+    interactive session syncs every change while bulk loads share one fsync
+    between many records. The check runs only when a record is appended:
+    the records after the last commit stay buffered until the next append,
+    ``sync()``, ``snapshot()`` or ``close()``. Callers therefore call
+    ``sync()`` at every point where they go idle, as Chapter 4 does before
+    it waits for input; it returns at once when nothing is pending.
+
+    Once the log holds more records than a quarter of the list (and at least
+    snapshot_records), a snapshot is written and the log restarts empty. A
+    torn record at the end of the log is detected by its checksum and
+    discarded on the next open.
+    """
+
+    _MAGIC = b"ID01TTL1"
+    _SNAPSHOT_MAGIC = b"ID01TTS1"
+    _HEADER = struct.Struct("<8s8s")
+    _SNAPSHOT_HEADER = struct.Struct("<8s8s8sQQQ")
+    _RECORD = struct.Struct("<IBI")
+    _ADD = struct.Struct("<qBi")
+    _REMOVE = struct.Struct("<q")
+    _ADD_OP, _REMOVE_OP = 1, 2
+    _NO_SNAPSHOT = bytes(8)
+
+    def __init__(self, path: str, commit_records: int = 512, commit_interval: float = 0.05,
+                 snapshot_records: int = 10_000) -> None:
+        """
+        Opens (or creates) the to-do list at the given path.
+
+        Args:
+            path (str): Location of the log file; the snapshot lives beside it.
+            commit_records (int): Pending records that force an fsync.
+            commit_interval (float): Seconds after which a new record forces an fsync.
+            snapshot_records (int): Smallest log tail that triggers a snapshot.
+
+        Raises:
+            ValueError: If the files are not an iD01t to-do list, or the log
+                continues a snapshot that is missing or damaged.
+        """
+        super().__init__()
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.commit_records = commit_records
+        self.commit_interval = commit_interval
+        self.snapshot_records = snapshot_records
+        if not os.path.exists(path) or os.path.getsize(path) < self._HEADER.size:
+            self._create_log(path, self._NO_SNAPSHOT)
+        with open(path, "rb") as log:
+            magic, base = self._HEADER.unpack(log.read(self._HEADER.size))
+        if magic != self._MAGIC:
+            raise ValueError(f"{path} is not an iD01t to-do list.")
+        replay_from, rotate = self._recover(base)
+        self._log_size = os.path.getsize(path)
+        self._writer = open(path, "ab")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._tail_records = 0
+        self._replay(replay_from)
+        if rotate:
+            self.snapshot()
+
+    # -- Snapshots ---------------------------------------------------------
+
+    def _recover(self, base: bytes) -> tuple[int, bool]:
+        """
+        Loads the snapshot the log depends on.
+
+        Returns:
+            tuple[int, bool]: The log offset to replay from, and whether the
+            log predates the snapshot (a crash between writing a snapshot and
+            restarting the log) and must be rotated after the replay.
+        """
+        try:
+            with open(self.snapshot_path, "rb") as snapshot:
+                data = snapshot.read()
+            snapshot_id, source_base, source_size = self._load_snapshot(data)
+        except (OSError, ValueError, struct.error):
+            if base != self._NO_SNAPSHOT:
+                raise ValueError(f"{self.snapshot_path} is missing or damaged; "
+                                 f"{self.path} cannot be recovered without it.") from None
+            return self._HEADER.size, False
+        if snapshot_id == base:
+            return self._HEADER.size, False
+        if source_base == base and source_size <= os.path.getsize(self.path):
+            return source_size, True
+        raise ValueError(f"{self.snapshot_path} does not belong to {self.path}.")
+
+    def _load_snapshot(self, data: bytes) -> tuple[bytes, bytes, int]:
+        """Rebuilds every structure from snapshot bytes; returns (id, source base, source size)."""
+        header_size = self._SNAPSHOT_HEADER.size
+        magic, snapshot_id, source_base, source_size, next_id, section_count = \
+            self._SNAPSHOT_HEADER.unpack_from(data)
+        if magic != self._SNAPSHOT_MAGIC or section_count != len(self._SECTIONS):
+            raise ValueError("not a to-do snapshot")
+        lengths = array("Q")
+        lengths.frombytes(data[header_size:header_size + 8 * section_count])
+        position = header_size + 8 * section_count
+        view = memoryview(data)
+        if zlib.crc32(view[position:-4]) != int.from_bytes(data[-4:], "little"):
+            raise ValueError("corrupt snapshot")
+        self._load_columns(view[position:-4], lengths, next_id)
+        return snapshot_id, source_base, source_size
+
+    def snapshot(self) -> None:
+        """Writes a snapshot of the whole list and restarts the log after it."""
+        self.sync()
+        with open(self.path, "rb") as log:
+            source_base = self._HEADER.unpack(log.read(self._HEADER.size))[1]
+        sections = self._dump_columns()
+        snapshot_id = os.urandom(8)
+        checksum = 0
+        for section in sections:
+            checksum = zlib.crc32(section, checksum)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as snapshot:
+            snapshot.write(self._SNAPSHOT_HEADER.pack(self._SNAPSHOT_MAGIC, snapshot_id, source_base,
+                                                      self._log_size, self._next_id, len(sections)))
+            snapshot.write(array("Q", [len(section) for section in sections]).tobytes())
+            for section in sections:
+                snapshot.write(section)
+            snapshot.write(checksum.to_bytes(4, "little"))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # The snapshot now covers the whole log, which restarts empty.
+        self._writer.close()
+        self._create_log(self.path + ".tmp", snapshot_id)
+        os.replace(self.path + ".tmp", self.path)
+        self._writer = open(self.path, "ab")
+        self._log_size = self._HEADER.size
+        self._tail_records = 0
+
+    # -- Log ---------------------------------------------------------------
+
+    @classmethod
+    def _create_log(cls, path: str, base: bytes) -> None:
+        with open(path, "wb") as log:
+            log.write(cls._HEADER.pack(cls._MAGIC, base))
+            log.flush()
+            os.fsync(log.fileno())
+
+    @classmethod
+    def _encode(cls, op: int, payload: bytes) -> bytes:
+        body = bytes((op,)) + len(payload).to_bytes(4, "little") + payload
+        return zlib.crc32(body).to_bytes(4, "little") + body
+
+    def _append(self, record: bytes) -> None:
+        self._writer.write(record)
+        self._log_size += len(record)
+        self._unsynced += 1
+        self._tail_records += 1
+        if self._unsynced >= self.commit_records or time.monotonic() - self._last_sync >= self.commit_interval:
+            self.sync()
+        if self._tail_records >= max(self.snapshot_records, len(self) // 4):
+            self.snapshot()
+
+    def _replay(self, start: int, chunk_size: int = 1 << 20) -> None:
+        """Applies the log records from start, dropping a torn or corrupt tail."""
+        header_size = self._RECORD.size
+        end = start
+        with open(self.path, "rb") as log:
+            log.seek(start)
+            data = b""
+            intact = True
+            while intact:
+                chunk = log.read(chunk_size)
+                if not chunk:
+                    break
+                data += chunk
+                position = 0
+                while position + header_size <= len(data):
+                    checksum, op, length = self._RECORD.unpack_from(data, position)
+                    record_end = position + header_size + length
+                    if record_end > len(data):
+                        break
+                    if zlib.crc32(data[position + 4:record_end]) != checksum:
+                        intact = False
+                        break
+                    self._apply(op, data[position + header_size:record_end])
+                    self._tail_records += 1
+                    position = record_end
+                end += position
+                data = data[position:]
+        if end < self._log_size:
+            # Drop a torn or corrupt tail so new records follow intact ones.
+            self._writer.truncate(end)
+            self._log_size = end
+
+    def _apply(self, op: int, payload: bytes) -> None:
+        if op == self._ADD_OP:
+            task_id, priority, day = self._ADD.unpack_from(payload)
+            title, _, tags = payload[self._ADD.size:].decode().partition("\0")
+            due = datetime.date.fromordinal(day) if day else None
+            self._insert(Task(task_id, title, priority, due, tuple(tags.split())))
+        else:
+            super().remove(self._REMOVE.unpack(payload)[0])
+
+    # -- Scheduler interface -----------------------------------------------
+
+    def add(self, title: str, priority: int = DEFAULT_PRIORITY, due: datetime.date | None = None,
+            tags: Iterable[str] = ()) -> Task:
+        """
+        Adds a task, logs it and returns it with its new id.
+
+        Raises:
+            ValueError: If the priority is outside 1-5, the title contains a
+                NUL character or a tag contains whitespace.
+        """
+        task = super().add(title, priority, due, tags)
+        day = due.toordinal() if due is not None else 0
+        payload = self._ADD.pack(task.task_id, priority, day) + f"{title}\0{' '.join(task.tags)}".encode()
+        self._append(self._encode(self._ADD_OP, payload))
+        return task
+
+    def remove(self, task_id: int) -> Task:
+        task = super().remove(task_id)
+        self._append(self._encode(self._REMOVE_OP, self._REMOVE.pack(task_id)))
+        return task
+
+    def sync(self) -> None:
+        if not self._unsynced:
+            return
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._writer.closed:
+            return
+        if self._tail_records >= 1024:
+            self.snapshot()
+        self.sync()
+        self._writer.close()
+
+
+def open_task_store(path: str | None = None) -> TaskScheduler:
+    """
+    Opens the to-do list for the To-Do List App.
+
+    Args:
+        path (str | None): Log file for an on-disk list, or None to keep
+            tasks in memory like the original chapter.
+
+    Returns:
+        TaskScheduler: The opened list.
+    """
+    if path is None:
+        return TaskScheduler()
+    return DurableTaskScheduler(path)
@@ -0,0 +1,6 @@
+"""
+Test Configuration
+------------------
+Lets pytest import the academy package from the project folder, however
+it is started.
+"""
@@ -0,0 +1,37 @@
+"""Tests for the benchmark suite in academy.bench."""
+
+import json
+
+import pytest
+
+from academy.bench import compare_results, load_results, run_benchmarks, save_results
+
+IN_PROCESS = ["calculator", "guess", "rps", "todo", "contacts", "session", "gui.history_tape"]
+
+
+def _results(**ns_per_op):
+    return {"version": 1, "scale": 1.0, "results": {name: {"ns_per_op": value} for name, value in ns_per_op.items()}}
+
+
+def test_in_process_benchmarks_run_at_a_small_scale(tmp_path):
+    results = run_benchmarks(IN_PROCESS, scale=0.001)
+    assert results["skipped"] == {}
+    assert "contacts.search" in results["results"] and "startup.menu" not in results["results"]
+    assert all(timing["operations"] > 0 and timing["best_s"] <= timing["median_s"]
+               for timing in results["results"].values())
+
+    path = tmp_path / "baseline.json"
+    save_results(results, str(path))
+    assert load_results(str(path)) == results
+    path.write_text(json.dumps({**results, "version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_results(str(path))
+
+
+def test_compare_results_flags_slowdowns_beyond_the_threshold(capsys):
+    baseline = _results(fast=100.0, steady=100.0, gone=5.0)
+    assert compare_results(baseline, _results(fast=50.0, steady=109.0, new=1.0))
+    assert not compare_results(baseline, _results(fast=50.0, steady=111.0))
+    output = capsys.readouterr().out
+    assert "steady" in output.splitlines()[-1]
+    assert "(missing from baseline)" in output and "(missing from current run)" in output
@@ -0,0 +1,166 @@
+"""Tests for the calculator engine in academy.calculator."""
+
+import io
+import math
+import multiprocessing
+import threading
+
+import pytest
+
+from academy import calculator
+
+from academy.calculator import (CompiledExpression, batch_job, calculate, calculate_batch, compile_expression,
+                                high_precision_job, run_job, stream_calculator_csv)
+
+
+def test_calculate_applies_each_operator():
+    assert calculate(6, "+", 3) == 9
+    assert calculate(6, "-", 3) == 3
+    assert calculate(6, "*", 3) == 18
+    assert calculate(6, "/", 3) == 2
+    with pytest.raises(ZeroDivisionError):
+        calculate(1, "/", 0)
+    with pytest.raises(ValueError):
+        calculate(1, "^", 2)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch_kernel(request, monkeypatch):
+    """Runs a test once with the NumPy kernel and once with the pure-Python one."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(calculator, "_load_numpy", lambda: None)
+    return request.param
+
+
+def test_calculate_batch_flags_failing_rows(batch_kernel):
+    result = calculate_batch([1.0, 4.0, 2.0, 5.0], ["+", "/", "?", "/"], [2.0, 2.0, 3.0, 0.0])
+    assert list(result.values[:2]) == [3.0, 2.0]
+    assert math.isnan(result.values[2]) and math.isnan(result.values[3])
+    assert list(result.zero_division) == [False, False, False, True]
+    assert list(result.invalid) == [False, False, True, False]
+
+
+def test_calculate_batch_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        calculate_batch([1.0], ["+", "-"], [2.0])
+
+
+def test_stream_calculator_csv_reports_every_row(batch_kernel):
+    source = io.StringIO("num1,operator,num2\n1,+,2\n1,/,0\nx,+,1\n2,%,1\n3,*,4\n")
+    sink = io.StringIO()
+    totals = stream_calculator_csv(source, sink, chunk_size=2)
+    assert totals == {"rows": 5, "zero_division": 1, "invalid": 2}
+    assert sink.getvalue().splitlines() == [
+        "num1,operator,num2,result,error",
+        "1,+,2,3.0,",
+        "1,/,0,,division by zero",
+        "x,+,1,,invalid number",
+        "2,%,1,,invalid operator",
+        "3,*,4,12.0,",
+    ]
+
+
+def test_stream_calculator_csv_skips_blank_rows(batch_kernel):
+    source = io.StringIO("\nnum1,operator,num2\n\n1,+,2\n , ,\n\n\n3,*,4\n\n")
+    sink = io.StringIO()
+    assert stream_calculator_csv(source, sink, chunk_size=2) == {"rows": 2, "zero_division": 0, "invalid": 0}
+    assert sink.getvalue().splitlines() == ["num1,operator,num2,result,error", "1,+,2,3.0,", "3,*,4,12.0,"]
+
+
+def test_stream_calculator_csv_accepts_empty_input():
+    sink = io.StringIO()
+    assert stream_calculator_csv(io.StringIO(""), sink) == {"rows": 0, "zero_division": 0, "invalid": 0}
+    assert sink.getvalue() == "num1,operator,num2,result,error\n"
+
+
+# -- Expressions -------------------------------------------------------------
+
+def test_compiled_expression_evaluates_with_bindings():
+    expression = CompiledExpression("3*(x+2)/y")
+    assert expression.variables == {"x", "y"}
+    assert expression(x=1, y=3) == 3
+    assert CompiledExpression("-x // 2 + x % 3")(x=7) == -3
+
+
+@pytest.mark.parametrize("text", ["", "x +", "__import__('os')", "x.real", "[x]", "'a' + x", "x ** 2",
+                                  "lambda: 1"])
+def test_compiled_expression_rejects_unsafe_or_malformed_text(text):
+    with pytest.raises(ValueError):
+        CompiledExpression(text)
+
+
+def test_compiled_expression_reports_missing_variables_and_zero_division():
+    with pytest.raises(ValueError, match="y"):
+        CompiledExpression("x + y")(x=1)
+    with pytest.raises(ZeroDivisionError):
+        CompiledExpression("x / y")(x=1, y=0)
+
+
+def test_compile_expression_reuses_compiled_forms():
+    assert compile_expression("x + 1") is compile_expression("x + 1")
+
+
+# -- Worker jobs -------------------------------------------------------------
+
+class _Messages(list):
+    put = list.append
+
+
+def _run(job, *args, cancel=False):
+    messages, cancelled = _Messages(), threading.Event()
+    if cancel:
+        cancelled.set()
+    run_job(job, args, messages, cancelled)
+    return messages[-1]
+
+
+def test_high_precision_job_keeps_every_digit_of_large_operands():
+    huge = "9" * 400
+    assert _run(high_precision_job, huge, "Addition", "1", "", 500) == \
+        ("done", "x + y = 1.00000000000000000000000000000e+400 (401 digits)")
+    assert _run(high_precision_job, " 0.1 ", "Addition", "0.2", "", 10) == ("done", "x + y = 0.3 (1 digits)")
+    assert _run(high_precision_job, "2", "Expression", "3", "x * y + 1", 10) == ("done", "x * y + 1 = 7 (1 digits)")
+
+
+def test_high_precision_job_reports_bad_input():
+    assert _run(high_precision_job, "1e", "Addition", "1", "", 10) == ("error", "Please enter valid numeric values.")
+    assert _run(high_precision_job, "1", "Division", "0", "", 10) == ("error", "Division by zero is not allowed!")
+    assert _run(high_precision_job, "0", "Division", "0", "", 10) == ("error", "The result is undefined.")
+    assert _run(high_precision_job, "1", "Expression", "2", "x * 0.5", 10)[0] == "error"
+
+
+def test_batch_job_writes_results_and_removes_cancelled_output(tmp_path):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    source.write_text("num1,operator,num2\n1,+,2\n1,/,0\n", encoding="utf-8")
+    assert _run(batch_job, str(source), str(target)) == ("done", "2 rows (1 errors) written to out.csv")
+    assert target.read_text(encoding="utf-8").splitlines()[1:] == ["1,+,2,3.0,", "1,/,0,,division by zero"]
+    assert _run(batch_job, str(source), str(target), cancel=True) == ("done", "Batch cancelled after 2 rows.")
+    assert not target.exists()
+    assert _run(batch_job, str(tmp_path / "missing.csv"), str(target))[0] == "error"
+
+
+def test_batch_job_matches_the_command_line_batch_mode(tmp_path):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    source.write_text("".join(f"{i},{'+-*/%'[i % 5]},{i % 7}\n" for i in range(10_000)) + "x,+,1\n",
+                      encoding="utf-8")
+    progress = []
+    summary = batch_job(str(source), str(target), lambda done, total: progress.append((done, total)), lambda: False)
+    assert summary == "10,001 rows (2,286 errors) written to out.csv"
+    expected = io.StringIO()
+    with open(source, newline="") as rows:
+        stream_calculator_csv(rows, expected)
+    assert target.read_text(encoding="utf-8") == expected.getvalue()
+    assert progress[0][0] > 0 and progress[-1] == (source.stat().st_size,) * 2
+
+
+def test_jobs_run_in_a_spawned_worker():
+    context = multiprocessing.get_context("spawn")
+    messages, cancel = context.Queue(), context.Event()
+    worker = context.Process(target=run_job, args=(high_precision_job, ("2", "Multiplication", "3", "", 5),
+                                                   messages, cancel))
+    worker.start()
+    worker.join(60)
+    received = [messages.get(timeout=10) for _ in range(3)]
+    assert received[-1] == ("done", "x * y = 6 (1 digits)")
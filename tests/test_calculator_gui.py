@@ -0,0 +1,149 @@
+"""Tests for the display-free parts of the calculator app in Python-Book-1-2.py."""
+
+import importlib.util
+import os
+
+import pytest
+
+_SPEC = importlib.util.spec_from_file_location(
+    "calculator_app", os.path.join(os.path.dirname(os.path.dirname(__file__)), "Python-Book-1-2.py"))
+app = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(app)
+
+
+class SmallHistory(app.CalculationHistory):
+    CHUNK = 4
+    CACHED_SPILL_CHUNKS = 1
+
+
+def _filled(count, **options):
+    history = SmallHistory(**options)
+    for i in range(count):
+        history.append(f"{i} + 1 = {i + 1}")
+    return history
+
+
+# -- History -----------------------------------------------------------------
+
+def test_history_packs_entries_and_reads_them_back():
+    history = _filled(10)
+    assert len(history) == 10
+    assert [history[i] for i in range(10)] == [f"{i} + 1 = {i + 1}" for i in range(10)]
+    history.append("multi\nline")
+    assert history[10] == "multi line"
+    with pytest.raises(IndexError):
+        history[11]
+    with pytest.raises(IndexError):
+        history[-1]
+
+
+def test_history_drops_the_oldest_chunks_without_a_spill_file():
+    history = _filled(21, capacity=8)
+    assert (len(history), history.dropped) == (9, 12)
+    assert history[0] == "12 + 1 = 13"
+    assert history[8] == "20 + 1 = 21"
+    assert history.find("3 + 1") == 1
+    assert history.find("0 + 1 = 1") is None
+
+
+def test_history_spills_old_chunks_to_disk(tmp_path):
+    path = tmp_path / "history.txt"
+    path.write_bytes(b"from an earlier session\n")
+    history = _filled(30, capacity=8, spill_path=str(path))
+    assert (len(history), history.dropped) == (30, 0)
+    assert [history[i] for i in (0, 5, 17, 29, 2)] == ["0 + 1 = 1", "5 + 1 = 6", "17 + 1 = 18", "29 + 1 = 30",
+                                                      "2 + 1 = 3"]
+    assert len(history._spill_cache) == 1
+    assert history.find("4 + 1 = 5") == 4
+    assert history.find("0 + 1 = 1", start=9) == 0
+    assert history.find("earlier") is None
+    history.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "from an earlier session"
+    assert lines[1:] == [f"{i} + 1 = {i + 1}" for i in range(len(lines) - 1)]
+
+
+def test_history_find_folds_case_the_same_way_everywhere():
+    history = SmallHistory()
+    for text in ["Straße", "x", "École", "y", "STRASSE", "z"]:
+        history.append(text)
+    assert (history.find("strasse"), history.find("STRASSE", start=3)) == (4, 0)
+    assert (history.find("ÉCOLE"), history.find("école", start=1)) == (2, None)
+    assert history.find("ß", start=3) == 0
+    assert history.find("") is None
+    assert SmallHistory().find("x") is None
+
+
+# -- Icon cache --------------------------------------------------------------
+
+class FakeIconCache(app.IconCache):
+    """Builds placeholder bytes instead of decoding the JPEG with Pillow."""
+
+    builds = 0
+
+    def _build(self):
+        self.builds += 1
+        return {size: f"png {size}".encode() * size for size in self.sizes}
+
+
+def test_icon_cache_is_reused_until_the_source_changes(tmp_path):
+    source, path = tmp_path / "icon.jpg", tmp_path / "icon.cache"
+    source.write_bytes(b"jpeg")
+    cache = FakeIconCache(str(source), str(path), (32, 16))
+    assert cache.load((16,)) == {16: b"png 16" * 16}
+    assert (cache.rebuilt, cache.builds) == (True, 1)
+
+    reader = FakeIconCache(str(source), str(path), (32, 16))
+    assert reader.load() == {32: b"png 32" * 32, 16: b"png 16" * 16}
+    assert (reader.rebuilt, reader.builds) == (False, 0)
+    assert reader.load((64,)) == {}
+    assert reader.builds == 1
+
+    source.write_bytes(b"a new jpeg")
+    assert reader.load((16,)) == {16: b"png 16" * 16}
+    assert reader.builds == 2
+
+
+def test_icon_cache_rebuilds_damaged_files(tmp_path):
+    source, path = tmp_path / "icon.jpg", tmp_path / "icon.cache"
+    source.write_bytes(b"jpeg")
+    cache = FakeIconCache(str(source), str(path), (16,))
+    cache.load()
+    for damaged in (path.read_bytes()[:-5], b"NOTACACHE" * 4, b""):
+        path.write_bytes(damaged)
+        assert cache.load() == {16: b"png 16" * 16}
+    assert cache.builds == 4
+    with pytest.raises(OSError):
+        FakeIconCache(str(tmp_path / "missing.jpg"), str(path)).load()
+
+
+def test_window_icon_sizes_follow_the_screen_dpi():
+    assert app.window_icon_sizes(96) == (32, 16)
+    assert app.window_icon_sizes(144) == (48, 32)
+    assert app.window_icon_sizes(192) == (64, 32)
+    assert set(app.window_icon_sizes(400)) <= set(app.ICON_SIZES)
+
+
+# -- Event loop --------------------------------------------------------------
+
+def test_event_loop_stays_responsive_during_a_heavy_job(tmp_path):
+    from academy.bench import virtual_display
+    with virtual_display() as display:
+        if display is None:
+            pytest.skip("no display and Xvfb is not installed")
+        try:
+            root = app.tk.Tk()
+        except app.tk.TclError as exc:
+            pytest.skip(f"Tk cannot open the display: {exc}")
+        calculator = app.SimpleCalculatorApp(root, None, str(tmp_path / "history.txt"))
+        results = []
+
+        def finish(within_budget):
+            results.append(within_budget)
+            calculator.close()
+
+        root.after(200, app.check_event_loop_latency, calculator, 16.0, 2_000_000, finish)
+        # A safety net so a hung job fails the test instead of blocking the run.
+        root.after(120_000, calculator.close)
+        root.mainloop()
+    assert results == [True]
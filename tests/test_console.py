@@ -0,0 +1,120 @@
+"""Tests for the console abstraction in academy.console."""
+
+import io
+import json
+
+import pytest
+
+from academy.console import LazyRows, RecordingConsole, ScriptedConsole, load_transcript, page_through, run_sync
+
+
+async def _greet(console):
+    name = await console.input("Name? ")
+    console.print(f"Hello, {name}!")
+    return name
+
+
+def test_scripted_console_echoes_prompts_but_not_replies():
+    output = io.StringIO()
+    console = ScriptedConsole(["Ada\n"], output)
+    assert run_sync(_greet(console)) == "Ada"
+    console.flush()
+    assert output.getvalue() == "Name? Hello, Ada!\n"
+
+
+def test_scripted_console_raises_eof_when_replies_run_out():
+    console = ScriptedConsole([], io.StringIO())
+    with pytest.raises(EOFError):
+        run_sync(_greet(console))
+
+
+def test_scripted_console_buffers_output():
+    output = io.StringIO()
+    console = ScriptedConsole([], output, buffer_size=10)
+    console.write("12345")
+    assert output.getvalue() == ""
+    console.write("67890")
+    assert output.getvalue() == "1234567890"
+
+
+def test_recording_console_transcript_round_trip(tmp_path):
+    recorder = RecordingConsole(ScriptedConsole(["Ada"], io.StringIO()), seed=7)
+    run_sync(_greet(recorder))
+    path = tmp_path / "session.json"
+    recorder.save(str(path))
+    transcript = load_transcript(str(path))
+    assert transcript["seed"] == 7
+    assert transcript["replies"] == ["Ada"]
+
+    replay = RecordingConsole(ScriptedConsole(transcript["replies"], io.StringIO()), seed=7)
+    run_sync(_greet(replay))
+    assert replay.output_digest == transcript["output_sha256"]
+
+
+def test_load_transcript_rejects_other_versions(tmp_path):
+    path = tmp_path / "session.json"
+    path.write_text(json.dumps({"version": 99, "seed": 0, "replies": [], "output_sha256": ""}))
+    with pytest.raises(ValueError):
+        load_transcript(str(path))
+
+
+# -- Paging ------------------------------------------------------------------
+
+def _page(replies, rows, **options):
+    output = io.StringIO()
+    console = ScriptedConsole(replies, output)
+    answer = run_sync(page_through(console, rows, str, "Pick: ", **options))
+    console.flush()
+    return answer, output.getvalue()
+
+
+def test_page_through_shows_short_listings_at_once():
+    assert _page([], [1, 2], always_ask=False) == ("", "1\n2\n")
+    assert _page([" 2 "], [1, 2]) == ("2", "1\n2\nPick: ")
+    assert _page([], [], always_ask=False) == ("", "")
+
+
+def test_page_through_navigates_between_pages():
+    answer, output = _page(["n", "n", "n", "p", "g 5", "g 0", "7"], list(range(1, 51)), page_size=20)
+    assert answer == "7"
+    pages = [line for line in output.splitlines() if line.startswith("-- Page")]
+    assert [page.split(" (")[0] for page in pages] == ["-- Page 1 of 3", "-- Page 2 of 3", "-- Page 3 of 3",
+                                                        "-- Page 3 of 3", "-- Page 2 of 3", "-- Page 3 of 3",
+                                                        "-- Page 1 of 3"]
+    assert "(rows 41-50 of 50)" in pages[2]
+    assert output.count("Pick or [n]ext, [p]revious, [g N] go to page: ") == 7
+
+
+class CountingRows:
+    """A sized collection that records how many rows have been read from it."""
+
+    def __init__(self, count):
+        self.count = count
+        self.read = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for row in range(1, self.count + 1):
+            self.read += 1
+            yield row
+
+
+def test_lazy_rows_read_only_as_far_as_the_page_on_screen():
+    rows = CountingRows(1_000)
+    answer, output = _page(["n", "n", "7"], LazyRows(rows), page_size=20)
+    assert answer == "7"
+    assert "(rows 41-60 of 1000)" in output
+    assert rows.read == 60
+    _page(["g 3", "p", "x"], LazyRows(rows), page_size=20)
+    assert rows.read == 60 + 60 + 40
+
+
+def test_lazy_rows_behave_like_a_sequence():
+    rows = LazyRows(["a", "b", "c", "d"])
+    assert (len(rows), rows[1:3], rows[3:10], rows[::2], rows[0], rows[-1]) == (4, ["b", "c"], ["d"], ["a", "c"],
+                                                                                "a", "d")
+    assert list(rows) == ["a", "b", "c", "d"]
+    with pytest.raises(IndexError):
+        rows[4]
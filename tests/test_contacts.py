@@ -0,0 +1,344 @@
+"""Tests for the contact stores in academy.contacts."""
+
+import io
+import random
+
+import pytest
+
+from academy.contacts import (CompactContactStore, ContactSearchIndex, DiskContactStore, InMemoryContactStore,
+                              benchmark_contact_memory, benchmark_contact_search, contact_format, edit_distance, import_contacts,
+                              open_contact_store, read_contacts_csv, read_contacts_vcard, run_contact_export,
+                              run_contact_import, write_contacts_csv, write_contacts_vcard)
+
+
+def test_disk_store_round_trip(tmp_path):
+    path = str(tmp_path / "contacts.log")
+    with DiskContactStore(path) as store:
+        store["Ada Lovelace"] = "555-0100"
+        store["Alan Turing"] = "555-0199"
+        store["Ada Lovelace"] = "555-0101"
+        del store["Alan Turing"]
+        assert dict(store) == {"Ada Lovelace": "555-0101"}
+    with DiskContactStore(path) as store:
+        assert dict(store) == {"Ada Lovelace": "555-0101"}
+        assert "Alan Turing" not in store
+        with pytest.raises(KeyError):
+            store["Alan Turing"]
+
+
+def test_disk_store_replays_the_log_without_a_hint(tmp_path):
+    path = str(tmp_path / "contacts.log")
+    with DiskContactStore(path) as store:
+        for i in range(100):
+            store[f"Contact {i}"] = str(i)
+        for i in range(0, 100, 3):
+            del store[f"Contact {i}"]
+    (tmp_path / "contacts.log.hint").unlink()
+    with DiskContactStore(path) as store:
+        assert len(store) == 66
+        assert store["Contact 1"] == "1"
+        assert "Contact 3" not in store
+
+
+def test_disk_store_replays_records_written_after_the_hint(tmp_path):
+    path = str(tmp_path / "contacts.log")
+    with DiskContactStore(path) as store:
+        store["Ada"] = "1"
+    store = DiskContactStore(path)
+    store["Grace"] = "2"
+    del store["Ada"]
+    store.sync()
+    # Simulate a crash: the hint still describes the log before these records.
+    reopened = DiskContactStore(path)
+    assert dict(reopened) == {"Grace": "2"}
+    reopened.close()
+
+
+def test_disk_store_drops_a_torn_tail(tmp_path):
+    path = tmp_path / "contacts.log"
+    with DiskContactStore(str(path)) as store:
+        store["Ada"] = "1"
+    (tmp_path / "contacts.log.hint").unlink()
+    intact = path.stat().st_size
+    with open(path, "ab") as log:
+        log.write(b"\x01\x02\x03torn")
+    with DiskContactStore(str(path)) as store:
+        assert dict(store) == {"Ada": "1"}
+        assert path.stat().st_size == intact
+        store["Grace"] = "2"
+    with DiskContactStore(str(path)) as store:
+        assert dict(store) == {"Ada": "1", "Grace": "2"}
+
+
+def test_disk_store_counts_each_dead_record_once(tmp_path):
+    path = str(tmp_path / "contacts.log")
+    with DiskContactStore(path) as store:
+        store["Ada"] = "1"
+        store["Ada"] = "2"
+        store["Grace"] = "3"
+        del store["Grace"]
+        assert store._dead == 2
+    (tmp_path / "contacts.log.hint").unlink()
+    with DiskContactStore(path) as store:
+        assert store._dead == 2
+
+
+def test_disk_store_compaction_keeps_live_contacts(tmp_path):
+    path = tmp_path / "contacts.log"
+    with DiskContactStore(str(path)) as store:
+        for i in range(50):
+            store[f"Contact {i}"] = str(i)
+            store[f"Contact {i}"] = str(i + 1)
+        size = path.stat().st_size
+        store.compact()
+        assert path.stat().st_size < size
+        assert store._dead == 0
+    with DiskContactStore(str(path)) as store:
+        assert dict(store) == {f"Contact {i}": str(i + 1) for i in range(50)}
+
+
+def test_disk_store_rejects_other_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"not a contact store at all")
+    with pytest.raises(ValueError):
+        DiskContactStore(str(path))
+
+
+def test_open_contact_store_selects_the_backend(tmp_path):
+    assert isinstance(open_contact_store(), InMemoryContactStore)
+    with open_contact_store(str(tmp_path / "contacts.log")) as store:
+        assert isinstance(store, DiskContactStore)
+
+
+# -- Search index ------------------------------------------------------------
+
+NAMES = ["Ada Lovelace", "Alan Turing", "Alice Jones", "Grace Hopper", "Grace  Kelly", "Linus Torvalds"]
+
+
+def test_search_index_prefix_is_case_and_space_insensitive():
+    index = ContactSearchIndex(NAMES)
+    assert index.prefix("al") == ["Alan Turing", "Alice Jones"]
+    assert index.prefix("GRACE k") == ["Grace  Kelly"]
+    assert index.prefix("zz") == []
+
+
+def test_search_index_substring_ranks_word_starts_first():
+    index = ContactSearchIndex(NAMES + ["Bob Joneston"])
+    assert index.substring("jones") == ["Alice Jones", "Bob Joneston"]
+    assert index.substring("ovela") == ["Ada Lovelace"]
+
+
+def test_search_index_fuzzy_matches_typos_in_any_word():
+    index = ContactSearchIndex(NAMES)
+    assert index.fuzzy("Grace Hoper") == ["Grace Hopper"]
+    assert index.fuzzy("jnes") == ["Alice Jones"]
+    assert index.fuzzy("Nobody") == []
+
+
+def test_search_index_search_puts_exact_matches_first():
+    index = ContactSearchIndex(NAMES + ["Ada"])
+    assert index.search("ada")[0] == "Ada"
+    assert index.search("Hoper") == ["Grace Hopper"]
+
+
+def test_search_index_add_update_and_discard():
+    index = ContactSearchIndex()
+    index.update(NAMES + NAMES[:2])
+    assert len(index) == len(NAMES)
+    index.add("Barbara Liskov")
+    index.add("Barbara Liskov")
+    assert index.prefix("barb") == ["Barbara Liskov"]
+    index.discard("Alan Turing")
+    index.discard("Nobody")
+    assert "Alan Turing" not in index
+    assert index.prefix("al") == ["Alice Jones"]
+    assert index.substring("turing") == []
+    assert index._sorted == sorted(index._sorted)
+
+
+def test_search_index_rebuilds_after_many_deletes():
+    names = [f"Contact {i:04d}" for i in range(200)]
+    index = ContactSearchIndex(names)
+    for name in names[:150]:
+        index.discard(name)
+    assert len(index) == 50
+    assert index._retired <= len(index)
+    assert index.prefix("contact 01") == [f"Contact {i:04d}" for i in range(150, 160)]
+    matches = index.fuzzy("Contact 0199", k=100)
+    assert matches[0] == "Contact 0199"
+    assert all(int(name[-4:]) >= 150 for name in matches)
+
+
+def test_edit_distance_gives_up_past_the_limit():
+    assert edit_distance("kitten", "sitting", 3) == 3
+    assert edit_distance("kitten", "sitting", 2) == 3
+    assert edit_distance("", "abc", 5) == 3
+
+
+def test_edit_distance_ignores_shared_prefix_and_suffix():
+    assert edit_distance("grace hopper 500000", "grace hopper 54000", 2) == 2
+    assert edit_distance("abc", "abcd", 1) == 1
+    assert edit_distance("abcd", "abc", 0) == 1
+    assert edit_distance("aaa", "aaaa", 1) == 1
+
+
+def test_search_index_lookups_stay_under_a_millisecond_at_a_million_names():
+    timings = benchmark_contact_search(1_000_000)
+    assert max(timings.values()) <= 1.0, timings
+
+
+# -- Import and export -------------------------------------------------------
+
+def test_csv_round_trip():
+    contacts = [("Ada Lovelace", "555-0100"), ('Grace "Amazing" Hopper', "+1 555, 0142")]
+    sink = io.StringIO()
+    assert write_contacts_csv(contacts, sink) == 2
+    assert list(read_contacts_csv(io.StringIO(sink.getvalue()))) == contacts
+
+
+def test_csv_reader_skips_the_header_and_fills_missing_phones():
+    source = io.StringIO("name,phone\nAda\n\nGrace,555\n")
+    assert list(read_contacts_csv(source)) == [("Ada", ""), ("Grace", "555")]
+
+
+def test_vcard_round_trip_with_escaping_and_folding():
+    contacts = [("Ada, Countess; of Lovelace", "555-0100"), ("A" * 120, "+1 555 0142")]
+    sink = io.StringIO()
+    assert write_contacts_vcard(contacts, sink) == 2
+    assert all(len(line) <= 75 for line in sink.getvalue().split("\r\n"))
+    assert list(read_contacts_vcard(io.StringIO(sink.getvalue()))) == contacts
+
+
+def test_vcard_reader_uses_n_when_fn_is_missing():
+    card = ("BEGIN:VCARD\nVERSION:3.0\nN:Hopper;Grace;;;\nitem1.TEL;TYPE=cell:555-0142\n"
+            "TEL:555-9999\nEND:VCARD\n")
+    assert list(read_contacts_vcard(io.StringIO(card))) == [("Grace Hopper", "555-0142")]
+
+
+def test_import_contacts_deduplicates_against_the_store_keys():
+    store = InMemoryContactStore()
+    store["Ada Lovelace"] = "555-0100"
+    store["Alan Turing"] = "555-0199"
+    records = [("Ada  Lovelace", "(555) 0100"), ("", "555"), ("Grace Hopper", "555-0142"),
+               ("Grace Hopper ", "5550142"), ("ada lovelace", "555-0101"), ("Alan Turing", "555-0000"),
+               ("Grace Hopper", "555-0143")]
+    totals = import_contacts(store, iter(records), batch_size=4)
+    assert totals == {"rows": 7, "imported": 2, "updated": 2, "duplicates": 2, "invalid": 1}
+    assert dict(store) == {"Ada Lovelace": "555-0100", "Alan Turing": "555-0000", "Grace Hopper": "555-0143",
+                           "ada lovelace": "555-0101"}
+
+
+def test_import_contacts_twice_adds_nothing_the_second_time():
+    store = InMemoryContactStore()
+    records = [(f"Contact {i}", "555-0100") for i in range(5_000)] * 2
+    totals = import_contacts(store, records, batch_size=1_000)
+    assert (totals["imported"], totals["duplicates"], len(store)) == (5_000, 5_000, 5_000)
+
+
+def test_contact_format_follows_the_extension():
+    assert contact_format("book.VCF") == "vcard"
+    assert contact_format("book.txt") == "csv"
+    assert contact_format("book.vcf", "csv") == "csv"
+
+
+def test_import_and_export_through_a_disk_store(tmp_path):
+    source = tmp_path / "in.csv"
+    source.write_text("name,phone\nAda Lovelace,555-0100\nAlan Turing,555-0199\nAda Lovelace,555-0100\n",
+                      encoding="utf-8")
+    store = str(tmp_path / "contacts.log")
+    run_contact_import(str(source), store)
+    run_contact_export(str(tmp_path / "out.vcf"), store)
+    with open(tmp_path / "out.vcf", encoding="utf-8", newline="") as exported:
+        assert sorted(read_contacts_vcard(exported)) == [("Ada Lovelace", "555-0100"), ("Alan Turing", "555-0199")]
+
+
+# -- Compact store -----------------------------------------------------------
+
+@pytest.mark.parametrize("phone", ["5550100", "+15550100", "007", "0", "", "+", "1234567890123456",
+                                   "12345678901234567", "555-0100", "555-0100 ext 2", "(555) 0100", " 555",
+                                   "+1 555 0100", "١٢٣", "call me"])
+def test_compact_store_returns_phones_exactly_as_stored(phone):
+    store = CompactContactStore()
+    store["Ada"] = phone
+    assert store["Ada"] == phone
+
+
+def test_compact_store_packs_formatted_phones_next_to_their_digits():
+    store = CompactContactStore([("Ada", "555-0100"), ("Grace", "555-0142"), ("Alan", "+1 (555) 0199")])
+    assert store._formats == [("", "", "", "-", "", "", "", ""), ("+", " (", "", "", ") ", "", "", "", "")]
+    assert len(store._arena) == len("AdaGraceAlan")
+    store["Alan"] = "1234567890123456"
+    assert store._arena.endswith(b"Alan1234567890123456")
+    assert store["Alan"] == "1234567890123456"
+    store["Alan"] = "555-0199"
+    assert (store["Alan"], len(store._formats)) == ("555-0199", 2)
+
+
+def test_compact_store_reclaims_replaced_verbatim_phones():
+    store = CompactContactStore([("Ada", "1" * 20)])
+    for i in range(20_000):
+        store["Ada"] = f"{i:020d}"
+    assert store["Ada"] == f"{19_999:020d}"
+    assert len(store._arena) < 1 << 18
+
+
+def test_compact_store_matches_a_dict_through_churn():
+    store, reference = CompactContactStore(), {}
+    rng = random.Random(16)
+    for step in range(20_000):
+        name = f"Contact {rng.randrange(3_000)} ☎"
+        if name in reference and rng.random() < 0.4:
+            del store[name], reference[name]
+        else:
+            phone = rng.choice([f"{step:07d}", f"+{step}", f"555-{step:04d}", ""])
+            store[name] = reference[name] = phone
+    assert len(store) == len(reference)
+    assert dict(store) == reference
+    assert {view.name: view.phone for view in store.views()} == reference
+    with pytest.raises(KeyError):
+        store["Nobody"]
+    with pytest.raises(KeyError):
+        del store["Nobody"]
+
+
+def test_compact_store_reclaims_deleted_slots():
+    store = CompactContactStore((f"Contact {i}", str(i)) for i in range(5_000))
+    for i in range(4_500):
+        del store[f"Contact {i}"]
+    assert len(store._offsets) < 5_000
+    assert dict(store) == {f"Contact {i}": str(i) for i in range(4_500, 5_000)}
+
+
+def test_compact_store_meets_its_memory_target_on_formatted_phones():
+    usage = benchmark_contact_memory(20_000)
+    assert usage["compact"] <= usage["target"] < usage["dict"]
+
+
+def test_compact_store_rejects_oversized_names():
+    with pytest.raises(ValueError):
+        CompactContactStore()["x" * 70_000] = "1"
+
+
+
+# -- Serialization -----------------------------------------------------------
+
+@pytest.mark.parametrize("store_type", [InMemoryContactStore, CompactContactStore])
+def test_stores_round_trip_through_bytes(store_type):
+    store = store_type()
+    for name, phone in [("Ada Lovelace", "5550100"), ("Zoë", "+44 (20) 7946-0018"), ("Empty", "")]:
+        store[name] = phone
+    data = store.to_bytes()
+    for restore_type in (InMemoryContactStore, CompactContactStore):
+        restored = restore_type.from_bytes(memoryview(data))
+        assert {name: restored[name] for name in restored} == {name: store[name] for name in store}
+    assert len(store_type.from_bytes(store_type().to_bytes())) == 0
+
+
+def test_serialization_rejects_nul_characters_and_garbage():
+    store = InMemoryContactStore()
+    store["Bad\0name"] = "1"
+    with pytest.raises(ValueError):
+        store.to_bytes()
+    for data in (b"", b"\xff" * 8, InMemoryContactStore().to_bytes() + b"orphan phone\0"):
+        with pytest.raises(ValueError):
+            InMemoryContactStore.from_bytes(data)
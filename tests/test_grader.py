@@ -0,0 +1,72 @@
+"""Tests for the auto-grader in academy.grader."""
+
+import csv
+
+import pytest
+
+from academy.grader import (compare_output, find_submissions, grade_submissions, normalize_output,
+                            write_grade_report)
+
+
+async def _greeting(console):
+    name = await console.input("What is your name? ")
+    console.print(f"Hello, {name}!")
+
+
+GOOD = 'name = input("What is your name? ")\nprint(f"Hello, {name}!")  \n\n'
+RUDE = 'input("What is your name? ")\nprint("Go away.")\n'
+BROKEN = 'raise RuntimeError("forgot the chapter")\n'
+
+
+def test_output_comparison_ignores_trailing_space_and_blank_lines():
+    assert normalize_output("a  \n\n b\n   \n") == ["a", " b"]
+    assert compare_output("a\nb\n", "a   \n\nb") == ""
+    assert compare_output("a\nb\n", "a\nc\n") == "line 2: expected 'b', got 'c'"
+    assert compare_output("a\nb\n", "a\n") == "line 2: expected 'b', got end of output"
+    assert compare_output("a\n", "a\nb\n") == "line 2: unexpected 'b'"
+
+
+def test_grading_runs_each_distinct_submission_once_and_caches_grades(tmp_path):
+    folder = tmp_path / "class"
+    (folder / "late").mkdir(parents=True)
+    for name, source in (("good.py", GOOD), ("copy.py", GOOD), ("rude.py", RUDE), ("late/broken.py", BROKEN)):
+        (folder / name).write_text(source, encoding="utf-8")
+    (folder / "notes.txt").write_text("not a submission", encoding="utf-8")
+    paths = find_submissions([str(folder), str(tmp_path / "missing.py")])
+    assert [path[len(str(folder)) + 1:] for path in paths[:-1]] == ["copy.py", "good.py", "rude.py",
+                                                                     "late/broken.py"]
+
+    cache = str(tmp_path / "cache")
+    copy, good, rude, broken, missing = grade_submissions(paths, "1", _greeting, workers=2, cache_dir=cache)
+    assert (copy.passed, good.passed, rude.passed, broken.passed, missing.passed) == (3, 3, 0, 0, 0)
+    assert copy.sha256 == good.sha256 and not good.cached
+    assert rude.results[0].detail == ("line 1: expected 'What is your name? Hello, Ada!', "
+                                      "got 'What is your name? Go away.'")
+    assert {result.status for result in broken.results} == {"crashed"}
+    assert broken.results[0].detail == "RuntimeError: forgot the chapter"
+    assert [result.status for result in missing.results] == ["unreadable"] * 3
+    assert missing.sha256 == ""
+
+    again = grade_submissions(paths, "1", _greeting, cache_dir=cache)
+    assert [grade.cached for grade in again] == [True, True, True, True, False]
+    assert [grade.results for grade in again] == [copy.results, good.results, rude.results, broken.results,
+                                                  missing.results]
+
+    report = tmp_path / "grades.csv"
+    write_grade_report(again, str(report))
+    rows = list(csv.reader(report.open(encoding="utf-8")))
+    assert rows[0] == ["path", "sha256", "passed", "total", "failed"]
+    assert rows[3][2:4] == ["0", "3"]
+    assert rows[3][4].startswith("greeting (wrong output); empty name (wrong output)")
+
+
+def test_grading_stops_a_submission_that_runs_too_long(tmp_path):
+    path = tmp_path / "forever.py"
+    path.write_text("while True:\n    pass\n", encoding="utf-8")
+    (grade,) = grade_submissions([str(path)], "1", _greeting, workers=3, time_limit=0.5)
+    assert {result.status for result in grade.results} == {"time limit"}
+
+
+def test_grading_rejects_unknown_chapters():
+    with pytest.raises(ValueError):
+        grade_submissions([], "99", _greeting)
@@ -0,0 +1,43 @@
+"""Tests for the Guess the Number engine in academy.guess."""
+
+import random
+
+import pytest
+
+from academy.guess import GuessGame, binary_search_strategy, check_guess, play_guess_game, simulate_guess_games
+
+
+def test_check_guess_hints():
+    assert check_guess(10, 50) == -1
+    assert check_guess(90, 50) == 1
+    assert check_guess(50, 50) == 0
+
+
+def test_binary_search_needs_at_most_seven_attempts():
+    rng = random.Random(0)
+    attempts = [play_guess_game(binary_search_strategy, target, rng) for target in range(1, 101)]
+    assert max(attempts) == 7
+    assert attempts[49] == 1
+
+
+def test_simulation_is_deterministic_and_worker_independent():
+    inline = simulate_guess_games("random", games=3_000, workers=1, seed=5, shard_size=1_000)
+    assert sum(inline.values()) == 3_000
+    assert simulate_guess_games("random", games=3_000, workers=1, seed=5, shard_size=1_000) == inline
+    assert simulate_guess_games("random", games=3_000, workers=2, seed=5, shard_size=1_000) == inline
+
+
+def test_simulation_rejects_unknown_strategies():
+    with pytest.raises(ValueError):
+        simulate_guess_games("psychic", games=10, workers=1)
+
+
+def test_games_in_progress_round_trip():
+    game = GuessGame(42, 3)
+    restored = GuessGame.from_bytes(memoryview(game.to_bytes()))
+    assert (restored.target, restored.attempts, restored.finished) == (42, 3, False)
+    assert GuessGame().to_bytes() is None
+    game.finished = True
+    assert game.to_bytes() is None
+    with pytest.raises(ValueError):
+        GuessGame.from_bytes(b"\x01")
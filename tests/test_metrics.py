@@ -0,0 +1,69 @@
+"""Tests for the session instrumentation in academy.metrics."""
+
+import io
+import json
+import random
+
+import pytest
+
+from academy.console import ScriptedConsole, run_sync
+from academy.metrics import InstrumentedConsole, LatencyHistogram, Metrics
+
+
+def test_histogram_buckets_cover_every_value_once():
+    for value in [*range(300), *(random.Random(4).randrange(1 << 40) for _ in range(1_000))]:
+        low, high = LatencyHistogram.bucket_range(LatencyHistogram.bucket_index(value))
+        assert low <= value <= high
+        assert high - low <= max(1, value // 64)
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    histogram = LatencyHistogram()
+    values = list(range(1_000, 1_001_000, 1_000))
+    for value in values:
+        histogram.record(value)
+    assert (histogram.count, histogram.min, histogram.max) == (1_000, 1_000, 1_000_000)
+    for percent in (50, 90, 99):
+        exact = values[int(len(values) * percent / 100) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=1 / 64)
+    assert histogram.percentile(100) == 1_000_000
+
+
+def test_histogram_merge_and_edge_values():
+    empty = LatencyHistogram()
+    assert empty.percentile(50) == 0
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(-5)
+    second.record(10_000)
+    first.merge(second)
+    first.merge(LatencyHistogram())
+    assert (first.count, first.min, first.max, first.total) == (2, 0, 10_000, 10_000)
+
+
+async def _chapter(console):
+    with console.section("chapter4"):
+        await console.input("Task? ")
+        console.count("todo.add")
+        console.print("Task added!")
+        await console.input("Choice? ")
+
+
+def test_instrumented_console_attributes_steps_to_sections_and_operations(tmp_path):
+    console = InstrumentedConsole(ScriptedConsole(["Read", "7"], io.StringIO()))
+    run_sync(_chapter(console))
+    metrics = console.metrics
+    assert metrics.counters == {"todo.add": 1}
+    assert metrics.operation("todo.add").count == 1
+    assert metrics.section("chapter4").count == 1
+    assert metrics.phase("chapter4", "input_wait").count == 2
+
+    path = tmp_path / "metrics.json"
+    metrics.save(str(path))
+    assert json.loads(path.read_text())["counters"] == {"todo.add": 1}
+    assert 'id01t_operations_total{operation="todo.add"} 1' in metrics.to_prometheus()
+    with pytest.raises(ValueError):
+        metrics.save(str(path), "xml")
+
+
+def test_metrics_without_data_render_empty():
+    assert Metrics().to_prometheus() == "\n"
@@ -0,0 +1,91 @@
+"""Tests for the chapter registry in academy.registry."""
+
+import io
+
+import pytest
+
+from academy.console import ScriptedConsole, run_sync
+from academy.registry import ChapterRegistry, read_script_metadata
+
+SCRIPT = '''#!/usr/bin/env python3
+"""
+Chapter 9: Echo
+---------------
+"""
+
+import sys
+
+
+def main():
+    print("You said:", input("Say something: "))
+'''
+
+
+def test_registry_orders_entries_numerically_and_rejects_duplicate_keys():
+    registry = ChapterRegistry()
+
+    @registry.chapter("10", "Ten")
+    async def ten(console):
+        pass
+
+    @registry.chapter("2", "Two")
+    async def two(console):
+        pass
+
+    assert [entry.key for entry in registry] == ["2", "10"]
+    with pytest.raises(ValueError):
+        registry.chapter("2", "Another two")(two)
+
+
+def test_registry_passes_flags_when_asked():
+    registry = ChapterRegistry()
+    seen = []
+
+    @registry.chapter("1", "One", pass_args=True)
+    async def one(console, args):
+        seen.append(args)
+
+    run_sync(registry.get("1").run(ScriptedConsole([], io.StringIO()), "flags"))
+    assert seen == ["flags"]
+
+
+def test_discovered_scripts_are_imported_only_when_run(tmp_path):
+    (tmp_path / "Python-Book-9-1.py").write_text(SCRIPT, encoding="utf-8")
+    (tmp_path / "notes.py").write_text("raise SystemExit('must not be imported')\n", encoding="utf-8")
+    registry = ChapterRegistry()
+    (entry,) = registry.discover(str(tmp_path), first_key=8)
+    assert (entry.key, entry.title, entry.imports, entry.is_gui) == ("8", "Chapter 9: Echo", ("sys",), False)
+    assert entry._module is None
+
+    output = io.StringIO()
+    console = ScriptedConsole(["hi"], output)
+    run_sync(entry.run(console))
+    console.flush()
+    assert output.getvalue() == "Say something: You said: hi\n"
+
+
+def test_failing_scripts_are_reported_and_the_menu_carries_on(tmp_path):
+    (tmp_path / "Python-Book-9-1.py").write_text('"""Broken"""\n1 / 0\n', encoding="utf-8")
+    (tmp_path / "Python-Book-9-2.py").write_text(
+        '"""Crashes"""\n\ndef main():\n    raise RuntimeError("out of paper")\n', encoding="utf-8")
+    (tmp_path / "Python-Book-9-3.py").write_text(SCRIPT, encoding="utf-8")
+    broken, crashes, echo = ChapterRegistry().discover(str(tmp_path), first_key=8)
+
+    output = io.StringIO()
+    console = ScriptedConsole([], output)
+    run_sync(broken.run(console))
+    run_sync(crashes.run(console))
+    with pytest.raises(EOFError):
+        run_sync(echo.run(console))
+    console.flush()
+    assert output.getvalue().splitlines() == [
+        "Could not start Broken: division by zero",
+        "Crashes stopped with an error: out of paper",
+        "Say something: ",
+    ]
+
+
+def test_read_script_metadata_falls_back_to_the_file_name(tmp_path):
+    path = tmp_path / "Python-Book-9-2.py"
+    path.write_text("import tkinter\nfrom PIL import Image\n", encoding="utf-8")
+    assert read_script_metadata(str(path)) == ("Python-Book-9-2.py", ("PIL", "tkinter"))
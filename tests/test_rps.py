@@ -0,0 +1,48 @@
+"""Tests for the Rock, Paper, Scissors engine in academy.rps."""
+
+import itertools
+import random
+
+import pytest
+
+from academy.rps import _random_moves, play_rps_match, resolve_rps_rounds, rps_outcome, run_rps_tournament
+
+
+def test_resolve_rps_rounds_matches_round_by_round_outcomes():
+    rng = random.Random(3)
+    moves_a, moves_b = _random_moves(rng, 5_000), _random_moves(rng, 5_000)
+    outcomes = [rps_outcome(a, b) for a, b in zip(moves_a, moves_b)]
+    assert resolve_rps_rounds(moves_a, moves_b) == (outcomes.count(1), outcomes.count(2), outcomes.count(0))
+
+
+def test_resolve_rps_rounds_covers_every_pair():
+    pairs = list(itertools.product(range(3), repeat=2))
+    moves_a, moves_b = bytes(a for a, _ in pairs), bytes(b for _, b in pairs)
+    assert resolve_rps_rounds(moves_a, moves_b) == (3, 3, 3)
+    assert resolve_rps_rounds(b"", b"") == (0, 0, 0)
+
+
+def test_random_moves_stay_in_range():
+    assert set(_random_moves(random.Random(1), 100_000)) == {0, 1, 2}
+
+
+@pytest.mark.parametrize("bot", ["frequency", "markov"])
+def test_matches_are_reproducible_and_adaptive_bots_beat_rock(bot):
+    # The first block is played blind; every later round is won.
+    first = play_rps_match(bot, "rock", 3 * 4096, "seed")
+    assert first == play_rps_match(bot, "rock", 3 * 4096, "seed")
+    assert sum(first) == 3 * 4096
+    assert first[0] >= 2 * 4096
+
+
+def test_tournament_is_worker_independent():
+    bots = ["random", "rock", "cycle"]
+    inline = run_rps_tournament(bots, rounds=6_000, workers=1, seed=2, shard_rounds=2_000)
+    assert run_rps_tournament(bots, rounds=6_000, workers=2, seed=2, shard_rounds=2_000) == inline
+    for row in inline:
+        assert row["wins"] + row["losses"] + row["ties"] == 12_000
+
+
+def test_tournament_rejects_unknown_bots():
+    with pytest.raises(ValueError):
+        run_rps_tournament(["rock", "oracle"], rounds=10, workers=1)
@@ -0,0 +1,72 @@
+"""Tests for the classroom server in academy.server."""
+
+import asyncio
+
+import pytest
+
+from academy.server import ChapterServer, parse_address
+
+
+async def _echo_session(console):
+    name = await console.input("Name? ")
+    console.print(f"Hello, {name}!")
+
+
+async def _with_server(server, client):
+    """Runs the server on a free port, awaits client(host, port) and stops the server."""
+    bound = asyncio.get_running_loop().create_future()
+    task = asyncio.create_task(server.serve("127.0.0.1", 0, lambda host, port: bound.set_result((host, port))))
+    try:
+        return await asyncio.wait_for(client(*await bound), 10)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+async def _converse(host, port, *replies):
+    reader, writer = await asyncio.open_connection(host, port)
+    for reply in replies:
+        writer.write(reply)
+    await writer.drain()
+    received = await reader.read()
+    writer.close()
+    return received
+
+
+def test_server_runs_one_session_per_connection():
+    server = ChapterServer(_echo_session)
+
+    async def clients(host, port):
+        return await asyncio.gather(*(_converse(host, port, f"Learner {i}\n".encode()) for i in range(20)))
+
+    received = asyncio.run(_with_server(server, clients))
+    assert received == [f"Name? Hello, Learner {i}!\n".encode() for i in range(20)]
+    assert (server.served, server.failed, server.active) == (20, 0, 0)
+
+
+def test_server_closes_idle_sessions():
+    server = ChapterServer(_echo_session, idle_timeout=0.1)
+    received = asyncio.run(_with_server(server, _converse))
+    assert received.startswith(b"Name? \nSession closed: no reply")
+    assert server.timed_out == 1
+
+
+def test_server_limits_reply_length():
+    server = ChapterServer(_echo_session, max_line=64)
+    received = asyncio.run(_with_server(server, lambda host, port: _converse(host, port, b"x" * 200 + b"\n")))
+    assert b"replies are limited to 64 bytes" in received
+
+
+def test_server_turns_away_connections_beyond_the_limit():
+    server = ChapterServer(_echo_session, max_sessions=0)
+    received = asyncio.run(_with_server(server, _converse))
+    assert received == b"The classroom is full. Please try again later.\n"
+    assert server.rejected == 1
+
+
+def test_parse_address():
+    assert parse_address("8023") == ("127.0.0.1", 8023)
+    assert parse_address("0.0.0.0:80") == ("0.0.0.0", 80)
+    with pytest.raises(ValueError):
+        parse_address("localhost:http")
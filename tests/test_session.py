@@ -0,0 +1,133 @@
+"""Tests for the session checkpoints in academy.session."""
+
+import io
+import mmap
+import os
+import struct
+import zlib
+
+import pytest
+
+from academy.console import ScriptedConsole
+from academy.session import SessionCheckpoint
+
+
+def _text(view):
+    return bytes(view).decode()
+
+
+def test_checkpoint_keeps_sections_across_reopening(tmp_path):
+    path = str(tmp_path / "session.bin")
+    with SessionCheckpoint(path) as checkpoint:
+        assert checkpoint.restore("todo", _text) is None
+        checkpoint.save("todo", b"tasks")
+        checkpoint.save("contacts", b"people" * 2_000)
+        checkpoint.save("todo", b"more tasks")
+    with SessionCheckpoint(path) as checkpoint:
+        assert "todo" in checkpoint and "guess" not in checkpoint
+        assert checkpoint.restore("todo", _text) == "more tasks"
+        assert checkpoint.restore("contacts", _text) == "people" * 2_000
+        checkpoint.save("todo", None)
+        checkpoint.save("guess", None)
+    with SessionCheckpoint(path) as checkpoint:
+        assert "todo" not in checkpoint
+        assert checkpoint.restore("contacts", _text) == "people" * 2_000
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_checkpoint_skips_unchanged_sections(tmp_path):
+    path = tmp_path / "session.bin"
+    with SessionCheckpoint(str(path)) as checkpoint:
+        checkpoint.save("todo", b"tasks")
+        written = path.stat().st_mtime_ns, path.stat().st_ino
+        checkpoint.save("todo", b"tasks")
+        assert (path.stat().st_mtime_ns, path.stat().st_ino) == written
+
+
+def test_checkpoint_sections_start_on_their_own_page(tmp_path):
+    path = tmp_path / "session.bin"
+    with SessionCheckpoint(str(path)) as checkpoint:
+        checkpoint.save("a", b"x")
+        checkpoint.save("b", b"y")
+    data = path.read_bytes()
+    assert len(data) == 2 * mmap.PAGESIZE + 1
+    assert data[mmap.PAGESIZE:mmap.PAGESIZE + 1] == b"x"
+
+
+def test_checkpoint_rejects_damaged_headers_and_other_versions(tmp_path):
+    path = tmp_path / "session.bin"
+    with SessionCheckpoint(str(path)) as checkpoint:
+        checkpoint.save("todo", b"tasks")
+    good = path.read_bytes()
+
+    path.write_bytes(good[:10] + b"\x07" + good[11:])
+    with pytest.raises(ValueError, match="bad header checksum"):
+        SessionCheckpoint(str(path))
+
+    fields = bytearray(good[:20])
+    struct.pack_into("<H", fields, 8, SessionCheckpoint.VERSION + 1)
+    path.write_bytes(bytes(fields) + zlib.crc32(fields).to_bytes(4, "little") + good[24:])
+    with pytest.raises(ValueError, match="format 2"):
+        SessionCheckpoint(str(path))
+
+    path.write_bytes(good[:30] + b"\xff" + good[31:])
+    with pytest.raises(ValueError, match="bad directory"):
+        SessionCheckpoint(str(path))
+
+    path.write_bytes(b"certainly not a checkpoint")
+    with pytest.raises(ValueError, match="not an iD01t session checkpoint"):
+        SessionCheckpoint(str(path))
+
+    path.write_bytes(good[:mmap.PAGESIZE])
+    with pytest.raises(ValueError, match="truncated"):
+        SessionCheckpoint(str(path))
+
+
+def test_damaged_sections_start_the_chapter_over(tmp_path):
+    path = tmp_path / "session.bin"
+    with SessionCheckpoint(str(path)) as checkpoint:
+        checkpoint.save("todo", b"tasks")
+        checkpoint.save("guess", b"game")
+    data = bytearray(path.read_bytes())
+    data[mmap.PAGESIZE] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    output = io.StringIO()
+    console = ScriptedConsole([], output)
+    with SessionCheckpoint(str(path)) as checkpoint:
+        with pytest.raises(ValueError, match="saved todo state"):
+            checkpoint.restore("todo", _text)
+        with checkpoint.chapter_state(console, "todo", _text, str.encode, lambda: "fresh") as state:
+            assert state == "fresh"
+        assert checkpoint.restore("todo", _text) == "fresh"
+        assert checkpoint.restore("guess", _text) == "game"
+    console.flush()
+    assert output.getvalue().endswith("is damaged. Starting over.\n")
+
+
+def test_undecodable_sections_are_reported(tmp_path):
+    def refuse(view):
+        raise ValueError("bad data")
+
+    with SessionCheckpoint(str(tmp_path / "session.bin")) as checkpoint:
+        checkpoint.save("guess", b"game")
+        with pytest.raises(ValueError, match=r"unreadable \(bad data\)"):
+            checkpoint.restore("guess", refuse)
+
+
+def test_chapter_state_saves_when_the_visit_ends_early(tmp_path):
+    path = str(tmp_path / "session.bin")
+    with SessionCheckpoint(path) as checkpoint:
+        with pytest.raises(EOFError):
+            with checkpoint.chapter_state(ScriptedConsole([], io.StringIO()), "todo", _text, str.encode,
+                                          lambda: "fresh") as state:
+                raise EOFError
+    with SessionCheckpoint(path) as checkpoint:
+        assert checkpoint.restore("todo", _text) == state
+
+
+def test_section_names_are_limited_to_sixteen_bytes(tmp_path):
+    with SessionCheckpoint(str(tmp_path / "session.bin")) as checkpoint:
+        checkpoint.save("x" * 16, b"fits")
+        with pytest.raises(ValueError):
+            checkpoint.save("é" * 9, b"too long")
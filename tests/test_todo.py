@@ -0,0 +1,224 @@
+"""Tests for the to-do engine in academy.todo."""
+
+import datetime
+
+import pytest
+
+from academy.todo import (DEFAULT_PRIORITY, DurableTaskScheduler, Task, TaskScheduler, parse_due_date, parse_priority,
+                          parse_tags)
+
+DAY = datetime.date(2026, 3, 1)
+
+
+def _sample() -> TaskScheduler:
+    tasks = TaskScheduler()
+    tasks.add("Later", 3, DAY + datetime.timedelta(days=9), ("home",))
+    tasks.add("Urgent", 1, DAY, ("work", "today"))
+    tasks.add("Relaxed", 5, DAY, ("work",))
+    tasks.add("Someday", 2)
+    return tasks
+
+
+def test_next_task_orders_by_due_date_then_priority():
+    tasks = _sample()
+    assert tasks.next_task().title == "Urgent"
+    tasks.remove(2)
+    assert tasks.next_task().title == "Relaxed"
+    tasks.remove(3)
+    tasks.remove(1)
+    assert tasks.next_task().title == "Someday"
+    tasks.remove(4)
+    assert tasks.next_task() is None
+
+
+def test_ids_are_stable_and_never_reused():
+    tasks = _sample()
+    tasks.remove(4)
+    assert tasks.add("New").task_id == 5
+    assert [task.task_id for task in tasks] == [1, 2, 3, 5]
+    with pytest.raises(KeyError):
+        tasks.remove(4)
+
+
+def test_tag_and_date_range_queries():
+    tasks = _sample()
+    assert [task.title for task in tasks.with_tag("#WORK")] == ["Urgent", "Relaxed"]
+    assert tasks.with_tag("missing") == []
+    assert [task.title for task in tasks.due_between(DAY, DAY)] == ["Urgent", "Relaxed"]
+    assert [task.title for task in tasks.due_between(DAY + datetime.timedelta(days=1), None)] == ["Later"]
+    assert len(tasks.due_between(None, None)) == 3
+    tasks.remove(1)
+    assert tasks.due_between(DAY + datetime.timedelta(days=1), None) == []
+    assert tasks.with_tag("home") == []
+
+
+def test_heap_stays_correct_across_many_removals():
+    tasks = TaskScheduler()
+    for i in range(3_000):
+        tasks.add(f"Task {i}", i % 5 + 1, DAY + datetime.timedelta(days=i % 100))
+    for task_id in range(1, 2_900):
+        tasks.remove(task_id)
+    expected = min(tasks, key=lambda task: (task.due, task.priority, task.task_id))
+    assert tasks.next_task() == expected
+    assert len(tasks._heap) - tasks._stale == len(tasks)
+
+
+def test_add_rejects_bad_priorities():
+    with pytest.raises(ValueError):
+        TaskScheduler().add("Oops", 6)
+
+
+def test_lists_round_trip_through_bytes():
+    tasks = _sample()
+    tasks.remove(3)
+    restored = TaskScheduler.from_bytes(memoryview(tasks.to_bytes()))
+    assert list(restored) == list(tasks)
+    assert restored.next_task() == tasks.next_task()
+    assert _titles(restored.with_tag("work")) == ["Urgent"]
+    assert restored.add("Next").task_id == 5
+    assert len(TaskScheduler.from_bytes(TaskScheduler().to_bytes())) == 0
+
+
+def test_from_bytes_rejects_truncated_or_foreign_data():
+    data = _sample().to_bytes()
+    for damaged in (b"", data[:5], data[:-1], data + b"x", b"\xff" * len(data)):
+        with pytest.raises(ValueError):
+            TaskScheduler.from_bytes(damaged)
+
+
+def test_add_rejects_nul_characters_and_spaces_in_tags():
+    tasks = TaskScheduler()
+    with pytest.raises(ValueError):
+        tasks.add("Bad\0title")
+    with pytest.raises(ValueError):
+        tasks.add("Bad tag", tags=("two words",))
+    assert len(tasks) == 0
+
+
+def test_parsers():
+    assert parse_due_date(" 2026-03-01 ") == DAY
+    assert parse_due_date("") is None
+    for text in ("March 1st", "2026-02-30"):
+        with pytest.raises(ValueError, match="^Dates must be real calendar dates written as YYYY-MM-DD.$"):
+            parse_due_date(text)
+    assert parse_priority(" 2 ") == 2
+    assert parse_priority("") == DEFAULT_PRIORITY
+    for text in ("high", "0", "6", "2.5", "-1"):
+        with pytest.raises(ValueError, match="^Priority must be a number between 1 and 5.$"):
+            parse_priority(text)
+    assert parse_tags("#Work, home work") == ("work", "home")
+
+
+def test_tags_match_whatever_their_case(tmp_path):
+    tasks = TaskScheduler()
+    added = tasks.add("Revise", tags=("Study", "#study", " #Exam "))
+    assert added.tags == ("study", "exam")
+    assert tasks.with_tag("study") == tasks.with_tag("#STUDY") == [added]
+    with DurableTaskScheduler(str(tmp_path / "tasks.log")) as durable:
+        assert durable.add("Revise", tags=("Study", "#Exam")).tags == ("study", "exam")
+    with DurableTaskScheduler(str(tmp_path / "tasks.log")) as reopened:
+        assert _titles(reopened.with_tag("Exam")) == ["Revise"]
+
+
+# -- Write-ahead log ---------------------------------------------------------
+
+def _titles(tasks) -> list[str]:
+    return [task.title for task in tasks]
+
+
+def test_durable_list_replays_its_log(tmp_path):
+    path = str(tmp_path / "tasks.log")
+    with DurableTaskScheduler(path) as tasks:
+        tasks.add("Write", 2, DAY, ("work",))
+        tasks.add("Read")
+        tasks.remove(1)
+        tasks.add("Review", 1, DAY)
+    with DurableTaskScheduler(path) as tasks:
+        assert _titles(tasks) == ["Read", "Review"]
+        assert tasks[3] == Task(3, "Review", 1, DAY)
+        assert tasks.next_task().title == "Review"
+        assert tasks.add("Next").task_id == 4
+
+
+def test_durable_list_discards_a_torn_record(tmp_path):
+    path = tmp_path / "tasks.log"
+    with DurableTaskScheduler(str(path)) as tasks:
+        tasks.add("Kept")
+        tasks.add("Torn")
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    with DurableTaskScheduler(str(path)) as tasks:
+        assert _titles(tasks) == ["Kept"]
+        tasks.add("After")
+    with DurableTaskScheduler(str(path)) as tasks:
+        assert _titles(tasks) == ["Kept", "After"]
+
+
+def test_durable_list_stops_at_a_corrupt_record(tmp_path):
+    path = tmp_path / "tasks.log"
+    with DurableTaskScheduler(str(path)) as tasks:
+        tasks.add("First")
+        tasks.sync()
+        size = path.stat().st_size
+        tasks.add("Second")
+        tasks.add("Third")
+    data = bytearray(path.read_bytes())
+    data[size + 12] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with DurableTaskScheduler(str(path)) as tasks:
+        assert _titles(tasks) == ["First"]
+
+
+def test_durable_list_snapshots_and_restarts_the_log(tmp_path):
+    path = tmp_path / "tasks.log"
+    with DurableTaskScheduler(str(path), snapshot_records=100) as tasks:
+        for i in range(250):
+            tasks.add(f"Task {i}", i % 5 + 1, DAY + datetime.timedelta(days=i % 7), (f"tag{i % 3}",))
+        for task_id in range(1, 51):
+            tasks.remove(task_id)
+        expected = list(tasks)
+        assert path.stat().st_size < 100 * 40
+    assert (tmp_path / "tasks.log.snapshot").exists()
+    with DurableTaskScheduler(str(path)) as tasks:
+        assert list(tasks) == expected
+        assert [task.task_id for task in tasks.with_tag("tag0")][:2] == [52, 55]
+        assert tasks.next_task() == min(expected, key=lambda task: (task.due, task.priority, task.task_id))
+
+
+def test_durable_list_refuses_a_log_without_its_snapshot(tmp_path):
+    path = tmp_path / "tasks.log"
+    with DurableTaskScheduler(str(path)) as tasks:
+        tasks.add("Saved")
+        tasks.snapshot()
+    (tmp_path / "tasks.log.snapshot").unlink()
+    with pytest.raises(ValueError):
+        DurableTaskScheduler(str(path))
+
+
+def test_durable_list_rejects_other_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"certainly not a to-do list")
+    with pytest.raises(ValueError):
+        DurableTaskScheduler(str(path))
+
+
+def test_durable_list_syncs_pending_records(tmp_path):
+    path = tmp_path / "tasks.log"
+    tasks = DurableTaskScheduler(str(path), commit_records=1_000, commit_interval=3_600)
+    size = path.stat().st_size
+    tasks.add("Buffered")
+    assert path.stat().st_size == size
+    tasks.sync()
+    assert path.stat().st_size > size
+    with DurableTaskScheduler(str(path)) as reopened:
+        assert _titles(reopened) == ["Buffered"]
+    tasks.close()
+
+
+def test_durable_list_validates_titles_and_tags(tmp_path):
+    with DurableTaskScheduler(str(tmp_path / "tasks.log")) as tasks:
+        with pytest.raises(ValueError):
+            tasks.add("Bad\0title")
+        with pytest.raises(ValueError):
+            tasks.add("Bad tag", tags=("two words",))
+        assert len(tasks) == 0